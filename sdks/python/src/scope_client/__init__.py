@@ -34,51 +34,155 @@ Environment Variables:
     SCOPE_TOKEN_REFRESH_BUFFER: Seconds before expiry to refresh token (default: 60).
 """
 
+import importlib
+import sys
+import threading
+import types
 from typing import TYPE_CHECKING, Any, Optional
 
-from scope_client._telemetry import (
-    ErrorInfo,
-    OnErrorCallback,
-    OnRequestCallback,
-    OnResponseCallback,
-    RequestInfo,
-    ResponseInfo,
-    Telemetry,
-)
 from scope_client._version import VERSION, __version__
-from scope_client.client import ScopeClient
-from scope_client.configuration import Configuration, ConfigurationManager
-from scope_client.credentials import (
-    ApiKeyCredentials,
-    ClientCredentials,
-    Credentials,
-    CredentialsProtocol,
-)
-from scope_client.errors import (
-    ApiError,
-    AuthenticationError,
-    AuthorizationError,
-    ConfigurationError,
-    ConflictError,
-    ConnectionError,
-    InvalidCredentialsError,
-    MissingApiKeyError,
-    MissingVariableError,
-    NoProductionVersionError,
-    NotFoundError,
-    RateLimitError,
-    RenderError,
-    ResourceError,
-    ScopeError,
-    ServerError,
-    TimeoutError,
-    TokenRefreshError,
-    ValidationError,
-)
-from scope_client.resources import PromptVersion, Resource
 
 if TYPE_CHECKING:
-    pass
+    from scope_client._telemetry import (
+        ErrorInfo,
+        OnErrorCallback,
+        OnRequestCallback,
+        OnResponseCallback,
+        RequestInfo,
+        ResponseInfo,
+        Telemetry,
+        TelemetryHooks,
+    )
+    from scope_client.async_client import AsyncScopeClient
+    from scope_client.client import ScopeClient, _SharedScopeClient
+    from scope_client.configuration import Configuration
+    from scope_client.credentials import (
+        ApiKeyCredentials,
+        ClientCredentials,
+        Credentials,
+        CredentialsProtocol,
+    )
+    from scope_client.errors import (
+        ApiError,
+        AuthenticationError,
+        AuthorizationError,
+        ConfigurationError,
+        ConflictError,
+        ConnectionError,
+        InvalidCredentialsError,
+        MissingApiKeyError,
+        MissingVariableError,
+        NoProductionVersionError,
+        NotFoundError,
+        RateLimitError,
+        RenderError,
+        ResourceError,
+        ScopeError,
+        ServerError,
+        TimeoutError,
+        TokenRefreshError,
+        ValidationError,
+    )
+    from scope_client.resources import PromptVersion, Resource
+
+# Public names resolved on first access (PEP 562) so that importing the
+# package does not pull in httpx and the client machinery until needed.
+_LAZY: dict[str, str] = {
+    # Main classes
+    "ScopeClient": "scope_client.client",
+    "AsyncScopeClient": "scope_client.async_client",
+    "Configuration": "scope_client.configuration",
+    "ConfigurationManager": "scope_client.configuration",
+    # Credentials
+    "ClientCredentials": "scope_client.credentials",
+    "ApiKeyCredentials": "scope_client.credentials",
+    "Credentials": "scope_client.credentials",
+    "CredentialsProtocol": "scope_client.credentials",
+    # Resources
+    "Resource": "scope_client.resources",
+    "PromptVersion": "scope_client.resources",
+    # Errors
+    "ScopeError": "scope_client.errors",
+    "ConfigurationError": "scope_client.errors",
+    "MissingApiKeyError": "scope_client.errors",
+    "ApiError": "scope_client.errors",
+    "AuthenticationError": "scope_client.errors",
+    "AuthorizationError": "scope_client.errors",
+    "TokenRefreshError": "scope_client.errors",
+    "InvalidCredentialsError": "scope_client.errors",
+    "NotFoundError": "scope_client.errors",
+    "ConflictError": "scope_client.errors",
+    "RateLimitError": "scope_client.errors",
+    "ServerError": "scope_client.errors",
+    "ConnectionError": "scope_client.errors",
+    "TimeoutError": "scope_client.errors",
+    "ResourceError": "scope_client.errors",
+    "ValidationError": "scope_client.errors",
+    "RenderError": "scope_client.errors",
+    "MissingVariableError": "scope_client.errors",
+    "NoProductionVersionError": "scope_client.errors",
+    # Telemetry
+    "Telemetry": "scope_client._telemetry",
+    "TelemetryHooks": "scope_client._telemetry",
+    "RequestInfo": "scope_client._telemetry",
+    "ResponseInfo": "scope_client._telemetry",
+    "ErrorInfo": "scope_client._telemetry",
+    "OnRequestCallback": "scope_client._telemetry",
+    "OnResponseCallback": "scope_client._telemetry",
+    "OnErrorCallback": "scope_client._telemetry",
+}
+
+
+# Module-level functions that share their name with a submodule
+_SHADOWED_SUBMODULES = frozenset({"client", "async_client", "configuration"})
+
+
+class _PackageModule(types.ModuleType):
+    """Package module type that keeps functions from being shadowed.
+
+    Importing a submodule binds it as an attribute of the package. Since the
+    ``client``, ``async_client`` and ``configuration`` submodules are imported
+    lazily, that binding would replace the ``client()``, ``async_client()``
+    and ``configuration()`` functions.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SHADOWED_SUBMODULES and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _PackageModule
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily exported names on first access.
+
+    Args:
+        name: Attribute name being looked up on the package.
+
+    Returns:
+        The exported object, which is then cached in the module namespace.
+
+    Raises:
+        AttributeError: If the name is not a known export.
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including exports that are not loaded yet.
+
+    Returns:
+        Sorted attribute names, so ``dir()`` and tab completion see every export.
+    """
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Version
@@ -86,6 +190,7 @@ __all__ = [
     "VERSION",
     # Main classes
     "ScopeClient",
+    "AsyncScopeClient",
     "Configuration",
     # Credentials
     "ClientCredentials",
@@ -117,6 +222,7 @@ __all__ = [
     "NoProductionVersionError",
     # Telemetry
     "Telemetry",
+    "TelemetryHooks",
     "RequestInfo",
     "ResponseInfo",
     "ErrorInfo",
@@ -126,15 +232,22 @@ __all__ = [
     # Module-level functions
     "configure",
     "client",
+    "async_client",
     "configuration",
     "reset_configuration",
 ]
 
 
+# Client shared by argument-less client() calls, with the global
+# configuration it was created for
+_shared_client: Optional[tuple["Configuration", "_SharedScopeClient"]] = None
+_shared_client_lock = threading.Lock()
+
+
 def configure(
     credentials: Optional["Credentials"] = None,
     **options: Any,
-) -> Configuration:
+) -> "Configuration":
     """Configure the global Scope client settings.
 
     Sets up the global configuration that will be used by clients
@@ -149,10 +262,16 @@ def configure(
             open_timeout: Connection timeout in seconds.
             cache_enabled: Whether to enable caching.
             cache_ttl: Cache TTL in seconds.
+            negative_cache_ttl: Seconds to remember prompts that were not found.
+            cache_backend: "memory", "disk" or "hybrid".
+            cache_dir: Directory for the disk cache.
+            http2: Whether to use HTTP/2 (requires the http2 extra).
             max_retries: Maximum retry attempts.
             retry_base_delay: Base delay between retries.
             retry_max_delay: Maximum delay between retries.
             telemetry_enabled: Whether to enable telemetry.
+            telemetry_background: Whether to run telemetry callbacks on a
+                background thread.
             environment: Environment name.
 
     Returns:
@@ -176,6 +295,8 @@ def configure(
         ...     cache_ttl=600
         ... )
     """
+    from scope_client.configuration import ConfigurationManager
+
     if credentials is not None:
         options["credentials"] = credentials
     return ConfigurationManager.configure(**options)
@@ -183,13 +304,17 @@ def configure(
 
 def client(
     credentials: Optional["Credentials"] = None,
-    config: Optional[Configuration] = None,
+    config: Optional["Configuration"] = None,
     **options: Any,
-) -> ScopeClient:
-    """Create a new ScopeClient instance.
+) -> "ScopeClient":
+    """Get a ScopeClient.
 
     Creates a client using the provided configuration, the global
-    configuration, or a combination of both.
+    configuration, or a combination of both. Calls without arguments
+    return one shared client (and its connection pool) for as long as
+    the global configuration stays the same. Closing the shared client
+    has no effect; once the global configuration changes, the next call
+    closes it and returns a new shared client.
 
     Args:
         credentials: Optional Credentials instance for authentication.
@@ -197,7 +322,8 @@ def client(
         **options: Configuration options to merge with the base config.
 
     Returns:
-        A new ScopeClient instance.
+        The shared ScopeClient when called without arguments, otherwise
+        a new ScopeClient instance.
 
     Example:
         >>> import scope_client
@@ -210,14 +336,65 @@ def client(
         >>> # Using global configuration
         >>> scope_client.configure(credentials=ClientCredentials.from_env())
         >>> client = scope_client.client()
+        >>> client is scope_client.client()
+        True
         >>>
         >>> # Or with per-client options
         >>> client = scope_client.client(cache_enabled=False)
     """
+    from scope_client.client import ScopeClient
+
+    if credentials is None and config is None and not options:
+        from scope_client.client import _SharedScopeClient
+        from scope_client.configuration import ConfigurationManager
+
+        global _shared_client
+        global_config = ConfigurationManager.get()
+        with _shared_client_lock:
+            shared = _shared_client
+            if shared is not None and shared[0] is global_config:
+                return shared[1]
+            new_client = _SharedScopeClient(config=global_config)
+            _shared_client = (global_config, new_client)
+        # Release the replaced client's connection pool
+        if shared is not None:
+            shared[1]._close_shared()
+        return new_client
+
     return ScopeClient(credentials=credentials, config=config, **options)
 
 
-def configuration() -> Configuration:
+def async_client(
+    credentials: Optional["Credentials"] = None,
+    config: Optional["Configuration"] = None,
+    **options: Any,
+) -> "AsyncScopeClient":
+    """Create a new AsyncScopeClient instance.
+
+    Like client(), but for use with asyncio. A new client is returned on
+    every call, since its connection pool belongs to the event loop it is
+    used in; close it with ``aclose()`` or ``async with``.
+
+    Args:
+        credentials: Optional Credentials instance for authentication.
+        config: Optional Configuration instance to use.
+        **options: Configuration options to merge with the base config.
+
+    Returns:
+        A new AsyncScopeClient instance.
+
+    Example:
+        >>> import scope_client
+        >>> scope_client.configure(credentials=ClientCredentials.from_env())
+        >>> async with scope_client.async_client() as client:
+        ...     versions = await client.get_prompt_versions(["greeting", "farewell"])
+    """
+    from scope_client.async_client import AsyncScopeClient
+
+    return AsyncScopeClient(credentials=credentials, config=config, **options)
+
+
+def configuration() -> "Configuration":
     """Get the current global configuration.
 
     Returns:
@@ -231,6 +408,8 @@ def configuration() -> Configuration:
         >>> print(config.base_url)
         'https://api.scope.io'
     """
+    from scope_client.configuration import ConfigurationManager
+
     return ConfigurationManager.get()
 
 
@@ -239,7 +418,7 @@ def reset_configuration() -> None:
 
     Clears any custom configuration and resets to default values.
     Environment variables will still be loaded when a new configuration
-    is created.
+    is created, and credentials memoized by ``from_env()`` are discarded.
 
     Example:
         >>> import scope_client
@@ -249,4 +428,8 @@ def reset_configuration() -> None:
         >>> config = scope_client.configuration()
         >>> print(config.credentials)  # Will be None
     """
+    from scope_client.configuration import ConfigurationManager
+    from scope_client.credentials import clear_from_env_cache
+
     ConfigurationManager.reset()
+    clear_from_env_cache()
@@ -0,0 +1,16 @@
+"""JSON decoding for scope-client.
+
+orjson is used when installed (scope-client[orjson]), and the standard
+library json module otherwise.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+loads: Callable[[Union[bytes, str]], Any]
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    loads = json.loads
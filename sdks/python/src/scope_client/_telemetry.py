@@ -4,14 +4,31 @@ This module provides hooks for observing HTTP requests and responses
 made by the SDK. Useful for logging, metrics, and debugging.
 """
 
-import contextlib
+import itertools
+import os
+import queue
+import secrets
+import sys
 import threading
 import uuid
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
+# Header names (lowercase) whose values are hidden from telemetry
+SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "api-key"})
 
-@dataclass
+# Most events waiting for background delivery; further events are dropped
+BACKGROUND_QUEUE_SIZE = 1000
+
+# Event objects are created for every request, so drop their per-instance
+# __dict__ where dataclasses support it (Python 3.10+). They are not frozen:
+# frozen dataclasses assign fields through object.__setattr__, which roughly
+# doubles construction time, and a NamedTuple is no faster to build and larger.
+_DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RequestInfo:
     """Information about an outgoing HTTP request.
 
@@ -19,37 +36,39 @@ class RequestInfo:
         request_id: Unique identifier for this request.
         method: HTTP method (GET, POST, etc.).
         url: Full URL of the request.
-        headers: Request headers (authorization header is redacted).
+        headers: Request headers (authorization header is redacted), as a
+            read-only mapping shared by the requests of a client.
         body: Request body if applicable.
     """
 
     request_id: str
     method: str
     url: str
-    headers: dict[str, str]
+    headers: Mapping[str, str]
     body: Optional[Any] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ResponseInfo:
     """Information about an HTTP response.
 
     Attributes:
         request_id: Unique identifier matching the request.
         status_code: HTTP status code.
-        headers: Response headers.
+        headers: Response headers, as the case-insensitive mapping of the
+            response itself (not a copy); callbacks must not modify them.
         body: Parsed response body.
         elapsed_ms: Request duration in milliseconds.
     """
 
     request_id: str
     status_code: int
-    headers: dict[str, str]
+    headers: Mapping[str, str]
     body: Optional[Any] = None
     elapsed_ms: float = 0.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ErrorInfo:
     """Information about a request error.
 
@@ -74,8 +93,9 @@ class Telemetry:
     """Global telemetry manager for request/response hooks.
 
     This class provides a centralized way to register callbacks that are
-    invoked on HTTP requests, responses, and errors. Useful for logging,
-    metrics collection, and debugging.
+    invoked on HTTP requests, responses, and errors of every client. Useful
+    for logging, metrics collection, and debugging. Callbacks for a single
+    client can be registered on its ``telemetry`` hooks instead.
 
     Example:
         >>> def log_request(info: RequestInfo):
@@ -89,10 +109,14 @@ class Telemetry:
         >>> Telemetry.on_response(log_response)
     """
 
+    # Callbacks are kept in tuples that are replaced, never mutated, under the
+    # lock. Emitting can then iterate the current tuple without locking or
+    # copying, and the HTTP layer checks it for emptiness to skip building
+    # event objects when nobody is listening.
     _lock: threading.Lock = threading.Lock()
-    _request_callbacks: list[OnRequestCallback] = []
-    _response_callbacks: list[OnResponseCallback] = []
-    _error_callbacks: list[OnErrorCallback] = []
+    _request_callbacks: tuple[OnRequestCallback, ...] = ()
+    _response_callbacks: tuple[OnResponseCallback, ...] = ()
+    _error_callbacks: tuple[OnErrorCallback, ...] = ()
 
     @classmethod
     def on_request(cls, callback: OnRequestCallback) -> None:
@@ -102,7 +126,7 @@ class Telemetry:
             callback: Function to call with RequestInfo on each request.
         """
         with cls._lock:
-            cls._request_callbacks.append(callback)
+            cls._request_callbacks = (*cls._request_callbacks, callback)
 
     @classmethod
     def on_response(cls, callback: OnResponseCallback) -> None:
@@ -112,7 +136,7 @@ class Telemetry:
             callback: Function to call with ResponseInfo on each response.
         """
         with cls._lock:
-            cls._response_callbacks.append(callback)
+            cls._response_callbacks = (*cls._response_callbacks, callback)
 
     @classmethod
     def on_error(cls, callback: OnErrorCallback) -> None:
@@ -122,15 +146,15 @@ class Telemetry:
             callback: Function to call with ErrorInfo on errors.
         """
         with cls._lock:
-            cls._error_callbacks.append(callback)
+            cls._error_callbacks = (*cls._error_callbacks, callback)
 
     @classmethod
     def clear_callbacks(cls) -> None:
         """Remove all registered callbacks."""
         with cls._lock:
-            cls._request_callbacks.clear()
-            cls._response_callbacks.clear()
-            cls._error_callbacks.clear()
+            cls._request_callbacks = ()
+            cls._response_callbacks = ()
+            cls._error_callbacks = ()
 
     @classmethod
     def emit_request(cls, info: RequestInfo) -> None:
@@ -139,12 +163,7 @@ class Telemetry:
         Args:
             info: Request information.
         """
-        with cls._lock:
-            callbacks = cls._request_callbacks.copy()
-
-        for callback in callbacks:
-            with contextlib.suppress(Exception):
-                callback(info)
+        _dispatch(cls._request_callbacks, info)
 
     @classmethod
     def emit_response(cls, info: ResponseInfo) -> None:
@@ -153,12 +172,7 @@ class Telemetry:
         Args:
             info: Response information.
         """
-        with cls._lock:
-            callbacks = cls._response_callbacks.copy()
-
-        for callback in callbacks:
-            with contextlib.suppress(Exception):
-                callback(info)
+        _dispatch(cls._response_callbacks, info)
 
     @classmethod
     def emit_error(cls, info: ErrorInfo) -> None:
@@ -167,12 +181,7 @@ class Telemetry:
         Args:
             info: Error information.
         """
-        with cls._lock:
-            callbacks = cls._error_callbacks.copy()
-
-        for callback in callbacks:
-            with contextlib.suppress(Exception):
-                callback(info)
+        _dispatch(cls._error_callbacks, info)
 
     @classmethod
     def has_callbacks(cls) -> bool:
@@ -181,17 +190,252 @@ class Telemetry:
         Returns:
             True if any callbacks are registered, False otherwise.
         """
-        with cls._lock:
-            return bool(cls._request_callbacks or cls._response_callbacks or cls._error_callbacks)
+        return bool(cls._request_callbacks or cls._response_callbacks or cls._error_callbacks)
+
+    @classmethod
+    def flush(cls) -> None:
+        """Wait until events queued for background delivery have been emitted.
+
+        Only clients configured with ``telemetry_background=True`` queue
+        events; for the others, callbacks have already run when a request
+        returns.
+        """
+        _background.flush()
+
+
+class TelemetryHooks:
+    """Telemetry callbacks for a single client.
+
+    Each ScopeClient has its own hooks, available as ``client.telemetry``.
+    They receive only that client's events, in addition to the callbacks
+    registered globally on Telemetry.
+
+    Example:
+        >>> client = ScopeClient(credentials=credentials)
+        >>> client.telemetry.on_response(lambda info: print(info.status_code))
+    """
+
+    def __init__(self) -> None:
+        # Same scheme as Telemetry: tuples replaced under the lock, read without it
+        self._lock = threading.Lock()
+        self._request_callbacks: tuple[OnRequestCallback, ...] = ()
+        self._response_callbacks: tuple[OnResponseCallback, ...] = ()
+        self._error_callbacks: tuple[OnErrorCallback, ...] = ()
+
+    def on_request(self, callback: OnRequestCallback) -> None:
+        """Register a callback for request events.
+
+        Args:
+            callback: Function to call with RequestInfo on each request.
+        """
+        with self._lock:
+            self._request_callbacks = (*self._request_callbacks, callback)
+
+    def on_response(self, callback: OnResponseCallback) -> None:
+        """Register a callback for response events.
+
+        Args:
+            callback: Function to call with ResponseInfo on each response.
+        """
+        with self._lock:
+            self._response_callbacks = (*self._response_callbacks, callback)
+
+    def on_error(self, callback: OnErrorCallback) -> None:
+        """Register a callback for error events.
+
+        Args:
+            callback: Function to call with ErrorInfo on errors.
+        """
+        with self._lock:
+            self._error_callbacks = (*self._error_callbacks, callback)
+
+    def clear_callbacks(self) -> None:
+        """Remove all registered callbacks."""
+        with self._lock:
+            self._request_callbacks = ()
+            self._response_callbacks = ()
+            self._error_callbacks = ()
+
+    def emit_request(self, info: RequestInfo) -> None:
+        """Emit a request event to all registered callbacks.
+
+        Args:
+            info: Request information.
+        """
+        _dispatch(self._request_callbacks, info)
+
+    def emit_response(self, info: ResponseInfo) -> None:
+        """Emit a response event to all registered callbacks.
 
+        Args:
+            info: Response information.
+        """
+        _dispatch(self._response_callbacks, info)
+
+    def emit_error(self, info: ErrorInfo) -> None:
+        """Emit an error event to all registered callbacks.
+
+        Args:
+            info: Error information.
+        """
+        _dispatch(self._error_callbacks, info)
+
+    def has_callbacks(self) -> bool:
+        """Check if any callbacks are registered.
+
+        Returns:
+            True if any callbacks are registered, False otherwise.
+        """
+        return bool(self._request_callbacks or self._response_callbacks or self._error_callbacks)
+
+
+def _dispatch(callbacks: tuple[Callable[[Any], None], ...], info: Any) -> None:
+    """Call each callback with an event, ignoring callback errors.
+
+    Args:
+        callbacks: Registered callbacks for the event type.
+        info: The event object.
+    """
+    # Callback errors are ignored with plain try/except rather than
+    # contextlib.suppress, which would build a context manager per call.
+    # Most applications register a single sink, so call it without a loop.
+    if len(callbacks) == 1:
+        try:  # noqa: SIM105
+            callbacks[0](info)
+        except Exception:
+            pass
+        return
+
+    for callback in callbacks:
+        try:  # noqa: SIM105
+            callback(info)
+        except Exception:
+            pass
+
+
+class _BackgroundDispatcher:
+    """Emits telemetry events on a daemon thread instead of the caller's.
+
+    Events are queued with the emit functions to call. The thread is started
+    on the first event. When the queue is full, events are dropped rather
+    than slowing requests down.
+
+    Args:
+        maxsize: Most events waiting to be emitted.
+    """
+
+    def __init__(self, maxsize: int = BACKGROUND_QUEUE_SIZE) -> None:
+        self._queue: queue.Queue[tuple[Any, tuple[Callable[[Any], None], ...]]] = queue.Queue(
+            maxsize
+        )
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.dropped = 0
+
+    def submit(self, info: Any, emitters: tuple[Callable[[Any], None], ...]) -> None:
+        """Queue an event for the background thread.
 
-def generate_request_id() -> str:
+        Args:
+            info: The event object.
+            emitters: Functions to call with the event, in order.
+        """
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait((info, emitters))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Wait until every queued event has been emitted."""
+        self._queue.join()
+
+    def _start(self) -> None:
+        """Start the background thread unless it is running."""
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name="scope-client-telemetry", daemon=True
+                )
+                thread.start()
+                self._thread = thread
+
+    def _run(self) -> None:
+        """Emit queued events until the process exits."""
+        while True:
+            info, emitters = self._queue.get()
+            try:
+                for emit in emitters:
+                    emit(info)
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
+
+_background = _BackgroundDispatcher()
+
+
+def emit_in_background(info: Any, emitters: tuple[Callable[[Any], None], ...]) -> None:
+    """Emit a telemetry event from the background thread.
+
+    Args:
+        info: The event object.
+        emitters: Functions to call with the event, e.g. Telemetry.emit_request.
+    """
+    _background.submit(info, emitters)
+
+
+def _reset_background() -> None:
+    """Start with an empty queue (run in forked child processes).
+
+    The parent's thread does not exist in the child, and a lock it held
+    would stay locked.
+    """
+    global _background
+    _background = _BackgroundDispatcher()
+
+
+def _new_request_id_prefix() -> str:
+    """Build the per-process part of request IDs.
+
+    Returns:
+        The process ID and a random token, as hex.
+    """
+    return f"{os.getpid():x}-{secrets.token_hex(4)}-"
+
+
+# Request IDs only need to be unique for correlation, not unpredictable, so
+# they are a per-process prefix plus a counter instead of a random UUID
+_request_id_prefix = _new_request_id_prefix()
+_request_id_counter = itertools.count(1).__next__
+
+
+def _reset_request_ids() -> None:
+    """Start a new request ID sequence (run in forked child processes)."""
+    global _request_id_prefix, _request_id_counter
+    _request_id_prefix = _new_request_id_prefix()
+    _request_id_counter = itertools.count(1).__next__
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_ids)
+    os.register_at_fork(after_in_child=_reset_background)
+
+
+def generate_request_id(strict_uuid: bool = False) -> str:
     """Generate a unique request ID.
 
+    Args:
+        strict_uuid: Return a random UUID4 string instead of the default
+            process-prefixed counter.
+
     Returns:
-        A UUID string for request tracking.
+        A string for request tracking, e.g. "3f2a-9c1e04b7-1a".
     """
-    return str(uuid.uuid4())
+    if strict_uuid:
+        return str(uuid.uuid4())
+    return _request_id_prefix + format(_request_id_counter(), "x")
 
 
 def redact_headers(headers: dict[str, str]) -> dict[str, str]:
@@ -201,19 +445,19 @@ def redact_headers(headers: dict[str, str]) -> dict[str, str]:
         headers: Original headers dictionary.
 
     Returns:
-        Headers with sensitive values redacted.
+        Headers with sensitive values redacted. When no header needs
+        redacting, the given dictionary is returned as is.
     """
-    sensitive_keys = {"authorization", "x-api-key", "api-key"}
-    redacted = {}
-
-    for key, value in headers.items():
-        if key.lower() in sensitive_keys:
-            # Show the type of auth but not the actual value
-            if value.lower().startswith("bearer "):
-                redacted[key] = "Bearer [REDACTED]"
-            else:
-                redacted[key] = "[REDACTED]"
+    if SENSITIVE_HEADERS.isdisjoint(map(str.lower, headers)):
+        return headers
+
+    sensitive = [key for key in headers if key.lower() in SENSITIVE_HEADERS]
+    redacted = dict(headers)
+    for key in sensitive:
+        # Show the type of auth but not the actual value
+        if headers[key][:7].lower() == "bearer ":
+            redacted[key] = "Bearer [REDACTED]"
         else:
-            redacted[key] = value
+            redacted[key] = "[REDACTED]"
 
     return redacted
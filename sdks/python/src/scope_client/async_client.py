@@ -0,0 +1,355 @@
+"""Asynchronous ScopeClient.
+
+This module provides AsyncScopeClient, the asyncio counterpart of
+ScopeClient. It shares configuration, caching and template rendering with
+the synchronous client and makes its requests with httpx.AsyncClient.
+"""
+
+import asyncio
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+from scope_client.cache import CacheEntry
+from scope_client.client import LABEL_PRODUCTION, BaseClient
+from scope_client.configuration import Configuration
+from scope_client.connection import AsyncConnection
+from scope_client.errors import NotFoundError
+from scope_client.resources.prompt_version import PromptVersion
+
+if TYPE_CHECKING:
+    from scope_client.credentials import Credentials
+
+
+class AsyncScopeClient(BaseClient):
+    """Asynchronous client for the Scope Prompt Management API.
+
+    Offers the same methods as ScopeClient as coroutines. Requests from one
+    client share a connection pool, so fetching several prompts with
+    asyncio.gather overlaps their network latency. With the disk or hybrid
+    cache backend, disk cache reads and writes run in worker threads
+    (asyncio.to_thread) so they do not block the event loop.
+
+    Args:
+        credentials: Optional Credentials instance for authentication.
+        config: Optional Configuration instance. If not provided,
+            uses the global configuration.
+        base_url: Optional base URL override for the API.
+        **options: Configuration options to merge with the base config.
+
+    Example:
+        >>> async with AsyncScopeClient(credentials=credentials) as client:
+        ...     version = await client.get_prompt_version("my-prompt")
+        ...     rendered = version.render(name="Alice")
+    """
+
+    __slots__ = ("_connection", "_inflight")
+
+    def __init__(
+        self,
+        credentials: Optional["Credentials"] = None,
+        config: Optional[Configuration] = None,
+        base_url: Optional[str] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(credentials=credentials, config=config, base_url=base_url, **options)
+        self._connection = AsyncConnection(self._config, self._telemetry)
+        # Requests in flight by cache key, so concurrent misses share one request
+        self._inflight: dict[str, asyncio.Task[PromptVersion]] = {}
+
+    async def get_prompt_version(
+        self,
+        name: str,
+        *,
+        label: Optional[str] = None,
+        version: Optional[str] = None,
+        **options: Any,
+    ) -> PromptVersion:
+        """Fetch a prompt version by name.
+
+        Concurrent calls that miss the cache for the same prompt version share
+        a single request, unless caching is disabled or they pass cache=False.
+
+        Args:
+            name: The name or ID of the prompt.
+            label: Label to fetch - "production" (default), "latest".
+            version: Specific version ID (overrides label).
+            **options: Request options.
+                cache: Whether to use cache (default: True if cache enabled).
+                cache_ttl: Custom TTL for this request in seconds.
+
+        Returns:
+            PromptVersion: The matching prompt version.
+
+        Raises:
+            NoProductionVersionError: If label="production" and none exists.
+            NotFoundError: If prompt or version not found.
+            AuthenticationError: If authentication fails.
+            ApiError: On other API errors.
+
+        Example:
+            >>> prompt = await client.get_prompt_version("greeting")
+            >>> prompt = await client.get_prompt_version("greeting", label="latest")
+        """
+        cache_key, endpoint = self._resolve_prompt_version_path(name, label, version)
+        if not self._caching or not options.get("cache", True):
+            return await self._fetch_prompt_version(cache_key, endpoint, None, name, label, options)
+
+        # Only the in-memory cache is read here; the disk cache is read by the
+        # shared flight below, off the event loop
+        entry = self._cache.get_entry(cache_key) if self._cache is not None else None
+        if entry is not None and not entry.is_expired():
+            cached: PromptVersion = entry.value
+            return cached
+        self._raise_if_not_found(cache_key, options)
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._load_prompt_version(cache_key, endpoint, entry, name, label, options)
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._forget_flight(cache_key, done))
+
+        # Shield the shared request, so a cancelled caller does not cancel it
+        # for the others
+        return await asyncio.shield(task)
+
+    async def _load_prompt_version(
+        self,
+        cache_key: str,
+        endpoint: str,
+        entry: Optional[CacheEntry],
+        name: str,
+        label: Optional[str],
+        options: dict[str, Any],
+    ) -> PromptVersion:
+        """Read a prompt version from the disk cache, or request it.
+
+        Args:
+            cache_key: Cache key of the prompt version.
+            endpoint: API endpoint of the prompt version.
+            entry: Stale in-memory cache entry, if any.
+            name: The name or ID of the prompt.
+            label: Requested label.
+            options: Request options (cache, cache_ttl).
+
+        Returns:
+            The cached, fetched or revalidated PromptVersion.
+        """
+        if self._disk_cache is not None:
+            # Disk cache reads block on SQLite and file I/O, so they run in a
+            # worker thread instead of on the event loop
+            entry = await asyncio.to_thread(self._get_cache_entry, cache_key)
+            if entry is not None and not entry.is_expired():
+                cached: PromptVersion = entry.value
+                return cached
+        return await self._fetch_prompt_version(cache_key, endpoint, entry, name, label, options)
+
+    async def _fetch_prompt_version(
+        self,
+        cache_key: str,
+        endpoint: str,
+        entry: Optional[CacheEntry],
+        name: str,
+        label: Optional[str],
+        options: dict[str, Any],
+    ) -> PromptVersion:
+        """Request a prompt version, revalidating a stale entry if given.
+
+        Args:
+            cache_key: Cache key of the prompt version.
+            endpoint: API endpoint of the prompt version.
+            entry: Stale cache entry to revalidate, if any.
+            name: The name or ID of the prompt.
+            label: Requested label.
+            options: Request options (cache, cache_ttl).
+
+        Returns:
+            The fetched (or revalidated) PromptVersion.
+        """
+        try:
+            response = await self._connection.get_conditional(
+                endpoint,
+                etag=entry.etag if entry is not None else None,
+                last_modified=entry.last_modified if entry is not None else None,
+            )
+        except NotFoundError as e:
+            raise self._not_found_error(cache_key, name, label, e, options) from None
+
+        if self._disk_cache is not None:
+            # Storing the version writes to the disk cache as well
+            return await asyncio.to_thread(
+                self._prompt_version_from_response, cache_key, entry, response, options
+            )
+        return self._prompt_version_from_response(cache_key, entry, response, options)
+
+    def _get_cached_in_memory(
+        self,
+        name: str,
+        label: Optional[str],
+        options: dict[str, Any],
+    ) -> Optional[PromptVersion]:
+        """Return a fresh prompt version from the in-memory cache, if any.
+
+        Unlike ScopeClient, the fast paths of this client never touch the
+        disk cache, whose reads block; get_prompt_version() reads it in a
+        worker thread.
+
+        Args:
+            name: The name or ID of the prompt.
+            label: Label to look up.
+            options: Request options; a false ``cache`` option skips the lookup.
+
+        Returns:
+            The cached PromptVersion, or None on a miss.
+        """
+        if self._cache is None or not options.get("cache", True):
+            return None
+        cache_key, _ = self._resolve_prompt_version_path(name, label, None)
+        entry = self._cache.get_entry(cache_key)
+        if entry is None or entry.is_expired():
+            return None
+        cached: PromptVersion = entry.value
+        return cached
+
+    def _forget_flight(self, cache_key: str, task: asyncio.Task[PromptVersion]) -> None:
+        """Remove a finished request from the in-flight map.
+
+        Args:
+            cache_key: Cache key the request was registered under.
+            task: The finished request.
+        """
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        # Mark the error as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def get_prompt_versions(
+        self,
+        names: Sequence[str],
+        *,
+        label: Optional[str] = None,
+        **options: Any,
+    ) -> dict[str, PromptVersion]:
+        """Fetch prompt versions for several prompts concurrently.
+
+        Cached versions are returned directly; the remaining prompts are
+        fetched together with asyncio.gather. Prompts that another task is
+        already fetching are awaited, not fetched again, so overlapping
+        batches share requests.
+
+        Args:
+            names: Names or IDs of the prompts. Duplicates are fetched once.
+            label: Label to fetch - "production" (default), "latest".
+            **options: Request options, as for get_prompt_version().
+
+        Returns:
+            Dictionary mapping each name to its PromptVersion, in input order.
+
+        Raises:
+            NoProductionVersionError: If label="production" and a prompt has none.
+            NotFoundError: If a prompt is not found.
+            ApiError: On other API errors.
+
+        Example:
+            >>> versions = await client.get_prompt_versions(["greeting", "farewell"])
+        """
+        results: dict[str, Optional[PromptVersion]] = {}
+        for name in dict.fromkeys(names):
+            results[name] = self._get_cached_in_memory(name, label, options)
+
+        misses = [name for name, version in results.items() if version is None]
+        fetched = await asyncio.gather(
+            *(self.get_prompt_version(name, label=label, **options) for name in misses)
+        )
+        results.update(zip(misses, fetched))
+
+        return {name: version for name, version in results.items() if version is not None}
+
+    async def render_prompt(
+        self,
+        name: str,
+        variables: dict[str, str],
+        label: str = LABEL_PRODUCTION,
+        **options: Any,
+    ) -> str:
+        """Fetch a prompt version and render it with variables.
+
+        Args:
+            name: The name or ID of the prompt.
+            variables: Dictionary of variable names to values.
+            label: Label to use - "production" (default) or "latest".
+            **options: Request options passed to the fetch method.
+
+        Returns:
+            Rendered prompt string.
+
+        Raises:
+            NoProductionVersionError: If label="production" and none exists.
+            NotFoundError: If prompt or version not found.
+            MissingVariableError: If required variables are missing.
+            ValidationError: If unknown variables are provided.
+            ApiError: On API errors.
+
+        Example:
+            >>> rendered = await client.render_prompt("greeting", {"name": "Alice"})
+        """
+        cached = self._get_cached_in_memory(name, label, options)
+        if cached is not None:
+            return cached.render(**variables)
+
+        prompt_version = await self.get_prompt_version(name, label=label, **options)
+        return prompt_version.render(**variables)
+
+    async def render_many(
+        self,
+        name: str,
+        variables_list: Iterable[Mapping[str, Any]],
+        label: str = LABEL_PRODUCTION,
+        **options: Any,
+    ) -> list[str]:
+        """Fetch a prompt version once and render it for many sets of variables.
+
+        Args:
+            name: The name or ID of the prompt.
+            variables_list: Mappings of variable names to values.
+            label: Label to use - "production" (default) or "latest".
+            **options: Request options passed to the fetch method.
+
+        Returns:
+            Rendered prompt strings, in the same order as variables_list.
+
+        Raises:
+            NoProductionVersionError: If label="production" and none exists.
+            NotFoundError: If prompt or version not found.
+            MissingVariableError: If required variables are missing.
+            ValidationError: If unknown variables are provided.
+            ApiError: On API errors.
+
+        Example:
+            >>> await client.render_many("greeting", [{"name": "Alice"}, {"name": "Bob"}])
+            ['Hello, Alice!', 'Hello, Bob!']
+        """
+        prompt_version = self._get_cached_in_memory(name, label, options)
+        if prompt_version is None:
+            prompt_version = await self.get_prompt_version(name, label=label, **options)
+        return prompt_version.render_many(variables_list)
+
+    async def aclose(self) -> None:
+        """Close the client and release resources.
+
+        Closes the underlying HTTP connection pool. The client should not
+        be used after calling this method.
+        """
+        await self._connection.aclose()
+        if self._disk_cache is not None:
+            await asyncio.to_thread(self._disk_cache.close)
+
+    async def __aenter__(self) -> "AsyncScopeClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit async context manager and close client."""
+        await self.aclose()
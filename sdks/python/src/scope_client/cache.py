@@ -1,27 +1,57 @@
 """Thread-safe TTL cache for scope-client.
 
-This module provides a simple in-memory cache with time-to-live expiration.
+This module provides a simple in-memory cache with time-to-live expiration,
+and an optional on-disk cache that is shared between processes.
 """
 
+import contextlib
+import heapq
+import json
+import sys
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Callable, Optional, TypeVar
 
+from scope_client._json import loads as json_loads
+
 T = TypeVar("T")
 
+# Single dict and OrderedDict operations are atomic under CPython's GIL, so
+# cache hits can skip the lock there. Other interpreters and free-threaded
+# builds always lock.
+_LOCK_FREE_READS = (
+    sys.implementation.name == "cpython" and getattr(sys, "_is_gil_enabled", lambda: True)()
+)
+
+# Number of locks guarding fetch() calls in flight, chosen by key hash
+_LOCK_STRIPES = 16
+
+# One entry is kept per cached key, so drop the per-instance __dict__ where
+# dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CacheEntry:
     """A single cache entry with value and expiration time.
 
+    Entries may carry HTTP validators from the response that produced them.
+    Such entries are kept after they expire so they can be revalidated with
+    a conditional request instead of being downloaded again.
+
     Args:
         value: The cached value.
-        expires_at: Unix timestamp when the entry expires.
+        expires_at: time.monotonic() value at which the entry expires.
+        etag: ETag header of the response, if any.
+        last_modified: Last-Modified header of the response, if any.
     """
 
     value: Any
     expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
     def is_expired(self) -> bool:
         """Check if this entry has expired.
@@ -29,17 +59,44 @@ class CacheEntry:
         Returns:
             True if the entry has expired, False otherwise.
         """
-        return time.time() >= self.expires_at
+        return time.monotonic() >= self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        """Whether this entry can be revalidated with a conditional request."""
+        return self.etag is not None or self.last_modified is not None
+
+
+class _Flight:
+    """A value being computed by Cache.fetch(), awaited by other callers."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+    def result(self) -> Any:
+        """Wait for the computation and return its value or raise its error."""
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
 
 
 class Cache:
     """Thread-safe TTL-based cache.
 
     This cache stores values with a configurable time-to-live. Expired entries
-    are lazily removed when accessed or when size is queried.
+    are lazily removed when accessed or when size is queried. Expiry uses
+    time.monotonic(), so wall-clock adjustments do not expire or extend
+    entries. Once maxsize entries are stored, setting a new key evicts the
+    least recently used one.
 
     Args:
         ttl: Default time-to-live in seconds for cache entries.
+        maxsize: Maximum number of entries, or None for no limit.
 
     Example:
         >>> cache = Cache(ttl=300)
@@ -54,16 +111,34 @@ class Cache:
         'computed'
     """
 
-    def __init__(self, ttl: int = 300) -> None:
+    def __init__(self, ttl: int = 300, maxsize: Optional[int] = 1024) -> None:
         self._ttl = ttl
-        self._store: dict[str, CacheEntry] = {}
+        self._maxsize = maxsize
+        # Ordered from least to most recently used
+        self._store: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = threading.Lock()
+        # Min-heap of (expires_at, key) pushed on every set, so expired
+        # entries are found without scanning the whole store. Items for
+        # overwritten or deleted entries are skipped when popped.
+        self._expiry: list[tuple[float, str]] = []
+        # Expired entries kept for revalidation
+        self._stale: set[str] = set()
+        # Keys being computed by fetch(), so concurrent misses wait for one call.
+        # Each key's flight is guarded by one of a few striped locks, so fetches
+        # of different keys do not queue behind each other or behind set().
+        self._inflight: dict[str, _Flight] = {}
+        self._stripes = tuple(threading.Lock() for _ in range(_LOCK_STRIPES))
 
     @property
     def ttl(self) -> int:
         """Get the default TTL in seconds."""
         return self._ttl
 
+    @property
+    def maxsize(self) -> Optional[int]:
+        """Get the maximum number of entries, or None if unbounded."""
+        return self._maxsize
+
     def get(self, key: str) -> Optional[Any]:
         """Get a value from the cache.
 
@@ -73,30 +148,99 @@ class Cache:
         Returns:
             Cached value if found and not expired, None otherwise.
         """
+        if _LOCK_FREE_READS:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() < entry.expires_at:
+                self._touch(key)
+                return entry.value
+
+        # Misses on expired entries, and every lookup without lock-free reads
         with self._lock:
             entry = self._store.get(key)
             if entry is None:
                 return None
 
-            if entry.is_expired():
-                del self._store[key]
+            if time.monotonic() >= entry.expires_at:
+                if not entry.revalidatable:
+                    del self._store[key]
                 return None
 
+            self._store.move_to_end(key)
             return entry.value
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get the raw entry for a key, even if it has expired.
+
+        Expired entries are only retained when they carry HTTP validators,
+        so a stale entry returned here can always be revalidated.
+
+        Args:
+            key: Cache key to look up.
+
+        Returns:
+            The CacheEntry if present, None otherwise.
+        """
+        if _LOCK_FREE_READS:
+            entry = self._store.get(key)
+            if entry is not None:
+                self._touch(key)
+            return entry
+
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None:
+                self._store.move_to_end(key)
+            return entry
+
+    def _touch(self, key: str) -> None:
+        """Mark a key as recently used without holding the lock.
+
+        Args:
+            key: Cache key that was just read.
+        """
+        # The key may have been evicted by another thread since it was read
+        with contextlib.suppress(KeyError):
+            self._store.move_to_end(key)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
         """Set a value in the cache.
 
         Args:
             key: Cache key.
             value: Value to cache.
             ttl: Optional TTL override in seconds. Uses default TTL if not provided.
+            etag: Optional ETag to revalidate the entry with once it expires.
+            last_modified: Optional Last-Modified value to revalidate the entry with.
         """
         actual_ttl = ttl if ttl is not None else self._ttl
-        expires_at = time.time() + actual_ttl
+        expires_at = time.monotonic() + actual_ttl
 
         with self._lock:
-            self._store[key] = CacheEntry(value=value, expires_at=expires_at)
+            store = self._store
+            store[key] = CacheEntry(
+                value=value,
+                expires_at=expires_at,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            store.move_to_end(key)
+            self._stale.discard(key)
+            if self._maxsize is not None and len(store) > self._maxsize:
+                evicted, _ = store.popitem(last=False)
+                self._stale.discard(evicted)
+            heapq.heappush(self._expiry, (expires_at, key))
+            if len(self._expiry) > 2 * len(self._store) + 64:
+                self._rebuild_expiry()
 
     def fetch(
         self,
@@ -107,7 +251,9 @@ class Cache:
         """Get a value from cache, computing it if not present.
 
         If the key is not in the cache or has expired, the provided function
-        is called to compute the value, which is then cached.
+        is called to compute the value, which is then cached. Concurrent
+        callers missing the same key wait for that one call and receive its
+        value (or exception) instead of calling the function themselves.
 
         Args:
             key: Cache key.
@@ -128,18 +274,63 @@ class Cache:
             >>> cache.fetch("answer", expensive_operation)  # No print, returns cached
             42
         """
-        # Check cache first (with lock)
-        cached_value = self.get(key)
-        if cached_value is not None:
-            return cached_value  # type: ignore[no-any-return]
+        with self._lock_for(key):
+            # Check the entry itself rather than get(), so a cached None
+            # counts as a hit instead of being computed again. The leader
+            # stores its value before releasing the flight under this lock,
+            # so a missing flight here means the store is already up to date.
+            entry = self._peek(key)
+            if entry is not None and time.monotonic() < entry.expires_at:
+                return entry.value  # type: ignore[no-any-return]
+
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = self._inflight[key] = _Flight()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            return flight.result()  # type: ignore[no-any-return]
 
         # Compute value outside the lock to avoid blocking other operations
-        value = func()
+        try:
+            value = func()
+            self.set(key, value, ttl=ttl)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock_for(key):
+                del self._inflight[key]
+            flight.done.set()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        """Get the striped lock guarding fetch() calls for a key.
 
-        # Store the computed value
-        self.set(key, value, ttl=ttl)
+        Args:
+            key: Cache key.
 
-        return value
+        Returns:
+            The lock for the key's stripe.
+        """
+        return self._stripes[hash(key) % _LOCK_STRIPES]
+
+    def _peek(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry for a key without updating its recency.
+
+        Args:
+            key: Cache key to look up.
+
+        Returns:
+            The CacheEntry if present, None otherwise.
+        """
+        if _LOCK_FREE_READS:
+            return self._store.get(key)
+        with self._lock:
+            return self._store.get(key)
 
     def delete(self, key: str) -> bool:
         """Delete a key from the cache.
@@ -153,6 +344,7 @@ class Cache:
         with self._lock:
             if key in self._store:
                 del self._store[key]
+                self._stale.discard(key)
                 return True
             return False
 
@@ -160,26 +352,22 @@ class Cache:
         """Clear all entries from the cache."""
         with self._lock:
             self._store.clear()
+            self._expiry.clear()
+            self._stale.clear()
 
     @property
     def size(self) -> int:
         """Get the number of non-expired entries in the cache.
 
         This property cleans up expired entries before returning the count.
+        Expired entries that can still be revalidated are kept but not counted.
 
         Returns:
             Number of valid cache entries.
         """
         with self._lock:
-            # Clean up expired entries
-            current_time = time.time()
-            expired_keys = [
-                key for key, entry in self._store.items() if current_time >= entry.expires_at
-            ]
-            for key in expired_keys:
-                del self._store[key]
-
-            return len(self._store)
+            self._evict_expired(time.monotonic())
+            return len(self._store) - len(self._stale)
 
     def has(self, key: str) -> bool:
         """Check if a key exists and is not expired.
@@ -188,9 +376,11 @@ class Cache:
             key: Cache key to check.
 
         Returns:
-            True if key exists and is not expired, False otherwise.
+            True if key exists and is not expired, False otherwise. A cached
+            None value counts as existing.
         """
-        return self.get(key) is not None
+        entry = self._peek(key)
+        return entry is not None and time.monotonic() < entry.expires_at
 
     def keys(self) -> list[str]:
         """Get all non-expired keys in the cache.
@@ -199,5 +389,194 @@ class Cache:
             List of valid cache keys.
         """
         with self._lock:
-            current_time = time.time()
-            return [key for key, entry in self._store.items() if current_time < entry.expires_at]
+            self._evict_expired(time.monotonic())
+            # Iterate over a snapshot: lock-free reads may reorder the store
+            keys = list(self._store)
+            if not self._stale:
+                return keys
+            return [key for key in keys if key not in self._stale]
+
+    def _evict_expired(self, now: float) -> None:
+        """Remove entries that expired by now; must hold the lock.
+
+        Entries with HTTP validators are kept and marked stale instead.
+
+        Args:
+            now: Current time.monotonic() value.
+        """
+        expiry = self._expiry
+        store = self._store
+        while expiry and expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(expiry)
+            entry = store.get(key)
+            # Skip items left behind by entries that were replaced or deleted
+            if entry is None or entry.expires_at != expires_at:
+                continue
+            if entry.revalidatable:
+                self._stale.add(key)
+            else:
+                del store[key]
+
+    def _rebuild_expiry(self) -> None:
+        """Drop heap items of replaced entries; must hold the lock."""
+        self._expiry = [
+            (entry.expires_at, key)
+            for key, entry in list(self._store.items())
+            if key not in self._stale
+        ]
+        heapq.heapify(self._expiry)
+
+
+class DiskCache:
+    """Persistent TTL cache backed by the ``diskcache`` package.
+
+    Entries are stored on disk so they survive process restarts and are
+    shared by every process using the same directory. Values are stored as
+    JSON rather than pickled objects; ``dumps`` and ``loads`` convert between
+    cached values and JSON-compatible data.
+
+    Requires the optional ``diskcache`` dependency
+    (``pip install scope-client[disk]``).
+
+    Args:
+        directory: Directory holding the cache files.
+        ttl: Default time-to-live in seconds for cache entries.
+        namespace: Key prefix isolating this cache from others in the same
+            directory, e.g. one per API URL and organization.
+        dumps: Converts a value to JSON-compatible data before storing it.
+        loads: Rebuilds a value from stored data.
+
+    Raises:
+        ConfigurationError: If the diskcache package is not installed.
+
+    Example:
+        >>> cache = DiskCache("/tmp/scope-cache", ttl=300)
+        >>> cache.set("key", {"content": "Hello"})
+        >>> cache.get("key")
+        {'content': 'Hello'}
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: int = 300,
+        *,
+        namespace: str = "",
+        dumps: Optional[Callable[[Any], Any]] = None,
+        loads: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        try:
+            import diskcache
+        except ImportError as e:
+            from scope_client.errors import ConfigurationError
+
+            raise ConfigurationError(
+                "The disk cache backend requires the diskcache package "
+                "(pip install scope-client[disk])"
+            ) from e
+
+        self._ttl = ttl
+        self._namespace = namespace
+        self._dumps = dumps
+        self._loads = loads
+        self._store = diskcache.Cache(directory)
+
+    @property
+    def ttl(self) -> int:
+        """Get the default TTL in seconds."""
+        return self._ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from the cache.
+
+        Args:
+            key: Cache key to look up.
+
+        Returns:
+            Cached value if found and not expired, None otherwise.
+        """
+        entry = self.get_entry(key)
+        if entry is None or entry.is_expired():
+            return None
+        return entry.value
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry for a key, even if it has expired.
+
+        Expired entries are only retained when they carry HTTP validators,
+        so a stale entry returned here can always be revalidated.
+
+        Args:
+            key: Cache key to look up.
+
+        Returns:
+            The CacheEntry if present, None otherwise.
+        """
+        record = self._store.get(self._namespace + key)
+        if record is None:
+            return None
+
+        body, expires_at, etag, last_modified = record
+        data = json_loads(body)
+        # Records store a wall-clock expiry, which is meaningful across
+        # processes; entries use the monotonic clock like the memory cache
+        return CacheEntry(
+            value=self._loads(data) if self._loads is not None else data,
+            expires_at=expires_at - time.time() + time.monotonic(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Set a value in the cache.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl: Optional TTL override in seconds. Uses default TTL if not provided.
+            etag: Optional ETag to revalidate the entry with once it expires.
+            last_modified: Optional Last-Modified value to revalidate the entry with.
+        """
+        actual_ttl = ttl if ttl is not None else self._ttl
+        data = self._dumps(value) if self._dumps is not None else value
+        record = (json.dumps(data), time.time() + actual_ttl, etag, last_modified)
+
+        # Entries without validators are useless once expired, so let
+        # diskcache evict them; the others are kept for revalidation
+        revalidatable = etag is not None or last_modified is not None
+        self._store.set(
+            self._namespace + key,
+            record,
+            expire=None if revalidatable else actual_ttl,
+            tag=self._namespace or None,
+        )
+
+    def delete(self, key: str) -> bool:
+        """Delete a key from the cache.
+
+        Args:
+            key: Cache key to delete.
+
+        Returns:
+            True if the key was deleted, False if it didn't exist.
+        """
+        return bool(self._store.delete(self._namespace + key))
+
+    def clear(self) -> None:
+        """Clear all entries in this cache's namespace."""
+        if self._namespace:
+            self._store.evict(self._namespace)
+        else:
+            self._store.clear()
+
+    def close(self) -> None:
+        """Close the underlying cache files."""
+        self._store.close()
@@ -1,32 +1,82 @@
 """Main ScopeClient class.
 
 This module provides the ScopeClient class, the main entry point
-for interacting with the Scope API.
+for interacting with the Scope API, and the BaseClient it shares with
+AsyncScopeClient.
 """
 
-from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Optional
 
-from scope_client.cache import Cache
+from scope_client._telemetry import TelemetryHooks
+from scope_client.cache import Cache, CacheEntry, DiskCache
 from scope_client.configuration import Configuration, ConfigurationManager
-from scope_client.connection import Connection
-from scope_client.errors import NoProductionVersionError, NotFoundError
+from scope_client.connection import ConditionalResponse, Connection
+from scope_client.errors import NoProductionVersionError, NotFoundError, ScopeError
 from scope_client.resources.prompt_version import PromptVersion
 
 if TYPE_CHECKING:
     from scope_client.credentials import Credentials
 
-T = TypeVar("T")
-
 # Label constants
 LABEL_PRODUCTION = "production"
 LABEL_LATEST = "latest"
 
+# Upper bound on concurrent requests made by get_prompt_versions()
+BATCH_MAX_WORKERS = 8
 
-class ScopeClient:
-    """Client for the Scope Prompt Management API.
+# Number of resolved prompt cache keys/endpoints kept for reuse
+PATH_CACHE_SIZE = 1024
 
-    The ScopeClient provides methods for fetching prompts, versions,
-    and rendering prompt templates with variables.
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _prompt_version_path(
+    name: str,
+    label: Optional[str],
+    version: Optional[str],
+) -> tuple[str, str]:
+    """Build the cache key and API endpoint for a prompt version request.
+
+    Results are memoized and the cache key is interned, so repeated lookups
+    of the same prompt reuse one key object whose hash is already computed,
+    instead of formatting and hashing a new string each time. Keys stay
+    strings rather than tuples: a tuple recomputes its hash on every dict
+    lookup, and the disk cache stores keys as strings.
+
+    Args:
+        name: The name or ID of the prompt.
+        label: Label to fetch - "production", "latest".
+        version: Specific version ID (overrides label).
+
+    Returns:
+        Tuple of (cache_key, endpoint).
+    """
+    # Only runs on a memo miss. f-strings are kept on purpose: they compile to
+    # FORMAT_VALUE/BUILD_STRING and measure about 4x faster than calling a
+    # pre-bound "prompts/{}/production".format
+    if version is not None:
+        cache_key, endpoint = (
+            f"prompt:{name}:version:{version}",
+            f"prompts/{name}/versions/{version}",
+        )
+    elif label == LABEL_LATEST:
+        cache_key, endpoint = f"prompt:{name}:latest", f"prompts/{name}/latest"
+    else:
+        # Default to production
+        cache_key, endpoint = f"prompt:{name}:production", f"prompts/{name}/production"
+    return sys.intern(cache_key), endpoint
+
+
+class BaseClient:
+    """Configuration, caching and endpoint resolution shared by the clients.
+
+    ScopeClient and AsyncScopeClient add the synchronous and asynchronous
+    request methods on top of this class.
 
     Args:
         credentials: Optional Credentials instance for authentication.
@@ -34,31 +84,18 @@ class ScopeClient:
             uses the global configuration.
         base_url: Optional base URL override for the API.
         **options: Configuration options to merge with the base config.
-
-    Example:
-        >>> # Using credentials directly
-        >>> from scope_client import ScopeClient, ApiKeyCredentials
-        >>> credentials = ApiKeyCredentials(
-        ...     org_id="my-org",
-        ...     api_key="key_abc123",
-        ...     api_secret="secret_xyz"
-        ... )
-        >>> client = ScopeClient(credentials=credentials)
-
-        >>> # Or with credentials from environment
-        >>> credentials = ApiKeyCredentials.from_env()
-        >>> client = ScopeClient(credentials=credentials)
-
-        >>> # Using global configuration
-        >>> import scope_client
-        >>> scope_client.configure(credentials=ApiKeyCredentials.from_env())
-        >>> client = scope_client.client()
-
-        >>> # Get production version and render
-        >>> version = client.get_prompt_version("my-prompt")
-        >>> rendered = version.render(name="Alice")
     """
 
+    __slots__ = (
+        "_config",
+        "_telemetry",
+        "_cache",
+        "_disk_cache",
+        "_not_found_cache",
+        "_caching",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         credentials: Optional["Credentials"] = None,
@@ -86,13 +123,30 @@ class ScopeClient:
         # Validate configuration
         self._config.validate()
 
-        # Initialize connection
-        self._connection = Connection(self._config)
+        self._telemetry = TelemetryHooks()
 
-        # Initialize cache if enabled
+        # Initialize caches if enabled
         self._cache: Optional[Cache] = None
+        self._disk_cache: Optional[DiskCache] = None
+        self._not_found_cache: Optional[Cache] = None
         if self._config.cache_enabled:
-            self._cache = Cache(ttl=self._config.cache_ttl)
+            if self._config.negative_cache_ttl > 0:
+                self._not_found_cache = Cache(ttl=self._config.negative_cache_ttl)
+            if self._config.cache_backend != "disk":
+                self._cache = Cache(ttl=self._config.cache_ttl)
+            if self._config.cache_backend != "memory":
+                org_id = getattr(self._config.credentials, "org_id", None) or ""
+                self._disk_cache = DiskCache(
+                    self._config.cache_directory,
+                    ttl=self._config.cache_ttl,
+                    namespace=f"{self._config.api_url}|{org_id}|",
+                    # Serialized to JSON right away, so the data need not be copied
+                    dumps=lambda version: version.to_dict(copy=False),
+                    loads=lambda data: PromptVersion(data, client=self),
+                )
+        # Decided once here, so lookups with caching disabled skip the cache
+        # and in-flight bookkeeping entirely
+        self._caching = self._cache is not None or self._disk_cache is not None
 
     @property
     def config(self) -> Configuration:
@@ -103,6 +157,283 @@ class ScopeClient:
         """
         return self._config
 
+    @property
+    def telemetry(self) -> TelemetryHooks:
+        """Get the telemetry hooks for this client.
+
+        Callbacks registered here only see this client's requests.
+
+        Returns:
+            The TelemetryHooks instance of this client.
+        """
+        return self._telemetry
+
+    def _get_cached_prompt_version(
+        self,
+        name: str,
+        label: Optional[str],
+        version: Optional[str],
+        options: dict[str, Any],
+    ) -> Optional[PromptVersion]:
+        """Look up a prompt version in the cache without fetching it.
+
+        Args:
+            name: The name or ID of the prompt.
+            label: Label to look up.
+            version: Specific version ID (overrides label).
+            options: Request options; a false ``cache`` option skips the lookup.
+
+        Returns:
+            The cached PromptVersion, or None on a miss or if caching is off.
+        """
+        if not self._caching or not options.get("cache", True):
+            return None
+        cache_key, _ = self._resolve_prompt_version_path(name, label, version)
+        entry = self._get_cache_entry(cache_key)
+        if entry is None or entry.is_expired():
+            return None
+        cached: PromptVersion = entry.value
+        return cached
+
+    def _raise_if_not_found(self, cache_key: str, options: dict[str, Any]) -> None:
+        """Re-raise the error of a recent lookup that found nothing.
+
+        Args:
+            cache_key: Cache key of the prompt version.
+            options: Request options; cache=False skips the check.
+
+        Raises:
+            NoProductionVersionError: If the prompt recently had no production version.
+            NotFoundError: If the prompt or version was recently not found.
+        """
+        if self._not_found_cache is None or not options.get("cache", True):
+            return
+        make_error = self._not_found_cache.get(cache_key)
+        if make_error is not None:
+            # A new error per lookup, so tracebacks do not pile up on one
+            # instance and keep earlier callers' frames alive
+            raise make_error()
+
+    def _not_found_error(
+        self,
+        cache_key: str,
+        name: str,
+        label: Optional[str],
+        error: NotFoundError,
+        options: dict[str, Any],
+    ) -> ScopeError:
+        """Map a 404 to the error to raise, remembering it for negative_cache_ttl.
+
+        Args:
+            cache_key: Cache key of the prompt version.
+            name: The name or ID of the prompt.
+            label: Requested label.
+            error: The NotFoundError from the API.
+            options: Request options; cache=False does not remember the error.
+
+        Returns:
+            NoProductionVersionError for the production label, else the error.
+        """
+        # Only how to build the error is remembered, never an instance
+        make_error: Callable[[], ScopeError]
+        if label is None or label == LABEL_PRODUCTION:
+            make_error = partial(NoProductionVersionError, name)
+        else:
+            make_error = partial(
+                NotFoundError,
+                error.message,
+                http_body=error.http_body,
+                error_code=error.error_code,
+                request_id=error.request_id,
+            )
+        if self._not_found_cache is not None and options.get("cache", True):
+            self._not_found_cache.set(cache_key, make_error)
+        return make_error()
+
+    def _get_cache_entry(self, cache_key: str) -> Optional[CacheEntry]:
+        """Look up a cache entry in memory, then on disk.
+
+        Entries found on disk are copied into the memory cache, so each
+        process only deserializes them once.
+
+        Args:
+            cache_key: Cache key to look up.
+
+        Returns:
+            The freshest CacheEntry, possibly expired, or None if not cached.
+        """
+        entry = self._cache.get_entry(cache_key) if self._cache is not None else None
+        if self._disk_cache is None or (entry is not None and not entry.is_expired()):
+            return entry
+
+        disk_entry = self._disk_cache.get_entry(cache_key)
+        if disk_entry is None or (entry is not None and disk_entry.expires_at <= entry.expires_at):
+            return entry
+
+        if self._cache is not None:
+            self._cache.set(
+                cache_key,
+                disk_entry.value,
+                ttl=disk_entry.expires_at - time.monotonic(),
+                etag=disk_entry.etag,
+                last_modified=disk_entry.last_modified,
+            )
+        return disk_entry
+
+    def _set_cache_entry(
+        self,
+        cache_key: str,
+        value: PromptVersion,
+        ttl: Optional[int],
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        """Store a prompt version in every configured cache.
+
+        Args:
+            cache_key: Cache key.
+            value: Prompt version to cache.
+            ttl: Optional TTL override in seconds.
+            etag: ETag of the response, if any.
+            last_modified: Last-Modified value of the response, if any.
+        """
+        for cache in (self._cache, self._disk_cache):
+            if cache is not None:
+                cache.set(cache_key, value, ttl=ttl, etag=etag, last_modified=last_modified)
+
+    def _prompt_version_from_response(
+        self,
+        cache_key: str,
+        entry: Optional[CacheEntry],
+        response: ConditionalResponse,
+        options: dict[str, Any],
+    ) -> PromptVersion:
+        """Build a prompt version from a (conditional) response and cache it.
+
+        Args:
+            cache_key: Cache key of the prompt version.
+            entry: Stale cache entry the request revalidated, if any.
+            response: Response to the conditional request.
+            options: Request options (cache, cache_ttl).
+
+        Returns:
+            The cached PromptVersion on 304 Not Modified, otherwise a new one.
+        """
+        if response.not_modified and entry is not None:
+            prompt_version: PromptVersion = entry.value
+        else:
+            prompt_version = PromptVersion(response.data, client=self)
+
+        if self._caching and options.get("cache", True):
+            self._set_cache_entry(
+                cache_key,
+                prompt_version,
+                ttl=options.get("cache_ttl"),
+                etag=response.etag,
+                last_modified=response.last_modified,
+            )
+        return prompt_version
+
+    def _resolve_prompt_version_path(
+        self,
+        name: str,
+        label: Optional[str],
+        version: Optional[str],
+    ) -> tuple[str, str]:
+        """Resolve cache key and API endpoint for a prompt version request.
+
+        Args:
+            name: The name or ID of the prompt.
+            label: Label to fetch - "production", "latest".
+            version: Specific version ID (overrides label).
+
+        Returns:
+            Tuple of (cache_key, endpoint).
+        """
+        return _prompt_version_path(name, label, version)
+
+    def clear_cache(self) -> None:
+        """Clear all cached responses.
+
+        Removes all entries from the cache. Has no effect if caching
+        is disabled.
+
+        Example:
+            >>> client.clear_cache()
+        """
+        if self._cache is not None:
+            self._cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+        if self._not_found_cache is not None:
+            self._not_found_cache.clear()
+
+    def __repr__(self) -> str:
+        """Get string representation of client.
+
+        Returns:
+            String showing client configuration summary.
+        """
+        cache_status = "enabled" if self._caching else "disabled"
+        return f"<{type(self).__name__} base_url={self._config.base_url!r} cache={cache_status}>"
+
+
+class ScopeClient(BaseClient):
+    """Client for the Scope Prompt Management API.
+
+    The ScopeClient provides methods for fetching prompts, versions,
+    and rendering prompt templates with variables.
+
+    A client holds a pool of keep-alive connections, its access token and
+    its prompt cache, and is safe to share between threads. Create one and
+    reuse it for the lifetime of the application rather than one per call.
+
+    Args:
+        credentials: Optional Credentials instance for authentication.
+        config: Optional Configuration instance. If not provided,
+            uses the global configuration.
+        base_url: Optional base URL override for the API.
+        **options: Configuration options to merge with the base config.
+
+    Example:
+        >>> # Using credentials directly
+        >>> from scope_client import ScopeClient, ApiKeyCredentials
+        >>> credentials = ApiKeyCredentials(
+        ...     org_id="my-org",
+        ...     api_key="key_abc123",
+        ...     api_secret="secret_xyz"
+        ... )
+        >>> client = ScopeClient(credentials=credentials)
+
+        >>> # Or with credentials from environment
+        >>> credentials = ApiKeyCredentials.from_env()
+        >>> client = ScopeClient(credentials=credentials)
+
+        >>> # Using global configuration
+        >>> import scope_client
+        >>> scope_client.configure(credentials=ApiKeyCredentials.from_env())
+        >>> client = scope_client.client()
+
+        >>> # Get production version and render
+        >>> version = client.get_prompt_version("my-prompt")
+        >>> rendered = version.render(name="Alice")
+    """
+
+    __slots__ = ("_connection", "_inflight", "_inflight_lock")
+
+    def __init__(
+        self,
+        credentials: Optional["Credentials"] = None,
+        config: Optional[Configuration] = None,
+        base_url: Optional[str] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(credentials=credentials, config=config, base_url=base_url, **options)
+        self._connection = Connection(self._config, self._telemetry)
+        # Requests in flight by cache key, so concurrent misses share one request
+        self._inflight: dict[str, Future[PromptVersion]] = {}
+        self._inflight_lock = threading.Lock()
+
     def get_prompt_version(
         self,
         name: str,
@@ -113,6 +444,10 @@ class ScopeClient:
     ) -> PromptVersion:
         """Fetch a prompt version by name.
 
+        Concurrent calls from several threads that miss the cache for the same
+        prompt version share a single request, unless caching is disabled or
+        they pass cache=False.
+
         Args:
             name: The name or ID of the prompt.
             label: Label to fetch - "production" (default), "latest".
@@ -138,41 +473,140 @@ class ScopeClient:
             >>> rendered = prompt.render(name="Alice")
         """
         cache_key, endpoint = self._resolve_prompt_version_path(name, label, version)
-
-        def fetch() -> PromptVersion:
-            try:
-                data = self._connection.get(endpoint)
-                return PromptVersion(data, client=self)
-            except NotFoundError:
-                if label is None or label == LABEL_PRODUCTION:
-                    raise NoProductionVersionError(name) from None
-                raise
-
-        return self._fetch_with_cache(cache_key, fetch, **options)
-
-    def _resolve_prompt_version_path(
+        if not self._caching or not options.get("cache", True):
+            return self._fetch_prompt_version(cache_key, endpoint, None, name, label, options)
+
+        entry = self._get_cache_entry(cache_key)
+        if entry is not None and not entry.is_expired():
+            cached: PromptVersion = entry.value
+            return cached
+        self._raise_if_not_found(cache_key, options)
+
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if future is None:
+                # A flight may have finished (and stored its result) since the
+                # lookup above, so look again before starting a new one
+                entry = self._get_cache_entry(cache_key)
+                if entry is not None and not entry.is_expired():
+                    cached = entry.value
+                    return cached
+                self._raise_if_not_found(cache_key, options)
+                future = self._inflight[cache_key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            prompt_version = self._fetch_prompt_version(
+                cache_key, endpoint, entry, name, label, options
+            )
+            future.set_result(prompt_version)
+            return prompt_version
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            # The result is cached before the flight is removed, so later
+            # callers find it in the cache instead of fetching it again
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+    def _fetch_prompt_version(
         self,
+        cache_key: str,
+        endpoint: str,
+        entry: Optional[CacheEntry],
         name: str,
         label: Optional[str],
-        version: Optional[str],
-    ) -> tuple[str, str]:
-        """Resolve cache key and API endpoint for a prompt version request.
+        options: dict[str, Any],
+    ) -> PromptVersion:
+        """Request a prompt version, revalidating a stale entry if given.
 
         Args:
+            cache_key: Cache key of the prompt version.
+            endpoint: API endpoint of the prompt version.
+            entry: Stale cache entry to revalidate, if any.
             name: The name or ID of the prompt.
-            label: Label to fetch - "production", "latest".
-            version: Specific version ID (overrides label).
+            label: Requested label.
+            options: Request options (cache, cache_ttl).
 
         Returns:
-            Tuple of (cache_key, endpoint).
+            The fetched (or revalidated) PromptVersion.
         """
-        if version is not None:
-            return (f"prompt:{name}:version:{version}", f"prompts/{name}/versions/{version}")
-        elif label == LABEL_LATEST:
-            return (f"prompt:{name}:latest", f"prompts/{name}/latest")
-        else:
-            # Default to production
-            return (f"prompt:{name}:production", f"prompts/{name}/production")
+        # A stale entry is only kept when it has validators, so revalidate it
+        # and let the server answer 304 instead of resending the body
+        try:
+            response = self._connection.get_conditional(
+                endpoint,
+                etag=entry.etag if entry is not None else None,
+                last_modified=entry.last_modified if entry is not None else None,
+            )
+        except NotFoundError as e:
+            raise self._not_found_error(cache_key, name, label, e, options) from None
+
+        return self._prompt_version_from_response(cache_key, entry, response, options)
+
+    def get_prompt_versions(
+        self,
+        names: Sequence[str],
+        *,
+        label: Optional[str] = None,
+        max_workers: int = BATCH_MAX_WORKERS,
+        **options: Any,
+    ) -> dict[str, PromptVersion]:
+        """Fetch prompt versions for several prompts at once.
+
+        Cached versions are returned directly; the remaining prompts are
+        fetched concurrently over the client's shared connection pool, so the
+        total latency is close to that of the slowest single request. Prompts
+        that another thread is already fetching are waited for, not fetched
+        again, so overlapping batches share requests.
+
+        Args:
+            names: Names or IDs of the prompts. Duplicates are fetched once.
+            label: Label to fetch - "production" (default), "latest".
+            max_workers: Maximum number of concurrent requests.
+            **options: Request options, as for get_prompt_version().
+
+        Returns:
+            Dictionary mapping each name to its PromptVersion, in input order.
+
+        Raises:
+            NoProductionVersionError: If label="production" and a prompt has none.
+            NotFoundError: If a prompt is not found.
+            ApiError: On other API errors.
+
+        Example:
+            >>> versions = client.get_prompt_versions(["greeting", "farewell"])
+            >>> versions["greeting"].render(name="Alice")
+            'Hello, Alice!'
+        """
+        results: dict[str, Optional[PromptVersion]] = {}
+        misses = []
+        for name in dict.fromkeys(names):
+            cached = self._get_cached_prompt_version(name, label, None, options)
+            results[name] = cached
+            if cached is None:
+                misses.append(name)
+
+        if len(misses) == 1 or max_workers <= 1:
+            for name in misses:
+                results[name] = self.get_prompt_version(name, label=label, **options)
+        elif misses:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(misses)),
+                thread_name_prefix="scope-client",
+            ) as executor:
+                futures = [
+                    (name, executor.submit(self.get_prompt_version, name, label=label, **options))
+                    for name in misses
+                ]
+                for name, future in futures:
+                    results[name] = future.result()
+
+        return {name: version for name, version in results.items() if version is not None}
 
     def render_prompt(
         self,
@@ -211,47 +645,51 @@ class ScopeClient:
             >>> print(rendered)
             'Good morning, Alice!'
         """
+        # Cache hits render straight from the stored version's compiled template
+        cached = self._get_cached_prompt_version(name, label, None, options)
+        if cached is not None:
+            return cached.render(**variables)
+
         prompt_version = self.get_prompt_version(name, label=label, **options)
         return prompt_version.render(**variables)
 
-    def clear_cache(self) -> None:
-        """Clear all cached responses.
-
-        Removes all entries from the cache. Has no effect if caching
-        is disabled.
-
-        Example:
-            >>> client.clear_cache()
-        """
-        if self._cache is not None:
-            self._cache.clear()
-
-    def _fetch_with_cache(
+    def render_many(
         self,
-        cache_key: str,
-        fetch_func: Callable[[], T],
+        name: str,
+        variables_list: Iterable[Mapping[str, Any]],
+        label: str = LABEL_PRODUCTION,
         **options: Any,
-    ) -> T:
-        """Fetch data with optional caching.
+    ) -> list[str]:
+        """Fetch a prompt version once and render it for many sets of variables.
+
+        Prefer this over calling render_prompt() in a loop: the version is
+        looked up once, every set of variables is validated up front, and
+        the renders then run in a single loop.
 
         Args:
-            cache_key: Cache key for this request.
-            fetch_func: Function to call if cache misses.
-            **options: Options including cache control.
-                cache: Whether to use cache (default: True).
-                cache_ttl: Custom TTL for this entry.
+            name: The name or ID of the prompt.
+            variables_list: Mappings of variable names to values.
+            label: Label to use - "production" (default) or "latest".
+            **options: Request options passed to the fetch method.
 
         Returns:
-            Fetched or cached data.
-        """
-        # Check if caching is enabled and requested
-        use_cache = options.pop("cache", True)
-        cache_ttl = options.pop("cache_ttl", None)
+            Rendered prompt strings, in the same order as variables_list.
 
-        if not use_cache or self._cache is None:
-            return fetch_func()
+        Raises:
+            NoProductionVersionError: If label="production" and none exists.
+            NotFoundError: If prompt or version not found.
+            MissingVariableError: If required variables are missing.
+            ValidationError: If unknown variables are provided.
+            ApiError: On API errors.
 
-        return self._cache.fetch(cache_key, fetch_func, ttl=cache_ttl)
+        Example:
+            >>> client.render_many("greeting", [{"name": "Alice"}, {"name": "Bob"}])
+            ['Hello, Alice!', 'Hello, Bob!']
+        """
+        prompt_version = self._get_cached_prompt_version(name, label, None, options)
+        if prompt_version is None:
+            prompt_version = self.get_prompt_version(name, label=label, **options)
+        return prompt_version.render_many(variables_list)
 
     def close(self) -> None:
         """Close the client and release resources.
@@ -260,6 +698,8 @@ class ScopeClient:
         be used after calling this method.
         """
         self._connection.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
 
     def __enter__(self) -> "ScopeClient":
         """Enter context manager."""
@@ -269,11 +709,20 @@ class ScopeClient:
         """Exit context manager and close client."""
         self.close()
 
-    def __repr__(self) -> str:
-        """Get string representation of client.
 
-        Returns:
-            String showing client configuration summary.
-        """
-        cache_status = "enabled" if self._cache else "disabled"
-        return f"<ScopeClient base_url={self._config.base_url!r} cache={cache_status}>"
+class _SharedScopeClient(ScopeClient):
+    """ScopeClient handed out by argument-less scope_client.client() calls.
+
+    Callers share this instance, so close() (and leaving a ``with`` block)
+    leaves it open for the others. It is closed by client() when a changed
+    global configuration replaces it.
+    """
+
+    __slots__ = ()
+
+    def close(self) -> None:
+        """Do nothing; the shared client stays open for other callers."""
+
+    def _close_shared(self) -> None:
+        """Close the client once it is no longer handed out."""
+        super().close()
@@ -4,16 +4,83 @@ This module provides the Configuration class for managing SDK settings.
 Configuration can be loaded from environment variables or set programmatically.
 """
 
+import importlib.util
 import os
+import sys
 import threading
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, fields, replace
 from typing import TYPE_CHECKING, Any, Optional
 
+from scope_client.errors import ConfigurationError
+
 if TYPE_CHECKING:
     from scope_client.credentials import Credentials
 
+# A Configuration is created on every merge(), so drop the per-instance
+# __dict__ where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Supported values for Configuration.cache_backend
+CACHE_BACKENDS = ("memory", "disk", "hybrid")
+
+# Environment variables read by Configuration, and the fields they set
+_ENV_VARS = {
+    "SCOPE_API_URL": "base_url",
+    "SCOPE_AUTH_API_URL": "auth_api_url",
+    "SCOPE_ENVIRONMENT": "environment",
+    "SCOPE_TOKEN_REFRESH_BUFFER": "token_refresh_buffer",
+}
+
+# Field values parsed from _ENV_VARS on first use. Configurations are created
+# on every merge(), so __post_init__ then only reads this dict instead of
+# os.environ, and does not strip URLs or parse integers again.
+_env_lock = threading.Lock()
+_env_cache: Optional[dict[str, Any]] = None
+
+
+def _parse_env() -> dict[str, Any]:
+    """Read the environment variables used by Configuration.
+
+    Returns:
+        Field values for the variables that are set and non-empty.
+    """
+    values: dict[str, Any] = {}
+    for var, name in _ENV_VARS.items():
+        value = os.environ.get(var)
+        if value:
+            values[name] = value
+    for name in ("base_url", "auth_api_url"):
+        if name in values:
+            values[name] = values[name].rstrip("/")
+    if "token_refresh_buffer" in values:
+        values["token_refresh_buffer"] = int(values["token_refresh_buffer"])
+    return values
+
+
+def _env_values() -> dict[str, Any]:
+    """Get the field values set by environment variables.
+
+    Returns:
+        Field values parsed when the variables were first read.
+    """
+    global _env_cache
+    cache = _env_cache
+    if cache is None:
+        with _env_lock:
+            if _env_cache is None:
+                _env_cache = _parse_env()
+            cache = _env_cache
+    return cache
 
-@dataclass(frozen=True)
+
+def _reset_env_cache() -> None:
+    """Read the environment variables again on next use."""
+    global _env_cache
+    with _env_lock:
+        _env_cache = None
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Configuration:
     """Immutable configuration for the Scope client.
 
@@ -27,6 +94,9 @@ class Configuration:
         SCOPE_ENVIRONMENT: Environment name (e.g., 'production', 'staging').
         SCOPE_TOKEN_REFRESH_BUFFER: Seconds before token expiry to refresh.
 
+    The variables are read once, when the first Configuration is created.
+    reset_configuration() makes the next one read them again.
+
     Args:
         credentials: Credentials instance for authentication.
         base_url: Base URL for the Scope API.
@@ -36,10 +106,21 @@ class Configuration:
         open_timeout: Connection timeout in seconds.
         cache_enabled: Whether to enable response caching.
         cache_ttl: Cache time-to-live in seconds.
+        negative_cache_ttl: Seconds to remember that a prompt or version was
+            not found, so repeated lookups fail without a request. 0 disables.
+        cache_backend: Where to cache prompt versions - "memory" (default),
+            "disk" (shared between processes, requires diskcache) or
+            "hybrid" (memory in front of disk).
+        cache_dir: Directory for the disk cache. Defaults to
+            ~/.cache/scope-client.
+        http2: Whether to use HTTP/2 (requires the h2 package).
         max_retries: Maximum number of retry attempts.
         retry_base_delay: Base delay between retries in seconds.
         retry_max_delay: Maximum delay between retries in seconds.
         telemetry_enabled: Whether to enable telemetry.
+        telemetry_background: Whether to run telemetry callbacks on a
+            background thread instead of in the request. Events are dropped
+            when more than BACKGROUND_QUEUE_SIZE are waiting.
         environment: Environment name for the client.
         token_refresh_buffer: Seconds before token expiry to refresh.
 
@@ -65,35 +146,39 @@ class Configuration:
     open_timeout: int = field(default=10)
     cache_enabled: bool = field(default=True)
     cache_ttl: int = field(default=300)
+    negative_cache_ttl: int = field(default=30)
+    cache_backend: str = field(default="memory")
+    cache_dir: Optional[str] = field(default=None)
+    http2: bool = field(default=False)
     max_retries: int = field(default=3)
     retry_base_delay: float = field(default=0.5)
     retry_max_delay: float = field(default=30.0)
     telemetry_enabled: bool = field(default=True)
+    telemetry_background: bool = field(default=False)
     environment: str = field(default="production")
     token_refresh_buffer: int = field(default=60)
+    _api_url: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Load values from environment variables if not explicitly set."""
+        env = _env_values()
+
         # We need to use object.__setattr__ because the dataclass is frozen
-        if self.base_url is None:
-            env_url = os.environ.get("SCOPE_API_URL")
-            if env_url:
-                object.__setattr__(self, "base_url", env_url.rstrip("/"))
+        if env:
+            if self.base_url is None and "base_url" in env:
+                object.__setattr__(self, "base_url", env["base_url"])
 
-        if self.auth_api_url is None:
-            env_val = os.environ.get("SCOPE_AUTH_API_URL")
-            if env_val:
-                object.__setattr__(self, "auth_api_url", env_val.rstrip("/"))
+            if self.auth_api_url is None and "auth_api_url" in env:
+                object.__setattr__(self, "auth_api_url", env["auth_api_url"])
+
+            if self.environment == "production" and "environment" in env:
+                object.__setattr__(self, "environment", env["environment"])
 
-        if self.environment == "production":
-            env_environment = os.environ.get("SCOPE_ENVIRONMENT")
-            if env_environment:
-                object.__setattr__(self, "environment", env_environment)
+            if self.token_refresh_buffer == 60 and "token_refresh_buffer" in env:
+                object.__setattr__(self, "token_refresh_buffer", env["token_refresh_buffer"])
 
-        if self.token_refresh_buffer == 60:
-            env_val = os.environ.get("SCOPE_TOKEN_REFRESH_BUFFER")
-            if env_val:
-                object.__setattr__(self, "token_refresh_buffer", int(env_val))
+        # Every request builds its URL from api_url, so format it only once
+        object.__setattr__(self, "_api_url", f"{self.base_url}/api/{self.api_version}")
 
     def merge(self, **kwargs: Any) -> "Configuration":
         """Create a new Configuration with merged values.
@@ -121,27 +206,21 @@ class Configuration:
         Returns:
             Dictionary representation of configuration.
         """
-        result: dict[str, Any] = {
-            "base_url": self.base_url,
-            "auth_api_url": self.auth_api_url,
-            "api_version": self.api_version,
-            "timeout": self.timeout,
-            "open_timeout": self.open_timeout,
-            "cache_enabled": self.cache_enabled,
-            "cache_ttl": self.cache_ttl,
-            "max_retries": self.max_retries,
-            "retry_base_delay": self.retry_base_delay,
-            "retry_max_delay": self.retry_max_delay,
-            "telemetry_enabled": self.telemetry_enabled,
-            "environment": self.environment,
-            "token_refresh_buffer": self.token_refresh_buffer,
-        }
-        if self.credentials is not None:
-            result["credentials"] = self.credentials.to_dict()
-        else:
-            result["credentials"] = None
+        result = {name: getattr(self, name) for name in _DICT_FIELDS}
+        result["credentials"] = self.credentials.to_dict() if self.credentials is not None else None
         return result
 
+    @property
+    def cache_directory(self) -> str:
+        """Get the directory used by the disk cache.
+
+        Returns:
+            cache_dir if set, otherwise ~/.cache/scope-client.
+        """
+        if self.cache_dir is not None:
+            return self.cache_dir
+        return os.path.join(os.path.expanduser("~"), ".cache", "scope-client")
+
     @property
     def api_url(self) -> str:
         """Get the full API URL including version.
@@ -149,7 +228,7 @@ class Configuration:
         Returns:
             Full API URL with version path.
         """
-        return f"{self.base_url}/api/{self.api_version}"
+        return self._api_url
 
     def validate(self) -> None:
         """Validate configuration.
@@ -157,8 +236,6 @@ class Configuration:
         Raises:
             ConfigurationError: If required fields are not set or invalid.
         """
-        from scope_client.errors import ConfigurationError
-
         if self.credentials is None:
             raise ConfigurationError("credentials is required")
         if self.base_url is None:
@@ -169,9 +246,22 @@ class Configuration:
             raise ConfigurationError(
                 "auth_api_url is required (set SCOPE_AUTH_API_URL environment variable)"
             )
+        if self.cache_backend not in CACHE_BACKENDS:
+            raise ConfigurationError(
+                f"cache_backend must be one of {', '.join(CACHE_BACKENDS)}, "
+                f"got {self.cache_backend!r}"
+            )
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ConfigurationError(
+                "http2 requires the h2 package (pip install scope-client[http2])"
+            )
         self.credentials.validate()
 
 
+# Fields copied as is by Configuration.to_dict(); credentials are redacted
+_DICT_FIELDS = tuple(f.name for f in fields(Configuration) if f.init and f.name != "credentials")
+
+
 class ConfigurationManager:
     """Thread-safe global configuration manager.
 
@@ -190,6 +280,12 @@ class ConfigurationManager:
             Current Configuration instance, or a new default instance
             if none has been set.
         """
+        # Reading the attribute is atomic, and set() replaces it in one
+        # assignment, so only creating the default needs the lock
+        config = cls._configuration
+        if config is not None:
+            return config
+
         with cls._lock:
             if cls._configuration is None:
                 cls._configuration = Configuration()
@@ -207,9 +303,13 @@ class ConfigurationManager:
 
     @classmethod
     def reset(cls) -> None:
-        """Reset the global configuration to default."""
+        """Reset the global configuration to default.
+
+        Environment variables are read again for the next Configuration.
+        """
         with cls._lock:
             cls._configuration = None
+        _reset_env_cache()
 
     @classmethod
     def configure(cls, **kwargs: Any) -> Configuration:
@@ -1,21 +1,30 @@
 """HTTP connection handling for scope-client.
 
-This module provides the Connection class that wraps httpx for making
-HTTP requests to the Scope API with retry logic, error handling, and telemetry.
+This module provides the Connection and AsyncConnection classes that wrap
+httpx for making HTTP requests to the Scope API with retry logic, error
+handling, and telemetry.
 """
 
+import asyncio
 import contextlib
 import random
+import threading
 import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Optional
 
 import httpx
 
+from scope_client._json import loads as json_loads
 from scope_client._telemetry import (
     ErrorInfo,
     RequestInfo,
     ResponseInfo,
     Telemetry,
+    TelemetryHooks,
+    emit_in_background,
     generate_request_id,
     redact_headers,
 )
@@ -29,10 +38,363 @@ from scope_client.errors import (
 from scope_client.token_manager import TokenManager
 
 # HTTP status codes that should trigger a retry
-RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
+# Connection pool size, and idle connections kept open for reuse
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
 
-class Connection:
+# Stands for a response body that has not been parsed as JSON yet
+_UNPARSED: Any = object()
+
+
+@dataclass
+class ConditionalResponse:
+    """Result of a conditional GET request.
+
+    Args:
+        data: Parsed JSON response, or None if the resource was not modified.
+        not_modified: True if the server answered 304 Not Modified.
+        etag: ETag header of the response, if any.
+        last_modified: Last-Modified header of the response, if any.
+    """
+
+    data: Any
+    not_modified: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class BaseConnection:
+    """Shared request handling for synchronous and asynchronous connections.
+
+    Holds the configuration and token manager, and builds headers, errors,
+    backoff delays and telemetry events. Subclasses own the httpx client and
+    the request loop.
+
+    Args:
+        config: Configuration instance with API settings.
+        telemetry: Per-client telemetry hooks notified along with the
+            global Telemetry callbacks.
+    """
+
+    def __init__(self, config: Configuration, telemetry: Optional[TelemetryHooks] = None) -> None:
+        self._config = config
+        self._token_manager = TokenManager(config)
+        self._telemetry = telemetry if telemetry is not None else TelemetryHooks()
+
+        # The default headers only depend on the configuration, which cannot
+        # change, so build them (and their telemetry copy) once per connection
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": f"scope-client-python/{VERSION}",
+        }
+        if config.environment:
+            headers["X-Scope-Environment"] = config.environment
+        self._headers = headers
+        # Shared by every request event of this connection, so read-only
+        self._telemetry_headers: Mapping[str, str] = MappingProxyType(redact_headers(dict(headers)))
+
+        # Read on every retry, so kept as floats on the connection
+        self._retry_base_delay = float(config.retry_base_delay)
+        self._retry_max_delay = float(config.retry_max_delay)
+
+    def _default_headers(self) -> dict[str, str]:
+        """Get default headers for all requests.
+
+        Returns:
+            Dictionary of default headers, shared by all calls. Callers must
+            not modify it.
+        """
+        return self._headers
+
+    def _client_options(self) -> dict[str, Any]:
+        """Get keyword arguments for creating the httpx client.
+
+        Returns:
+            Options shared by httpx.Client and httpx.AsyncClient.
+        """
+        return {
+            "base_url": self._config.api_url,
+            "timeout": httpx.Timeout(
+                timeout=self._config.timeout,
+                connect=self._config.open_timeout,
+            ),
+            "headers": self._default_headers(),
+            "limits": httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            "http2": self._config.http2,
+        }
+
+    def _get_authorization(self) -> str:
+        """Get the current Authorization header value with a fresh token.
+
+        Returns:
+            Bearer authorization value.
+        """
+        return f"Bearer {self._token_manager.get_access_token()}"
+
+    def _invalidate_authorization(self, authorization: str) -> None:
+        """Drop the token of an Authorization value the API rejected.
+
+        Args:
+            authorization: Bearer authorization value that was sent.
+        """
+        self._token_manager.invalidate(authorization[7:])
+
+    @staticmethod
+    def _conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> dict[str, str]:
+        """Build conditional request headers from cached validators.
+
+        Args:
+            etag: ETag from a previous response.
+            last_modified: Last-Modified value from a previous response.
+
+        Returns:
+            Dictionary with If-None-Match / If-Modified-Since headers.
+        """
+        headers: dict[str, str] = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _conditional_response(
+        self,
+        response: httpx.Response,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: Any = _UNPARSED,
+    ) -> ConditionalResponse:
+        """Build the result of a conditional GET request.
+
+        Args:
+            response: httpx Response object.
+            etag: ETag sent with the request, kept if a 304 omits it.
+            last_modified: Last-Modified sent with the request, kept if a 304 omits it.
+            body: Response body already parsed by telemetry, if any.
+
+        Returns:
+            ConditionalResponse with the parsed body and response validators.
+
+        Raises:
+            ApiError: On API errors (4xx, 5xx).
+        """
+        not_modified = response.status_code == 304
+        return ConditionalResponse(
+            data=None if not_modified else self._handle_response(response, body),
+            not_modified=not_modified,
+            etag=response.headers.get("ETag", etag if not_modified else None),
+            last_modified=response.headers.get(
+                "Last-Modified", last_modified if not_modified else None
+            ),
+        )
+
+    def _handle_response(self, response: httpx.Response, body: Any = _UNPARSED) -> Any:
+        """Handle HTTP response.
+
+        Args:
+            response: httpx Response object.
+            body: Response body already parsed by telemetry, if any.
+
+        Returns:
+            Parsed JSON response data.
+
+        Raises:
+            ApiError: On API errors (4xx, 5xx).
+        """
+        if response.status_code >= 400:
+            raise self._error_from_response(response)
+
+        if body is not _UNPARSED:
+            return body
+
+        # Handle empty responses
+        if not response.content:
+            return None
+
+        # Parse the bytes httpx read from the socket as they are; decoding
+        # them to str first would copy the whole body for nothing
+        return json_loads(response.content)
+
+    def _error_from_response(self, response: httpx.Response) -> Exception:
+        """Create appropriate error from HTTP response.
+
+        Args:
+            response: httpx Response object.
+
+        Returns:
+            Appropriate exception instance.
+        """
+        body = response.text
+        error_code = None
+        message = None
+        request_id = response.headers.get("X-Request-ID")
+        retry_after = None
+
+        # Try to parse error details from JSON body
+        try:
+            data = json_loads(response.content)
+            if isinstance(data, dict):
+                error_code = data.get("error", {}).get("code")
+                message = data.get("error", {}).get("message")
+        except Exception:
+            pass
+
+        # Get Retry-After for rate limit errors
+        if response.status_code == 429:
+            retry_after_header = response.headers.get("Retry-After")
+            if retry_after_header:
+                with contextlib.suppress(ValueError):
+                    retry_after = int(retry_after_header)
+
+        return error_from_response(
+            status_code=response.status_code,
+            body=body,
+            error_code=error_code,
+            request_id=request_id,
+            message=message,
+            retry_after=retry_after,
+        )
+
+    def _calculate_backoff(self, attempt: int) -> float:
+        """Calculate exponential backoff with jitter.
+
+        Args:
+            attempt: Current attempt number (1-based).
+
+        Returns:
+            Wait time in seconds.
+        """
+        # Exponential backoff: base * 2^(attempt-1)
+        delay = self._retry_base_delay * (1 << (attempt - 1))
+
+        # Add jitter (±25%)
+        delay += delay * 0.25 * (2.0 * random.random() - 1.0)
+
+        # Cap at max delay
+        return min(delay, self._retry_max_delay)
+
+    def _retry_after(self, response: httpx.Response, attempt: int) -> float:
+        """Get the wait before retrying a failed response.
+
+        Args:
+            response: The retryable HTTP response.
+            attempt: Current attempt number (1-based).
+
+        Returns:
+            The Retry-After header in seconds if it is a number, otherwise
+            the backoff delay for the attempt; at most retry_max_delay.
+        """
+        retry_after = response.headers.get("Retry-After")
+        # Checked up front, as raising ValueError costs more than the parse;
+        # HTTP dates and other values fall back to the backoff delay
+        if retry_after and retry_after.replace(".", "", 1).isdecimal():
+            # Capped like the backoff, so a huge value cannot block the caller
+            # for hours (or overflow time.sleep)
+            return min(float(retry_after), self._retry_max_delay)
+        return self._calculate_backoff(attempt)
+
+    def _emit_request_telemetry(
+        self,
+        request_id: str,
+        method: str,
+        path: str,
+        body: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Emit telemetry for a request.
+
+        Args:
+            request_id: Unique request identifier.
+            method: HTTP method.
+            path: API path, reported as the full URL.
+            body: Request body.
+        """
+        # httpx resolves the path against its base_url, so the full URL is
+        # only built here, for telemetry
+        info = RequestInfo(
+            request_id=request_id,
+            method=method,
+            url=self._config.api_url + "/" + path,
+            headers=self._telemetry_headers,
+            body=body,
+        )
+        if self._config.telemetry_background:
+            emit_in_background(info, (Telemetry.emit_request, self._telemetry.emit_request))
+        else:
+            Telemetry.emit_request(info)
+            self._telemetry.emit_request(info)
+
+    def _emit_response_telemetry(
+        self,
+        request_id: str,
+        response: httpx.Response,
+        elapsed_ms: float,
+    ) -> Any:
+        """Emit telemetry for a response.
+
+        Args:
+            request_id: Unique request identifier.
+            response: HTTP response.
+            elapsed_ms: Request duration in milliseconds.
+
+        Returns:
+            The parsed JSON body, so the response is not parsed again, or
+            _UNPARSED if the body is not valid JSON.
+        """
+        parsed: Any
+        try:
+            parsed = body = json_loads(response.content) if response.content else None
+        except Exception:
+            parsed = _UNPARSED
+            body = response.text
+
+        info = ResponseInfo(
+            request_id=request_id,
+            status_code=response.status_code,
+            headers=response.headers,
+            body=body,
+            elapsed_ms=elapsed_ms,
+        )
+        if self._config.telemetry_background:
+            emit_in_background(info, (Telemetry.emit_response, self._telemetry.emit_response))
+        else:
+            Telemetry.emit_response(info)
+            self._telemetry.emit_response(info)
+        return parsed
+
+    def _emit_error_telemetry(
+        self,
+        request_id: str,
+        error: Exception,
+        elapsed_ms: float,
+    ) -> None:
+        """Emit telemetry for an error.
+
+        Args:
+            request_id: Unique request identifier.
+            error: The exception that occurred.
+            elapsed_ms: Time elapsed before error.
+        """
+        info = ErrorInfo(
+            request_id=request_id,
+            error=error,
+            elapsed_ms=elapsed_ms,
+        )
+        if self._config.telemetry_background:
+            emit_in_background(info, (Telemetry.emit_error, self._telemetry.emit_error))
+        else:
+            Telemetry.emit_error(info)
+            self._telemetry.emit_error(info)
+
+
+class Connection(BaseConnection):
     """HTTP connection handler for the Scope API.
 
     Manages HTTP requests with automatic retries, authentication,
@@ -40,6 +402,8 @@ class Connection:
 
     Args:
         config: Configuration instance with API settings.
+        telemetry: Per-client telemetry hooks notified along with the
+            global Telemetry callbacks.
 
     Example:
         >>> from scope_client.configuration import Configuration
@@ -48,10 +412,10 @@ class Connection:
         >>> data = conn.get("prompts/my-prompt")
     """
 
-    def __init__(self, config: Configuration) -> None:
-        self._config = config
+    def __init__(self, config: Configuration, telemetry: Optional[TelemetryHooks] = None) -> None:
+        super().__init__(config, telemetry)
         self._client: Optional[httpx.Client] = None
-        self._token_manager = TokenManager(config)
+        self._client_lock = threading.Lock()
 
     @property
     def client(self) -> httpx.Client:
@@ -60,58 +424,61 @@ class Connection:
         Returns:
             Configured httpx.Client instance.
         """
-        if self._client is None:
-            self._client = httpx.Client(
-                base_url=self._config.api_url,
-                timeout=httpx.Timeout(
-                    timeout=self._config.timeout,
-                    connect=self._config.open_timeout,
-                ),
-                headers=self._default_headers(),
-            )
-        return self._client
-
-    def _default_headers(self) -> dict[str, str]:
-        """Get default headers for all requests.
-
-        Returns:
-            Dictionary of default headers.
-        """
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": f"scope-client-python/{VERSION}",
-        }
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client(**self._client_options())
+        return client
 
-        if self._config.environment:
-            headers["X-Scope-Environment"] = self._config.environment
-
-        return headers
+    def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """Make a GET request.
 
-    def _get_auth_header(self) -> dict[str, str]:
-        """Get current authorization header with fresh token.
+        Args:
+            path: API path (appended to base URL).
+            params: Optional query parameters.
 
         Returns:
-            Dictionary with Authorization header.
+            Parsed JSON response.
+
+        Raises:
+            ApiError: On API errors.
+            ConnectionError: On connection failures.
+            TimeoutError: On request timeout.
         """
-        return {"Authorization": f"Bearer {self._token_manager.get_access_token()}"}
+        return self._handle_response(*self._send("GET", path, params=params))
 
-    def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
-        """Make a GET request.
+    def get_conditional(
+        self,
+        path: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> ConditionalResponse:
+        """Make a conditional GET request.
+
+        Sends If-None-Match / If-Modified-Since for the given validators so
+        the server can answer 304 Not Modified without a response body.
 
         Args:
             path: API path (appended to base URL).
+            etag: ETag from a previous response.
+            last_modified: Last-Modified value from a previous response.
             params: Optional query parameters.
 
         Returns:
-            Parsed JSON response.
+            ConditionalResponse with the parsed body and response validators.
 
         Raises:
             ApiError: On API errors.
             ConnectionError: On connection failures.
             TimeoutError: On request timeout.
         """
-        return self._request("GET", path, params=params)
+        response, body = self._send(
+            "GET", path, params=params, headers=self._conditional_headers(etag, last_modified)
+        )
+        return self._conditional_response(response, etag, last_modified, body)
 
     def post(self, path: str, data: Optional[dict[str, Any]] = None) -> Any:
         """Make a POST request.
@@ -128,7 +495,7 @@ class Connection:
             ConnectionError: On connection failures.
             TimeoutError: On request timeout.
         """
-        return self._request("POST", path, json=data)
+        return self._handle_response(*self._send("POST", path, json=data))
 
     def put(self, path: str, data: Optional[dict[str, Any]] = None) -> Any:
         """Make a PUT request.
@@ -145,7 +512,7 @@ class Connection:
             ConnectionError: On connection failures.
             TimeoutError: On request timeout.
         """
-        return self._request("PUT", path, json=data)
+        return self._handle_response(*self._send("PUT", path, json=data))
 
     def delete(self, path: str) -> Any:
         """Make a DELETE request.
@@ -161,302 +528,368 @@ class Connection:
             ConnectionError: On connection failures.
             TimeoutError: On request timeout.
         """
-        return self._request("DELETE", path)
+        return self._handle_response(*self._send("DELETE", path))
 
-    def _request(
+    def _send(
         self,
         method: str,
         path: str,
         params: Optional[dict[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
-    ) -> Any:
-        """Make an HTTP request with retry logic.
+        headers: Optional[dict[str, str]] = None,
+    ) -> tuple[httpx.Response, Any]:
+        """Send an HTTP request with retry logic.
 
         Args:
             method: HTTP method.
             path: API path.
             params: Query parameters.
             json: JSON body data.
+            headers: Additional request headers.
 
         Returns:
-            Parsed JSON response.
+            The raw httpx Response, and its body if response telemetry
+            already parsed it (otherwise _UNPARSED).
 
         Raises:
-            ApiError: On API errors.
+            ApiError: On non-retryable API errors.
             ConnectionError: On connection failures.
             TimeoutError: On request timeout.
         """
         request_id = generate_request_id()
-        url = f"{self._config.api_url}/{path}"
+        # Read once; each hook below is then a local check plus a tuple test
+        telemetry = self._config.telemetry_enabled
+        hooks = self._telemetry
+        max_retries = self._config.max_retries
+        # One headers dict is reused by every attempt of this request
+        request_headers = (
+            {**headers, "X-Request-ID": request_id} if headers else {"X-Request-ID": request_id}
+        )
+        # The token is read once per request. If the API rejects it anyway
+        # (e.g. it was revoked), a new one is fetched and the attempt repeated.
+        request_headers["Authorization"] = self._get_authorization()
+        reauthenticated = False
         attempts = 0
         last_error: Optional[Exception] = None
 
-        while attempts <= self._config.max_retries:
+        # Durations use perf_counter(), which wall-clock adjustments cannot skew
+        while attempts <= max_retries:
             attempts += 1
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
-                # Emit request telemetry
-                if self._config.telemetry_enabled:
-                    self._emit_request_telemetry(request_id, method, url, json)
+                # Emit request telemetry (skipped when no hooks are set)
+                if telemetry and (Telemetry._request_callbacks or hooks._request_callbacks):
+                    self._emit_request_telemetry(request_id, method, path, json)
 
                 response = self.client.request(
                     method=method,
                     url=path,
                     params=params,
                     json=json,
-                    headers={"X-Request-ID": request_id, **self._get_auth_header()},
+                    headers=request_headers,
                 )
 
-                elapsed_ms = (time.time() - start_time) * 1000
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-                # Emit response telemetry
-                if self._config.telemetry_enabled:
-                    self._emit_response_telemetry(request_id, response, elapsed_ms)
+                # Emit response telemetry, keeping the body it parsed
+                body = _UNPARSED
+                if telemetry and (Telemetry._response_callbacks or hooks._response_callbacks):
+                    body = self._emit_response_telemetry(request_id, response, elapsed_ms)
 
-                # Handle response
-                return self._handle_response(response)
+                if response.status_code == 401 and not reauthenticated:
+                    reauthenticated = True
+                    self._invalidate_authorization(request_headers["Authorization"])
+                    request_headers["Authorization"] = self._get_authorization()
+                    # Not a retry, so it does not count against max_retries
+                    attempts -= 1
+                    continue
+
+                # Rate limits and server errors are retried, honouring Retry-After
+                if response.status_code in RETRYABLE_STATUS_CODES and attempts <= max_retries:
+                    time.sleep(self._retry_after(response, attempts))
+                    continue
+
+                return response, body
 
             except httpx.TimeoutException as e:
-                elapsed_ms = (time.time() - start_time) * 1000
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
                 last_error = TimeoutError(
                     message=f"Request timed out after {self._config.timeout}s",
                     original_error=e,
                 )
 
-                if self._config.telemetry_enabled:
+                if telemetry and (Telemetry._error_callbacks or hooks._error_callbacks):
                     self._emit_error_telemetry(request_id, last_error, elapsed_ms)
 
                 # Retry on timeout
-                if attempts <= self._config.max_retries:
+                if attempts <= max_retries:
                     self._wait_for_retry(attempts)
                     continue
                 raise last_error from e
 
             except httpx.ConnectError as e:
-                elapsed_ms = (time.time() - start_time) * 1000
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
                 last_error = ConnectionError(
                     message=f"Failed to connect to {self._config.base_url}",
                     original_error=e,
                 )
 
-                if self._config.telemetry_enabled:
+                if telemetry and (Telemetry._error_callbacks or hooks._error_callbacks):
                     self._emit_error_telemetry(request_id, last_error, elapsed_ms)
 
                 # Retry on connection error
-                if attempts <= self._config.max_retries:
+                if attempts <= max_retries:
                     self._wait_for_retry(attempts)
                     continue
                 raise last_error from e
 
-            except httpx.HTTPStatusError as e:
-                elapsed_ms = (time.time() - start_time) * 1000
-                response = e.response
-
-                # Check if we should retry
-                if (
-                    response.status_code in RETRYABLE_STATUS_CODES
-                    and attempts <= self._config.max_retries
-                ):
-                    # Get Retry-After header if present
-                    retry_after = response.headers.get("Retry-After")
-                    wait_time: float
-                    if retry_after:
-                        try:
-                            wait_time = float(retry_after)
-                        except ValueError:
-                            wait_time = self._calculate_backoff(attempts)
-                    else:
-                        wait_time = self._calculate_backoff(attempts)
-
-                    time.sleep(wait_time)
-                    continue
-
-                # Not retryable or out of retries
-                raise self._error_from_response(response) from e
-
         # Should not reach here, but just in case
         if last_error:
             raise last_error
         raise ConnectionError("Request failed after all retries")
 
-    def _handle_response(self, response: httpx.Response) -> Any:
-        """Handle HTTP response.
+    def _wait_for_retry(self, attempt: int) -> None:
+        """Wait before retrying a request.
 
         Args:
-            response: httpx Response object.
+            attempt: Current attempt number (1-based).
+        """
+        wait_time = self._calculate_backoff(attempt)
+        time.sleep(wait_time)
 
-        Returns:
-            Parsed JSON response data.
+    def close(self) -> None:
+        """Close the HTTP client and release resources."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
-        Raises:
-            ApiError: On API errors (4xx, 5xx).
-        """
-        if response.status_code >= 400:
-            raise self._error_from_response(response)
+    def __enter__(self) -> "Connection":
+        """Enter context manager."""
+        return self
 
-        # Handle empty responses
-        if not response.content:
-            return None
+    def __exit__(self, *args: Any) -> None:
+        """Exit context manager and close connection."""
+        self.close()
 
-        return response.json()
 
-    def _error_from_response(self, response: httpx.Response) -> Exception:
-        """Create appropriate error from HTTP response.
+class AsyncConnection(BaseConnection):
+    """Asynchronous HTTP connection handler for the Scope API.
 
-        Args:
-            response: httpx Response object.
+    The asyncio counterpart of Connection, built on httpx.AsyncClient. All
+    requests made through one instance share its connection pool, so
+    concurrent requests (e.g. with asyncio.gather) reuse connections.
+
+    Args:
+        config: Configuration instance with API settings.
+        telemetry: Per-client telemetry hooks notified along with the
+            global Telemetry callbacks.
+
+    Example:
+        >>> conn = AsyncConnection(config)
+        >>> data = await conn.get("prompts/my-prompt/production")
+        >>> await conn.aclose()
+    """
+
+    def __init__(self, config: Configuration, telemetry: Optional[TelemetryHooks] = None) -> None:
+        super().__init__(config, telemetry)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get or create the async HTTP client.
 
         Returns:
-            Appropriate exception instance.
+            Configured httpx.AsyncClient instance.
         """
-        body = response.text
-        error_code = None
-        message = None
-        request_id = response.headers.get("X-Request-ID")
-        retry_after = None
+        # No lock needed: the event loop never switches tasks inside this check
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self._client_options())
+        return self._client
 
-        # Try to parse error details from JSON body
-        try:
-            data = response.json()
-            if isinstance(data, dict):
-                error_code = data.get("error", {}).get("code")
-                message = data.get("error", {}).get("message")
-        except Exception:
-            pass
+    async def _get_authorization_async(self) -> str:
+        """Get the current Authorization header value without blocking the event loop.
 
-        # Get Retry-After for rate limit errors
-        if response.status_code == 429:
-            retry_after_header = response.headers.get("Retry-After")
-            if retry_after_header:
-                with contextlib.suppress(ValueError):
-                    retry_after = int(retry_after_header)
+        The token manager is synchronous; when it has to fetch a new token
+        the call is moved to a worker thread.
 
-        return error_from_response(
-            status_code=response.status_code,
-            body=body,
-            error_code=error_code,
-            request_id=request_id,
-            message=message,
-            retry_after=retry_after,
-        )
+        Returns:
+            Bearer authorization value.
+        """
+        if self._token_manager._needs_refresh():
+            token = await asyncio.to_thread(self._token_manager.get_access_token)
+        else:
+            token = self._token_manager.get_access_token()
+        return f"Bearer {token}"
 
-    def _calculate_backoff(self, attempt: int) -> float:
-        """Calculate exponential backoff with jitter.
+    async def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """Make a GET request.
 
         Args:
-            attempt: Current attempt number (1-based).
+            path: API path (appended to base URL).
+            params: Optional query parameters.
 
         Returns:
-            Wait time in seconds.
-        """
-        base_delay = self._config.retry_base_delay
-        max_delay = self._config.retry_max_delay
+            Parsed JSON response.
 
-        # Exponential backoff: base * 2^(attempt-1)
-        delay = base_delay * (2 ** (attempt - 1))
+        Raises:
+            ApiError: On API errors.
+            ConnectionError: On connection failures.
+            TimeoutError: On request timeout.
+        """
+        return self._handle_response(*(await self._send("GET", path, params=params)))
 
-        # Add jitter (±25%)
-        jitter = delay * 0.25 * (2 * random.random() - 1)
-        delay += jitter
+    async def get_conditional(
+        self,
+        path: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> ConditionalResponse:
+        """Make a conditional GET request.
 
-        # Cap at max delay
-        result: float = min(delay, max_delay)
-        return result
+        Args:
+            path: API path (appended to base URL).
+            etag: ETag from a previous response.
+            last_modified: Last-Modified value from a previous response.
+            params: Optional query parameters.
 
-    def _wait_for_retry(self, attempt: int) -> None:
-        """Wait before retrying a request.
+        Returns:
+            ConditionalResponse with the parsed body and response validators.
 
-        Args:
-            attempt: Current attempt number (1-based).
+        Raises:
+            ApiError: On API errors.
+            ConnectionError: On connection failures.
+            TimeoutError: On request timeout.
         """
-        wait_time = self._calculate_backoff(attempt)
-        time.sleep(wait_time)
+        response, body = await self._send(
+            "GET", path, params=params, headers=self._conditional_headers(etag, last_modified)
+        )
+        return self._conditional_response(response, etag, last_modified, body)
 
-    def _emit_request_telemetry(
+    async def _send(
         self,
-        request_id: str,
         method: str,
-        url: str,
-        body: Optional[dict[str, Any]] = None,
-    ) -> None:
-        """Emit telemetry for a request.
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> tuple[httpx.Response, Any]:
+        """Send an HTTP request with retry logic.
 
         Args:
-            request_id: Unique request identifier.
             method: HTTP method.
-            url: Full URL.
-            body: Request body.
+            path: API path.
+            params: Query parameters.
+            json: JSON body data.
+            headers: Additional request headers.
+
+        Returns:
+            The raw httpx Response, and its body if response telemetry
+            already parsed it (otherwise _UNPARSED).
+
+        Raises:
+            ConnectionError: On connection failures.
+            TimeoutError: On request timeout.
         """
-        Telemetry.emit_request(
-            RequestInfo(
-                request_id=request_id,
-                method=method,
-                url=url,
-                headers=redact_headers(self._default_headers()),
-                body=body,
-            )
+        request_id = generate_request_id()
+        # Read once; each hook below is then a local check plus a tuple test
+        telemetry = self._config.telemetry_enabled
+        hooks = self._telemetry
+        max_retries = self._config.max_retries
+        # One headers dict is reused by every attempt of this request
+        request_headers = (
+            {**headers, "X-Request-ID": request_id} if headers else {"X-Request-ID": request_id}
         )
+        # The token is read once per request. If the API rejects it anyway
+        # (e.g. it was revoked), a new one is fetched and the attempt repeated.
+        request_headers["Authorization"] = await self._get_authorization_async()
+        reauthenticated = False
+        attempts = 0
+        last_error: Optional[Exception] = None
 
-    def _emit_response_telemetry(
-        self,
-        request_id: str,
-        response: httpx.Response,
-        elapsed_ms: float,
-    ) -> None:
-        """Emit telemetry for a response.
+        # Durations use perf_counter(), which wall-clock adjustments cannot skew
+        while attempts <= max_retries:
+            attempts += 1
+            start_time = time.perf_counter()
 
-        Args:
-            request_id: Unique request identifier.
-            response: HTTP response.
-            elapsed_ms: Request duration in milliseconds.
-        """
-        try:
-            body = response.json() if response.content else None
-        except Exception:
-            body = response.text
+            try:
+                if telemetry and (Telemetry._request_callbacks or hooks._request_callbacks):
+                    self._emit_request_telemetry(request_id, method, path, json)
 
-        Telemetry.emit_response(
-            ResponseInfo(
-                request_id=request_id,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                body=body,
-                elapsed_ms=elapsed_ms,
-            )
-        )
+                response = await self.client.request(
+                    method=method,
+                    url=path,
+                    params=params,
+                    json=json,
+                    headers=request_headers,
+                )
 
-    def _emit_error_telemetry(
-        self,
-        request_id: str,
-        error: Exception,
-        elapsed_ms: float,
-    ) -> None:
-        """Emit telemetry for an error.
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-        Args:
-            request_id: Unique request identifier.
-            error: The exception that occurred.
-            elapsed_ms: Time elapsed before error.
-        """
-        Telemetry.emit_error(
-            ErrorInfo(
-                request_id=request_id,
-                error=error,
-                elapsed_ms=elapsed_ms,
-            )
-        )
+                body = _UNPARSED
+                if telemetry and (Telemetry._response_callbacks or hooks._response_callbacks):
+                    body = self._emit_response_telemetry(request_id, response, elapsed_ms)
 
-    def close(self) -> None:
-        """Close the HTTP client and release resources."""
+                if response.status_code == 401 and not reauthenticated:
+                    reauthenticated = True
+                    self._invalidate_authorization(request_headers["Authorization"])
+                    request_headers["Authorization"] = await self._get_authorization_async()
+                    # Not a retry, so it does not count against max_retries
+                    attempts -= 1
+                    continue
+
+                if response.status_code in RETRYABLE_STATUS_CODES and attempts <= max_retries:
+                    await asyncio.sleep(self._retry_after(response, attempts))
+                    continue
+
+                return response, body
+
+            except httpx.TimeoutException as e:
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                last_error = TimeoutError(
+                    message=f"Request timed out after {self._config.timeout}s",
+                    original_error=e,
+                )
+
+                if telemetry and (Telemetry._error_callbacks or hooks._error_callbacks):
+                    self._emit_error_telemetry(request_id, last_error, elapsed_ms)
+
+                if attempts <= max_retries:
+                    await asyncio.sleep(self._calculate_backoff(attempts))
+                    continue
+                raise last_error from e
+
+            except httpx.ConnectError as e:
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                last_error = ConnectionError(
+                    message=f"Failed to connect to {self._config.base_url}",
+                    original_error=e,
+                )
+
+                if telemetry and (Telemetry._error_callbacks or hooks._error_callbacks):
+                    self._emit_error_telemetry(request_id, last_error, elapsed_ms)
+
+                if attempts <= max_retries:
+                    await asyncio.sleep(self._calculate_backoff(attempts))
+                    continue
+                raise last_error from e
+
+        # Should not reach here, but just in case
+        if last_error:
+            raise last_error
+        raise ConnectionError("Request failed after all retries")
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client and release resources."""
         if self._client is not None:
-            self._client.close()
+            await self._client.aclose()
             self._client = None
 
-    def __enter__(self) -> "Connection":
-        """Enter context manager."""
+    async def __aenter__(self) -> "AsyncConnection":
+        """Enter async context manager."""
         return self
 
-    def __exit__(self, *args: Any) -> None:
-        """Exit context manager and close connection."""
-        self.close()
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit async context manager and close connection."""
+        await self.aclose()
@@ -33,24 +33,34 @@ class ScopeError(Exception):
         self.error_code = error_code
         self.request_id = request_id
 
+    # Error attributes are not changed after construction, so the formatted
+    # strings are built on first use and reused by later str() / repr() calls
+    # (e.g. when the same error is logged on every retry)
+    _str: Optional[str] = None
+    _repr: Optional[str] = None
+
     def __str__(self) -> str:
-        parts = [self.message]
-        if self.http_status:
-            parts.append(f"HTTP Status: {self.http_status}")
-        if self.error_code:
-            parts.append(f"Error Code: {self.error_code}")
-        if self.request_id:
-            parts.append(f"Request ID: {self.request_id}")
-        return " | ".join(parts)
+        if self._str is None:
+            parts = [self.message]
+            if self.http_status:
+                parts.append(f"HTTP Status: {self.http_status}")
+            if self.error_code:
+                parts.append(f"Error Code: {self.error_code}")
+            if self.request_id:
+                parts.append(f"Request ID: {self.request_id}")
+            self._str = " | ".join(parts)
+        return self._str
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}("
-            f"message={self.message!r}, "
-            f"http_status={self.http_status!r}, "
-            f"error_code={self.error_code!r}, "
-            f"request_id={self.request_id!r})"
-        )
+        if self._repr is None:
+            self._repr = (
+                f"{self.__class__.__name__}("
+                f"message={self.message!r}, "
+                f"http_status={self.http_status!r}, "
+                f"error_code={self.error_code!r}, "
+                f"request_id={self.request_id!r})"
+            )
+        return self._repr
 
 
 # Configuration Errors
@@ -334,6 +344,16 @@ class NoProductionVersionError(ResourceError):
         return f"NoProductionVersionError(prompt_id={self.prompt_id!r})"
 
 
+# Status codes with a dedicated error class
+_ERROR_CLASSES: dict[int, type[ApiError]] = {
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+    409: ConflictError,
+    429: RateLimitError,
+}
+
+
 def error_from_response(
     status_code: int,
     body: Optional[str] = None,
@@ -355,16 +375,8 @@ def error_from_response(
     Returns:
         Appropriate ApiError subclass instance.
     """
-    error_classes = {
-        401: AuthenticationError,
-        403: AuthorizationError,
-        404: NotFoundError,
-        409: ConflictError,
-        429: RateLimitError,
-    }
-
-    if status_code in error_classes:
-        error_class = error_classes[status_code]
+    error_class = _ERROR_CLASSES.get(status_code)
+    if error_class is not None:
         kwargs: dict[str, Any] = {
             "http_body": body,
             "error_code": error_code,
@@ -374,8 +386,7 @@ def error_from_response(
             kwargs["message"] = message
         if status_code == 429 and retry_after is not None:
             kwargs["retry_after"] = retry_after
-        result: ApiError = error_class(**kwargs)
-        return result
+        return error_class(**kwargs)
 
     if 500 <= status_code < 600:
         return ServerError(
@@ -5,13 +5,25 @@ in prompt templates.
 """
 
 import re
-from typing import Optional
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 from scope_client.errors import MissingVariableError, ValidationError
 
 # Pattern to match {{variable_name}}
 VARIABLE_PATTERN = re.compile(r"\{\{(\w+)\}\}")
 
+# Templates with at most this many distinct variables get a generated renderer
+COMPILE_MAX_VARIABLES = 4
+
+# Larger templates get one once they have been rendered this many times, when
+# the faster renders have paid for the cost of generating it
+COMPILE_AFTER_RENDERS = 64
+
+# Number of parsed templates kept by get_renderer()
+RENDERER_CACHE_SIZE = 256
+
 
 class Renderer:
     """Template renderer for variable substitution.
@@ -44,10 +56,30 @@ class Renderer:
         declared_variables: Optional[list[str]] = None,
     ) -> None:
         self._content = content
-        self._declared_variables = (
-            set(declared_variables) if declared_variables is not None else None
+        self._declared_variables: Optional[frozenset[str]] = (
+            frozenset(declared_variables) if declared_variables is not None else None
         )
 
+        # Parse the template once. Splitting on a pattern with a single capture
+        # group interleaves literals (even indices) with variable names (odd
+        # indices), so rendering only has to fill in the odd slots and join.
+        self._segments: list[str] = VARIABLE_PATTERN.split(content)
+        self._var_positions: tuple[tuple[int, str], ...] = tuple(
+            (index, self._segments[index]) for index in range(1, len(self._segments), 2)
+        )
+        # Distinct names in template order
+        self._variables: tuple[str, ...] = tuple(
+            dict.fromkeys(name for _, name in self._var_positions)
+        )
+        self._required: frozenset[str] = frozenset(self._variables)
+        self._is_static = not self._var_positions
+        self._fill: Optional[Callable[[Mapping[str, Any]], str]] = None
+        # Unsynchronized: shared renderers may lose concurrent increments,
+        # which only delays compiling (see get_renderer)
+        self._renders = 0
+        if not self._is_static and len(self._required) <= COMPILE_MAX_VARIABLES:
+            self._fill = _compile_fill(self._segments)
+
     @property
     def content(self) -> str:
         """Get the template content."""
@@ -58,9 +90,23 @@ class Renderer:
         """Extract all variable names from the template.
 
         Returns:
-            List of unique variable names found in the template.
+            List of unique variable names found in the template, in order
+            of first appearance.
         """
-        return list(set(VARIABLE_PATTERN.findall(self._content)))
+        return list(self._variables)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the renderer by its template.
+
+        The generated fill function cannot be pickled, so unpickling parses
+        the template again, through get_renderer() to share a cached
+        Renderer where there is one.
+
+        Returns:
+            get_renderer and its arguments.
+        """
+        declared = self._declared_variables
+        return (get_renderer, (self._content, sorted(declared) if declared is not None else None))
 
     def render(self, **values: str) -> str:
         """Render the template with provided values.
@@ -84,22 +130,113 @@ class Renderer:
             >>> renderer.render(name="Alice", count="5")
             'Hello, Alice! You have 5 messages.'
         """
+        # Validate provided variables against declared variables. The check is
+        # inlined so templates without declared variables skip it with a
+        # single comparison; the method call only happens on the error path.
+        declared = self._declared_variables
+        if declared is not None and not declared.issuperset(values):
+            self._validate_variables(values)
+
+        # Templates without placeholders render to themselves
+        if self._is_static:
+            return self._content
+
+        # Missing variables are detected by the substitution itself: looking
+        # one up raises KeyError, and only then are the keys compared and the
+        # list of missing names computed
+        try:
+            if self._fill is not None:
+                return self._fill(values)
+
+            self._renders += 1
+            if self._renders >= COMPILE_AFTER_RENDERS:
+                self._fill = _compile_fill(self._segments)
+                return self._fill(values)
+
+            # Fill the placeholder slots of the pre-split template. This measures
+            # about twice as fast as str.format_map on an equivalent "{name}"
+            # template, and unlike format_map it handles numeric variable names
+            # such as {{0}} and literal braces without any escaping.
+            parts = self._segments.copy()
+            for index, name in self._var_positions:
+                parts[index] = str(values[name])
+
+            return "".join(parts)
+        except KeyError:
+            # A KeyError raised while converting a value is not ours
+            if values.keys() >= self._required:
+                raise
+            raise self._missing_variable_error(values) from None
+
+    def render_many(self, values_list: Iterable[Mapping[str, Any]]) -> list[str]:
+        """Render the template once for each set of values.
+
+        Equivalent to calling render() for each mapping, but every mapping
+        is validated up front and the rendering then runs in a single loop:
+        a list comprehension over the generated fill function, or a segment
+        buffer that is allocated once and refilled for every render. Batches
+        large enough to pay for generating a fill function get one.
+
+        Args:
+            values_list: Mappings of variable names to values.
 
-        # Validate provided variables against declared variables
-        self._validate_variables(values)
+        Returns:
+            Rendered strings, in the same order as values_list.
 
-        # Perform substitution
-        result = self._content
-        for key, value in values.items():
-            pattern = "{{" + key + "}}"
-            result = result.replace(pattern, str(value))
+        Raises:
+            ValidationError: If unknown variables are provided (when declared_variables is set).
+            MissingVariableError: If required variables are not provided.
 
-        # Check for unrendered variables
-        self._check_unrendered_variables(result)
+        Example:
+            >>> renderer = Renderer("Hello, {{name}}!")
+            >>> renderer.render_many([{"name": "Alice"}, {"name": "Bob"}])
+            ['Hello, Alice!', 'Hello, Bob!']
+        """
+        rows = list(values_list)
+        required = self._required
+        declared = self._declared_variables
+        for values in rows:
+            if declared is not None and not declared.issuperset(values):
+                self._validate_variables(values)
+            if not values.keys() >= required:
+                raise self._missing_variable_error(values)
+
+        if self._is_static:
+            return [self._content] * len(rows)
+
+        fill = self._fill
+        if fill is None and self._renders + len(rows) >= COMPILE_AFTER_RENDERS:
+            fill = self._fill = _compile_fill(self._segments)
+        if fill is not None:
+            return [fill(values) for values in rows]
+        self._renders += len(rows)
+
+        parts = self._segments.copy()
+        rendered = [""] * len(rows)
+        for row, values in enumerate(rows):
+            for index, name in self._var_positions:
+                parts[index] = str(values[name])
+            rendered[row] = "".join(parts)
+
+        return rendered
+
+    def _missing_variable_error(self, values: Mapping[str, Any]) -> MissingVariableError:
+        """Build the error for variables missing from a render call.
 
-        return result
+        Args:
+            values: Values passed to the render call.
 
-    def _validate_variables(self, values: dict[str, str]) -> None:
+        Returns:
+            MissingVariableError listing the missing names in template order.
+        """
+        return MissingVariableError(
+            missing_variables=list(
+                dict.fromkeys(name for _, name in self._var_positions if name not in values)
+            ),
+            template=self._content,
+        )
+
+    def _validate_variables(self, values: Mapping[str, Any]) -> None:
         """Validate that all provided variables are declared.
 
         Args:
@@ -108,33 +245,46 @@ class Renderer:
         Raises:
             ValidationError: If unknown variables are provided.
         """
-        if self._declared_variables is None:
+        declared = self._declared_variables
+        if declared is None or declared.issuperset(values):
             return
 
-        provided_keys = set(values.keys())
-        unknown_keys = provided_keys - self._declared_variables
+        unknown_keys = values.keys() - declared
+        raise ValidationError(
+            f"Unknown variables: {', '.join(sorted(unknown_keys))}. "
+            f"Declared variables are: {', '.join(sorted(declared))}"
+        )
 
-        if unknown_keys:
-            raise ValidationError(
-                f"Unknown variables: {', '.join(sorted(unknown_keys))}. "
-                f"Declared variables are: {', '.join(sorted(self._declared_variables))}"
-            )
 
-    def _check_unrendered_variables(self, result: str) -> None:
-        """Check for any unrendered variables in the result.
+def _compile_fill(segments: list[str]) -> Callable[[Mapping[str, Any]], str]:
+    """Generate a function that renders pre-split template segments.
 
-        Args:
-            result: The rendered template string.
+    The generated function is a single f-string, which CPython assembles in
+    one step instead of a Python-level loop plus join. Segment text and
+    variable names are bound as globals of the generated function, so the
+    template content never appears in the generated source.
 
-        Raises:
-            MissingVariableError: If unrendered variables are found.
-        """
-        unrendered = VARIABLE_PATTERN.findall(result)
-        if unrendered:
-            raise MissingVariableError(
-                missing_variables=list(set(unrendered)),
-                template=self._content,
-            )
+    Args:
+        segments: Template split by VARIABLE_PATTERN (variable names at odd indices).
+
+    Returns:
+        Function taking a mapping of variable values and returning the rendered string.
+    """
+    namespace: dict[str, Any] = {}
+    fields = []
+    for index, segment in enumerate(segments):
+        if index % 2:
+            fields.append(f"{{values[_{index}]!s}}")
+        elif segment:
+            fields.append(f"{{_{index}}}")
+        else:
+            continue
+        namespace[f"_{index}"] = segment
+
+    source = f'def fill(values):\n    return f"{"".join(fields)}"\n'
+    exec(compile(source, "<scope_client.renderer>", "exec"), namespace)
+    fill: Callable[[Mapping[str, Any]], str] = namespace["fill"]
+    return fill
 
 
 def render_template(
@@ -156,8 +306,52 @@ def render_template(
         >>> render_template("Hello, {{name}}!", name="World")
         'Hello, World!'
     """
-    renderer = Renderer(content, declared_variables)
-    return renderer.render(**values)
+    return get_renderer(content, declared_variables).render(**values)
+
+
+def get_renderer(
+    content: str,
+    declared_variables: Optional[Sequence[str]] = None,
+) -> Renderer:
+    """Get a Renderer for a template, reusing one parsed earlier.
+
+    Parsing splits the template and may generate a fill function, so
+    recently used templates are kept and shared. A Renderer's only mutable
+    state is its render counter and its generated fill function, which may
+    be updated from several threads at once: the counter is approximate
+    (concurrent increments can be lost, so compiling may happen a little
+    later), and swapping in the fill function is idempotent, since every
+    thread generates an equivalent one. Sharing renderers between prompt
+    versions is therefore safe. The cache is keyed on the template content
+    itself, so an edited prompt always gets a new Renderer.
+
+    Args:
+        content: Template content with {{variable}} placeholders.
+        declared_variables: Optional list of declared variables for validation.
+
+    Returns:
+        Renderer for the template.
+
+    Example:
+        >>> get_renderer("Hello, {{name}}!") is get_renderer("Hello, {{name}}!")
+        True
+    """
+    declared = tuple(declared_variables) if declared_variables is not None else None
+    return _cached_renderer(content, declared)
+
+
+@lru_cache(maxsize=RENDERER_CACHE_SIZE)
+def _cached_renderer(content: str, declared_variables: Optional[tuple[str, ...]]) -> Renderer:
+    """Parse a template; memoized by get_renderer().
+
+    Args:
+        content: Template content with {{variable}} placeholders.
+        declared_variables: Declared variables as a hashable tuple, or None.
+
+    Returns:
+        Renderer for the template.
+    """
+    return Renderer(content, list(declared_variables) if declared_variables is not None else None)
 
 
 def extract_variables(content: str) -> list[str]:
@@ -167,10 +361,10 @@ def extract_variables(content: str) -> list[str]:
         content: Template content with {{variable}} placeholders.
 
     Returns:
-        List of unique variable names.
+        List of unique variable names, in order of first appearance.
 
     Example:
         >>> extract_variables("Hello, {{name}}! You have {{count}} messages.")
         ['name', 'count']
     """
-    return list(set(VARIABLE_PATTERN.findall(content)))
+    return list(dict.fromkeys(VARIABLE_PATTERN.findall(content)))
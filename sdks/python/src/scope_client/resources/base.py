@@ -8,7 +8,7 @@ import json
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
-    from scope_client.client import ScopeClient
+    from scope_client.client import BaseClient
 
 
 class Resource:
@@ -19,7 +19,7 @@ class Resource:
 
     Args:
         data: Dictionary of resource data from API response.
-        client: Optional ScopeClient reference for lazy loading related resources.
+        client: Optional client reference for lazy loading related resources.
 
     Example:
         >>> data = {"id": "123", "name": "My Resource", "is_active": True}
@@ -32,28 +32,98 @@ class Resource:
         '123'
     """
 
+    __slots__ = ("_data", "_client", "_wrapped", "_hash")
+
     def __init__(
         self,
         data: dict[str, Any],
-        client: Optional["ScopeClient"] = None,
+        client: Optional["BaseClient"] = None,
     ) -> None:
-        # Store raw data immutably
-        self._data = dict(data)  # Make a copy
+        # The response data is kept as is; nested dicts and lists are only
+        # wrapped when they are first accessed, so building a resource does
+        # not depend on the size of the payload
+        self._data = data
         self._client = client
+        self._wrapped: Optional[dict[str, Any]] = None
+        self._hash: Optional[int] = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Look up a field of the resource data.
+
+        Only called when normal attribute lookup fails, so methods and
+        properties take precedence over fields of the same name.
+
+        Args:
+            name: Field name.
+
+        Returns:
+            Field value, with nested dicts and lists of dicts wrapped as
+            Resources.
+
+        Raises:
+            AttributeError: If the field doesn't exist.
+        """
+        if name in _INSTANCE_ATTRIBUTES:
+            # Not set yet, e.g. while copying an instance
+            raise AttributeError(name)
+        try:
+            return self._lookup(name)
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, storing fields alongside the wrapped values.
+
+        Resources have no instance __dict__, so an assigned field is kept
+        with the wrapped values and read back by attribute and item access.
+        As before, the resource data itself is not changed.
+
+        Args:
+            name: Attribute name.
+            value: Value to set.
+        """
+        # Slots, properties and methods keep the default behaviour
+        if name in _INSTANCE_ATTRIBUTES or hasattr(type(self), name):
+            object.__setattr__(self, name, value)
+            return
+        wrapped = self._wrapped
+        if wrapped is None:
+            wrapped = self._wrapped = {}
+        wrapped[name] = value
+
+    def _lookup(self, key: str) -> Any:
+        """Get a field value, wrapping nested resources on first access.
+
+        Args:
+            key: Field name.
 
-        # Set known attributes directly
-        for key, value in self._data.items():
-            # Convert nested dicts to Resources if they look like resources
-            if isinstance(value, dict) and not self._is_metadata(key):
-                value = Resource(value, client=client)
-            elif isinstance(value, list):
-                value = [
-                    Resource(item, client=client) if isinstance(item, dict) else item
-                    for item in value
-                ]
+        Returns:
+            Field value.
+
+        Raises:
+            KeyError: If the field doesn't exist.
+        """
+        wrapped = self._wrapped
+        if wrapped is not None and key in wrapped:
+            return wrapped[key]
 
-            # Set as attribute
-            setattr(self, key, value)
+        value = self._data[key]
+        if isinstance(value, dict) and not self._is_metadata(key):
+            value = Resource(value, client=self._client)
+        elif isinstance(value, list):
+            value = [
+                Resource(item, client=self._client) if isinstance(item, dict) else item
+                for item in value
+            ]
+        else:
+            return value
+
+        if wrapped is None:
+            wrapped = self._wrapped = {}
+        wrapped[key] = value
+        return value
 
     def _is_metadata(self, key: str) -> bool:
         """Check if a key represents metadata rather than a nested resource.
@@ -70,17 +140,28 @@ class Resource:
     def raw_data(self) -> dict[str, Any]:
         """Get the raw API response data.
 
+        The resource shares its data dict instead of copying it on creation,
+        so this property returns a shallow snapshot that callers may modify.
+        Use to_dict(copy=False) to read the data without copying it.
+
         Returns:
             Dictionary of original API response data.
         """
         return dict(self._data)
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, copy: bool = True) -> dict[str, Any]:
         """Convert resource to dictionary.
 
+        Args:
+            copy: Return a deep copy of the data. With False, the resource's
+                own data dict is returned without walking it, so it must not
+                be modified.
+
         Returns:
             Dictionary representation of the resource.
         """
+        if not copy:
+            return self._data
         result: dict[str, Any] = self._serialize(self._data)
         return result
 
@@ -93,12 +174,16 @@ class Resource:
         Returns:
             Serialized value.
         """
-        if isinstance(value, Resource):
-            return value.to_dict()
-        elif isinstance(value, dict):
+        # Exact type checks first: JSON leaves make up most of a payload
+        value_type = type(value)
+        if value_type in _SCALAR_TYPES:
+            return value
+        if value_type is dict or (value_type is not list and isinstance(value, dict)):
             return {k: self._serialize(v) for k, v in value.items()}
-        elif isinstance(value, list):
+        if value_type is list or isinstance(value, list):
             return [self._serialize(item) for item in value]
+        if isinstance(value, Resource):
+            return value.to_dict()
         return value
 
     def to_json(self, **kwargs: Any) -> str:
@@ -110,7 +195,11 @@ class Resource:
         Returns:
             JSON string representation of the resource.
         """
-        return json.dumps(self.to_dict(), **kwargs)
+        if "default" in kwargs:
+            return json.dumps(self.to_dict(), **kwargs)
+        # Encode the data directly instead of copying it first; Resources
+        # nested in it are converted as the encoder reaches them
+        return json.dumps(self._data, default=_encode_resource, **kwargs)
 
     def __getitem__(self, key: str) -> Any:
         """Dictionary-like access to resource attributes.
@@ -124,9 +213,7 @@ class Resource:
         Raises:
             KeyError: If attribute doesn't exist.
         """
-        if key in self._data:
-            return getattr(self, key)
-        raise KeyError(key)
+        return self._lookup(key)
 
     def __contains__(self, key: str) -> bool:
         """Check if resource has an attribute.
@@ -149,7 +236,10 @@ class Resource:
         Returns:
             Attribute value or default.
         """
-        return getattr(self, key, default) if key in self._data else default
+        try:
+            return self._lookup(key)
+        except KeyError:
+            return default
 
     def __repr__(self) -> str:
         """Get string representation of resource.
@@ -166,6 +256,9 @@ class Resource:
     def __eq__(self, other: object) -> bool:
         """Check equality with another resource.
 
+        Resources of the same class that both have an id are equal when
+        their ids are, matching __hash__; otherwise their data is compared.
+
         Args:
             other: Object to compare.
 
@@ -174,6 +267,12 @@ class Resource:
         """
         if not isinstance(other, Resource):
             return False
+        if type(self) is type(other):
+            id_val = self._data.get("id")
+            if id_val:
+                other_id = other._data.get("id")
+                if other_id:
+                    return bool(id_val == other_id)
         return self._data == other._data
 
     def __hash__(self) -> int:
@@ -182,7 +281,50 @@ class Resource:
         Returns:
             Hash based on resource ID if present.
         """
-        id_val = self._data.get("id")
-        if id_val:
-            return hash((self.__class__.__name__, id_val))
-        return hash(json.dumps(self._data, sort_keys=True))
+        if self._hash is None:
+            id_val = self._data.get("id")
+            if id_val:
+                self._hash = hash((self.__class__.__name__, id_val))
+            else:
+                self._hash = hash(_freeze(self._data))
+        return self._hash
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts and lists into hashable equivalents.
+
+    Args:
+        value: Value to convert.
+
+    Returns:
+        The value, with dicts as frozensets of items and lists as tuples.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _encode_resource(value: Any) -> Any:
+    """Convert a Resource for json.dumps.
+
+    Args:
+        value: Object the JSON encoder cannot serialize.
+
+    Returns:
+        Dictionary representation of the resource.
+
+    Raises:
+        TypeError: If the value is not a Resource.
+    """
+    if isinstance(value, Resource):
+        return value.to_dict(copy=False)
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+# Leaf types returned by _serialize without further checks
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Set in Resource.__init__, never looked up in the resource data
+_INSTANCE_ATTRIBUTES = frozenset({"_data", "_client", "_wrapped", "_hash"})
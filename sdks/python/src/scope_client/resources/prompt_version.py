@@ -4,13 +4,14 @@ This module provides the PromptVersion class representing a specific
 version of a prompt from the Scope API.
 """
 
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING, Any, Optional
 
-from scope_client.renderer import Renderer
+from scope_client.renderer import Renderer, get_renderer
 from scope_client.resources.base import Resource
 
 if TYPE_CHECKING:
-    from scope_client.client import ScopeClient
+    from scope_client.client import BaseClient
 
 
 # Prompt type constants
@@ -27,7 +28,7 @@ class PromptVersion(Resource):
 
     Args:
         data: Dictionary of version data from API response.
-        client: Optional ScopeClient reference.
+        client: Optional client reference (ScopeClient or AsyncScopeClient).
 
     Attributes:
         id: Unique identifier for this version.
@@ -51,6 +52,8 @@ class PromptVersion(Resource):
         'Hello, Alice! Welcome to Scope.'
     """
 
+    __slots__ = ("_prompt_type", "_renderer")
+
     # Declare expected attributes for type checking
     id: str
     prompt_id: str
@@ -66,23 +69,40 @@ class PromptVersion(Resource):
     def __init__(
         self,
         data: dict[str, Any],
-        client: Optional["ScopeClient"] = None,
+        client: Optional["BaseClient"] = None,
     ) -> None:
         super().__init__(data, client=client)
 
-        # Set defaults for optional fields
-        if not hasattr(self, "variables"):
-            self.variables = []
-        if not hasattr(self, "is_production"):
-            self.is_production = False
-        if not hasattr(self, "content"):
-            self.content = ""
-        if not hasattr(self, "metadata") or self.metadata is None:
-            self.metadata = {}
+        # Set defaults for optional fields, without adding them to the data
+        defaults: dict[str, Any] = {}
+        if "variables" not in data:
+            defaults["variables"] = []
+        if "is_production" not in data:
+            defaults["is_production"] = False
+        if "content" not in data:
+            defaults["content"] = ""
+        if data.get("metadata") is None:
+            defaults["metadata"] = {}
+        if defaults:
+            self._wrapped = defaults
 
         # Parse prompt type from API (default to text)
         self._prompt_type: str = self._data.get("prompt_type") or DEFAULT_PROMPT_TYPE
 
+        # Built on first render, so loading a version never parses its content
+        self._renderer: Optional[Renderer] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, rebuilding the renderer when the template changes.
+
+        Args:
+            name: Attribute name.
+            value: Value to set.
+        """
+        super().__setattr__(name, value)
+        if name in ("content", "variables"):
+            self._renderer = None
+
     @property
     def type(self) -> str:
         """Get the prompt type.
@@ -132,11 +152,38 @@ class PromptVersion(Resource):
             >>> version.render(name="Alice", greeting="Hello")
             'Hello, Alice!'
         """
-        renderer = Renderer(
-            content=self.content,
-            declared_variables=self.variables,
-        )
-        return renderer.render(**variables)
+        return self._get_renderer().render(**variables)
+
+    def render_many(self, variables_list: Iterable[Mapping[str, Any]]) -> list[str]:
+        """Render the prompt content once for each set of variables.
+
+        Args:
+            variables_list: Mappings of variable names to values.
+
+        Returns:
+            Rendered prompt strings, in the same order as variables_list.
+
+        Raises:
+            MissingVariableError: If required variables are not provided.
+            ValidationError: If unknown variables are provided.
+
+        Example:
+            >>> version.render_many([{"name": "Alice"}, {"name": "Bob"}])
+            ['Hello, Alice!', 'Hello, Bob!']
+        """
+        return self._get_renderer().render_many(variables_list)
+
+    def _get_renderer(self) -> Renderer:
+        """Get the renderer for this version's content.
+
+        Returns:
+            The shared Renderer for the content, treating null content as empty.
+        """
+        if self._renderer is None:
+            # Parsed templates are shared, so re-fetching an unchanged version
+            # does not parse its content again
+            self._renderer = get_renderer(self.content or "", self.variables)
+        return self._renderer
 
     @property
     def is_draft(self) -> bool:
@@ -68,6 +68,17 @@ class TokenManager:
             assert self._token_info is not None
             return self._token_info.access_token
 
+    def invalidate(self, access_token: str) -> None:
+        """Forget a token the API rejected, so the next call fetches a new one.
+
+        Args:
+            access_token: The rejected token. If another thread has already
+                replaced it, the newer token is kept.
+        """
+        with self._lock:
+            if self._token_info is not None and self._token_info.access_token == access_token:
+                self._token_info = None
+
     def _needs_refresh(self) -> bool:
         """Check if the token needs to be refreshed.
 
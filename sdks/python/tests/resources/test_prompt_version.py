@@ -1,7 +1,11 @@
 """Tests for prompt and prompt version resources."""
 
+import copy
 import json
+import pickle
+from collections import OrderedDict
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -56,6 +60,16 @@ class TestResource:
         assert raw == data
         assert raw is not data  # Should be a copy
 
+    def test_raw_data_is_snapshot(self):
+        """Test modifying raw_data leaves the resource unchanged."""
+        data = {"id": "123", "name": "Test"}
+        resource = Resource(data)
+
+        resource.raw_data["name"] = "Changed"
+
+        assert resource.name == "Test"
+        assert data == {"id": "123", "name": "Test"}
+
     def test_to_dict(self):
         """Test to_dict method."""
         data = {"id": "123", "name": "Test"}
@@ -64,6 +78,48 @@ class TestResource:
 
         assert result == data
 
+    def test_to_dict_nested_values(self):
+        """Test to_dict copies nested containers and converts Resources."""
+        data = {
+            "id": "123",
+            "count": 2,
+            "ratio": 0.5,
+            "active": True,
+            "note": None,
+            "items": [{"id": "1", "tags": ["a"]}, Resource({"id": "2"})],
+            "extra": OrderedDict(key="value"),
+        }
+        result = Resource(data).to_dict()
+
+        assert result == {
+            **data,
+            "items": [{"id": "1", "tags": ["a"]}, {"id": "2"}],
+        }
+        assert result["items"][0]["tags"] is not data["items"][0]["tags"]
+        assert type(result["extra"]) is dict
+
+    def test_to_dict_without_copy(self):
+        """Test to_dict(copy=False) returns the data without copying."""
+        data = {"id": "123", "author": {"name": "Alice"}}
+        resource = Resource(data)
+        _ = resource.author
+
+        assert resource.to_dict(copy=False) is data
+        assert resource.to_dict() == data
+        assert resource.to_dict()["author"] is not data["author"]
+
+    def test_to_json_nested_resources(self):
+        """Test to_json converts Resources nested in the data."""
+        resource = Resource({"id": "123", "items": [Resource({"id": "1"})]})
+
+        assert json.loads(resource.to_json()) == {"id": "123", "items": [{"id": "1"}]}
+        assert json.loads(resource.to_json(default=str)) == {"id": "123", "items": [{"id": "1"}]}
+
+    def test_to_json_unserializable(self):
+        """Test to_json still rejects values JSON cannot encode."""
+        with pytest.raises(TypeError, match="set"):
+            Resource({"id": "123", "tags": {"a"}}).to_json()
+
     def test_to_json(self):
         """Test to_json method."""
         data = {"id": "123", "name": "Test"}
@@ -99,6 +155,16 @@ class TestResource:
         assert r1 == r2
         assert r1 != r3
 
+    def test_equality_by_id(self):
+        """Test resources of the same class with ids compare by id."""
+        r1 = Resource({"id": "123", "name": "Old"})
+        r2 = Resource({"id": "123", "name": "New"})
+
+        assert r1 == r2
+        assert r1 != Resource({"name": "Old"})
+        assert Resource({"name": "Test"}) == Resource({"name": "Test"})
+        assert PromptVersion({"id": "123", "name": "New"}) != r1
+
     def test_hash(self):
         """Test resource hashing."""
         r1 = Resource({"id": "123"})
@@ -107,6 +173,26 @@ class TestResource:
         assert hash(r1) == hash(r2)
         assert {r1, r2} == {r1}  # Same in set
 
+    def test_hash_without_id(self):
+        """Test resources without an id hash by their data."""
+        r1 = Resource({"name": "Test", "tags": ["a", "b"], "meta": {"page": 1}})
+        r2 = Resource({"meta": {"page": 1}, "tags": ["a", "b"], "name": "Test"})
+        r3 = Resource({"name": "Test", "tags": ["b", "a"], "meta": {"page": 1}})
+
+        assert hash(r1) == hash(r2)
+        assert {r1, r2} == {r1}
+        assert r1 != r3
+
+    def test_hash_is_cached(self):
+        """Test the hash is computed once."""
+        resource = Resource({"name": "Test"})
+        expected = hash(resource)
+
+        with patch("scope_client.resources.base._freeze") as freeze:
+            assert hash(resource) == expected
+
+        freeze.assert_not_called()
+
     def test_nested_dict_becomes_resource(self):
         """Test nested dicts become resources."""
         data = {
@@ -144,6 +230,68 @@ class TestResource:
         assert isinstance(resource.meta, dict)
         assert not isinstance(resource.meta, Resource)
 
+    def test_nested_resources_wrapped_on_access(self):
+        """Test nested values are not converted until they are accessed."""
+        data = {"id": "123", "author": {"name": "Alice"}, "items": [{"id": "1"}]}
+        resource = Resource(data)
+
+        assert resource._data is data
+        assert resource._wrapped is None
+
+        author = resource.author
+        assert resource.author is author
+        assert resource["author"] is author
+        assert resource._wrapped == {"author": author}
+        assert data["author"] == {"name": "Alice"}
+
+    def test_fields_named_like_methods(self):
+        """Test fields shadowed by methods are still reachable by key."""
+        resource = Resource({"id": "123", "get": "value"})
+
+        assert resource["get"] == "value"
+        assert resource.get("get") == "value"
+        assert callable(resource.get)
+
+    def test_missing_attribute(self):
+        """Test AttributeError for missing fields."""
+        resource = Resource({"id": "123"})
+        with pytest.raises(AttributeError, match="nonexistent"):
+            _ = resource.nonexistent
+        assert getattr(resource, "nonexistent", None) is None
+
+    def test_uses_slots(self):
+        """Test resources have no instance __dict__."""
+        resource = Resource({"id": "123"})
+
+        assert not hasattr(resource, "__dict__")
+
+    def test_assign_field(self):
+        """Test assigned fields are read back without changing the data."""
+        resource = Resource({"id": "123", "name": "a"})
+
+        resource.name = "b"
+        resource.extra = 1
+
+        assert resource.name == "b"
+        assert resource["name"] == "b"
+        assert resource.extra == 1
+        assert resource.to_dict() == {"id": "123", "name": "a"}
+
+    def test_assign_property_still_fails(self, prompt_version_data: dict[str, Any]):
+        """Test read-only properties cannot be assigned."""
+        version = PromptVersion(prompt_version_data)
+
+        with pytest.raises(AttributeError):
+            version.type = "chat"  # type: ignore[misc]
+        assert version.type == "text"
+
+    def test_copy(self):
+        """Test resources can be copied."""
+        resource = Resource({"id": "123", "author": {"name": "Alice"}})
+
+        assert copy.copy(resource).author.name == "Alice"
+        assert copy.deepcopy(resource) == resource
+
 
 class TestPromptVersion:
     """Tests for PromptVersion resource."""
@@ -168,6 +316,50 @@ class TestPromptVersion:
         assert version.is_production is False
         assert version.content == ""
 
+    def test_construction_does_not_parse_template(self, prompt_version_data: dict[str, Any]):
+        """Test the template is only parsed when the version is rendered."""
+        with patch("scope_client.resources.prompt_version.get_renderer") as get_renderer:
+            PromptVersion(prompt_version_data)
+
+        get_renderer.assert_not_called()
+
+    def test_null_content(self):
+        """Test a version with null content can be built and renders empty."""
+        version = PromptVersion({"id": "v", "content": None})
+
+        assert version.content is None
+        assert version.render() == ""
+
+    def test_assign_content(self, prompt_version_data: dict[str, Any]):
+        """Test assigning content changes what is rendered."""
+        version = PromptVersion(prompt_version_data)
+        version.render(name="Alice", app="Scope")
+
+        version.content = "Bye, {{name}}!"
+
+        assert version.render(name="Alice") == "Bye, Alice!"
+        assert version.to_dict()["content"] == prompt_version_data["content"]
+
+    def test_uses_slots(self, prompt_version_data: dict[str, Any]):
+        """Test prompt versions have no instance __dict__."""
+        version = PromptVersion(prompt_version_data)
+
+        assert not hasattr(version, "__dict__")
+        assert copy.copy(version).render(name="Alice", app="Scope") == version.render(
+            name="Alice", app="Scope"
+        )
+
+    def test_pickle_round_trip(self, prompt_version_data: dict[str, Any]):
+        """Test prompt versions can be pickled and still render."""
+        version = PromptVersion(prompt_version_data)
+
+        copied = pickle.loads(pickle.dumps(version))
+
+        assert copied == version
+        assert copied.raw_data == version.raw_data
+        assert copied.type == version.type
+        assert copied.render(name="Alice", app="Scope") == version.render(name="Alice", app="Scope")
+
     def test_render(self, prompt_version_data: dict[str, Any]):
         """Test rendering prompt version."""
         version = PromptVersion(prompt_version_data)
@@ -189,6 +381,37 @@ class TestPromptVersion:
         with pytest.raises(ValidationError):
             version.render(name="Alice", app="Scope", extra="value")
 
+    def test_render_many(self, prompt_version_data: dict[str, Any]):
+        """Test rendering prompt version for several sets of variables."""
+        version = PromptVersion(prompt_version_data)
+        rendered = version.render_many(
+            [{"name": "Alice", "app": "Scope"}, {"name": "Bob", "app": "Docs"}]
+        )
+
+        assert rendered == ["Hello, Alice! Welcome to Scope.", "Hello, Bob! Welcome to Docs."]
+
+    def test_reuses_parsed_template(self, prompt_version_data: dict[str, Any]):
+        """Test versions with the same content share one parsed template."""
+        first = PromptVersion(prompt_version_data)
+        second = PromptVersion(dict(prompt_version_data))
+        edited = PromptVersion({**prompt_version_data, "content": "Bye, {{name}}!"})
+
+        assert first._get_renderer() is second._get_renderer()
+        assert edited._get_renderer() is not first._get_renderer()
+        assert edited.render(name="Alice", app="Scope") == "Bye, Alice!"
+
+    def test_render_does_not_parse_template(self, prompt_version_data: dict[str, Any]):
+        """Test rendering again uses the template parsed on first render."""
+        version = PromptVersion(prompt_version_data)
+        version.render(name="Alice", app="Scope")
+
+        with patch("scope_client.renderer.VARIABLE_PATTERN") as pattern:
+            version.render(name="Alice", app="Scope")
+            version.render_many([{"name": "Bob", "app": "Docs"}])
+
+        pattern.split.assert_not_called()
+        pattern.sub.assert_not_called()
+
     def test_is_draft(self):
         """Test is_draft property."""
         version = PromptVersion({"id": "v1", "status": "draft"})
@@ -0,0 +1,381 @@
+"""Tests for AsyncScopeClient class."""
+
+import asyncio
+import threading
+import traceback
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from scope_client import AsyncScopeClient, Configuration
+from scope_client.errors import NoProductionVersionError, NotFoundError
+from scope_client.resources import PromptVersion
+
+
+class TestAsyncScopeClientInit:
+    """Tests for AsyncScopeClient initialization."""
+
+    def test_repr(self, config: Configuration):
+        """Test repr names the async client."""
+        client = AsyncScopeClient(config=config)
+        assert repr(client).startswith("<AsyncScopeClient ")
+
+    def test_uses_slots(self, config: Configuration):
+        """Test that clients do not carry a per-instance __dict__."""
+        client = AsyncScopeClient(config=config)
+        assert not hasattr(client, "__dict__")
+
+
+class TestAsyncScopeClientGetPromptVersion:
+    """Tests for AsyncScopeClient.get_prompt_version method."""
+
+    def test_get_prompt_version(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test fetching the production version."""
+        httpx_mock.add_response(
+            url="https://api.test.scope.io/api/v1/prompts/prompt-123/production",
+            json=mock_version_response,
+        )
+
+        async def run() -> PromptVersion:
+            async with AsyncScopeClient(config=config) as client:
+                return await client.get_prompt_version("prompt-123")
+
+        version = asyncio.run(run())
+
+        assert isinstance(version, PromptVersion)
+        assert version.id == mock_version_response["id"]
+        request = httpx_mock.get_requests()[0]
+        assert request.headers["Authorization"] == "Bearer test_jwt_token_abc123"
+
+    def test_caches_response(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test that responses are cached."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        async def run() -> tuple[PromptVersion, PromptVersion]:
+            async with AsyncScopeClient(config=config) as client:
+                first = await client.get_prompt_version("prompt-123")
+                second = await client.get_prompt_version("prompt-123")
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_raises_no_production_version(self, httpx_mock: HTTPXMock, config: Configuration):
+        """Test 404 on the production label raises NoProductionVersionError."""
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+
+        async def run() -> None:
+            async with AsyncScopeClient(config=config) as client:
+                await client.get_prompt_version("prompt-123")
+
+        with pytest.raises(NoProductionVersionError):
+            asyncio.run(run())
+
+    def test_raises_not_found_for_latest(self, httpx_mock: HTTPXMock, config: Configuration):
+        """Test 404 on the latest label raises NotFoundError."""
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+
+        async def run() -> None:
+            async with AsyncScopeClient(config=config) as client:
+                await client.get_prompt_version("prompt-123", label="latest")
+
+        with pytest.raises(NotFoundError):
+            asyncio.run(run())
+
+    def test_disk_cache_used_off_event_loop(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+        tmp_path,
+    ):
+        """Test disk cache reads and writes run in worker threads."""
+        pytest.importorskip("diskcache")
+        from scope_client.cache import DiskCache
+
+        httpx_mock.add_response(json=mock_version_response)
+        disk_config = config.merge(cache_backend="disk", cache_dir=str(tmp_path))
+        threads: list[tuple[str, int]] = []
+        get_entry = DiskCache.get_entry
+        set_entry = DiskCache.set
+
+        def record_get(self: DiskCache, *args: Any, **kwargs: Any) -> Any:
+            threads.append(("get", threading.get_ident()))
+            return get_entry(self, *args, **kwargs)
+
+        def record_set(self: DiskCache, *args: Any, **kwargs: Any) -> Any:
+            threads.append(("set", threading.get_ident()))
+            return set_entry(self, *args, **kwargs)
+
+        async def run() -> tuple[PromptVersion, PromptVersion]:
+            async with AsyncScopeClient(config=disk_config) as first:
+                fetched = await first.get_prompt_version("prompt-123")
+            async with AsyncScopeClient(config=disk_config) as second:
+                cached = await second.get_prompt_version("prompt-123")
+            return fetched, cached
+
+        patchers = (
+            patch.object(DiskCache, "get_entry", autospec=True, side_effect=record_get),
+            patch.object(DiskCache, "set", autospec=True, side_effect=record_set),
+        )
+        with patchers[0], patchers[1]:
+            fetched, cached = asyncio.run(run())
+
+        assert cached.id == fetched.id == mock_version_response["id"]
+        assert len(httpx_mock.get_requests()) == 1
+        assert [operation for operation, _ in threads] == ["get", "set", "get"]
+        assert threading.get_ident() not in {ident for _, ident in threads}
+
+    def test_not_found_raises_new_error_each_time(
+        self, httpx_mock: HTTPXMock, config: Configuration
+    ):
+        """Test remembered misses raise a fresh error with its own traceback."""
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+
+        async def run() -> list[BaseException]:
+            errors: list[BaseException] = []
+            async with AsyncScopeClient(config=config) as client:
+                for _ in range(5):
+                    try:
+                        await client.get_prompt_version("prompt-123")
+                    except NoProductionVersionError as e:
+                        errors.append(e)
+            return errors
+
+        errors = asyncio.run(run())
+
+        assert len(errors) == 5
+        assert len({id(error) for error in errors}) == 5
+        depths = {len(traceback.extract_tb(error.__traceback__)) for error in errors[1:]}
+        assert len(depths) == 1
+
+    def test_not_found_not_remembered_without_cache(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a miss fetched with cache=False does not fail later cached lookups."""
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+        httpx_mock.add_response(json=mock_version_response)
+
+        async def run() -> str:
+            async with AsyncScopeClient(config=config) as client:
+                with pytest.raises(NoProductionVersionError):
+                    await client.get_prompt_version("prompt-123", cache=False)
+                version = await client.get_prompt_version("prompt-123")
+            return version.id
+
+        assert asyncio.run(run()) == mock_version_response["id"]
+
+    def test_rate_limited_response_is_retried_after_delay(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a 429 response waits for its Retry-After and is retried."""
+        httpx_mock.add_response(
+            status_code=429,
+            headers={"Retry-After": "2"},
+            json={"error": {"message": "Slow down"}},
+        )
+        httpx_mock.add_response(json=mock_version_response)
+
+        async def run() -> PromptVersion:
+            async with AsyncScopeClient(config=config) as client:
+                return await client.get_prompt_version("prompt-123")
+
+        with patch("scope_client.connection.asyncio.sleep", new=AsyncMock()) as sleep:
+            version = asyncio.run(run())
+
+        assert version.id == mock_version_response["id"]
+        sleep.assert_awaited_once_with(2.0)
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_rejected_token_is_refreshed_once(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_token_manager: MagicMock,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a 401 fetches a new token and repeats the request."""
+        httpx_mock.add_response(status_code=401, json={"error": {"message": "Expired"}})
+        httpx_mock.add_response(json=mock_version_response)
+        mock_token_manager._needs_refresh.return_value = False
+        mock_token_manager.get_access_token.side_effect = ["old_token", "new_token"]
+
+        async def run() -> PromptVersion:
+            async with AsyncScopeClient(config=config) as client:
+                return await client.get_prompt_version("prompt-123")
+
+        assert asyncio.run(run()).id == mock_version_response["id"]
+        assert httpx_mock.get_requests()[1].headers["Authorization"] == "Bearer new_token"
+        mock_token_manager.invalidate.assert_called_once_with("old_token")
+
+    def test_concurrent_calls_share_request(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test that concurrent misses for one prompt make a single request."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        async def run() -> list[PromptVersion]:
+            async with AsyncScopeClient(config=config) as client:
+                versions = await asyncio.gather(
+                    *(client.get_prompt_version("prompt-123") for _ in range(3))
+                )
+                assert client._inflight == {}
+                return versions
+
+        first, second, third = asyncio.run(run())
+
+        assert first is second is third
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_concurrent_calls_share_error(self, httpx_mock: HTTPXMock, config: Configuration):
+        """Test that concurrent misses all receive the error of the shared request."""
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+
+        async def run() -> list[Any]:
+            async with AsyncScopeClient(config=config) as client:
+                return await asyncio.gather(
+                    client.get_prompt_version("prompt-123", label="latest"),
+                    client.get_prompt_version("prompt-123", label="latest"),
+                    return_exceptions=True,
+                )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(result, NotFoundError) for result in results)
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_cache_false_does_not_share_request(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test that cache=False calls each make their own request."""
+        httpx_mock.add_response(json=mock_version_response)
+        httpx_mock.add_response(json=mock_version_response)
+
+        async def run() -> None:
+            async with AsyncScopeClient(config=config) as client:
+                await asyncio.gather(
+                    client.get_prompt_version("prompt-123", cache=False),
+                    client.get_prompt_version("prompt-123", cache=False),
+                )
+
+        asyncio.run(run())
+
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestAsyncScopeClientGetPromptVersions:
+    """Tests for AsyncScopeClient.get_prompt_versions method."""
+
+    def test_fetches_each_prompt(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test fetching several prompts concurrently."""
+        for name in ("alpha", "beta"):
+            httpx_mock.add_response(
+                url=f"https://api.test.scope.io/api/v1/prompts/{name}/production",
+                json={**mock_version_response, "id": f"version-{name}"},
+            )
+
+        async def run() -> dict[str, PromptVersion]:
+            async with AsyncScopeClient(config=config) as client:
+                return await client.get_prompt_versions(["alpha", "beta", "alpha"])
+
+        versions = asyncio.run(run())
+
+        assert list(versions) == ["alpha", "beta"]
+        assert versions["alpha"].id == "version-alpha"
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_overlapping_batches_share_requests(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test concurrent batches with common names fetch each prompt once."""
+        for name in ("alpha", "beta", "gamma"):
+            httpx_mock.add_response(
+                url=f"https://api.test.scope.io/api/v1/prompts/{name}/production",
+                json={**mock_version_response, "id": f"version-{name}"},
+            )
+
+        async def run() -> list[dict[str, PromptVersion]]:
+            async with AsyncScopeClient(config=config) as client:
+                return await asyncio.gather(
+                    client.get_prompt_versions(["alpha", "beta"]),
+                    client.get_prompt_versions(["beta", "gamma"]),
+                )
+
+        first, second = asyncio.run(run())
+
+        assert first["beta"] is second["beta"]
+        assert len(httpx_mock.get_requests()) == 3
+
+
+class TestAsyncScopeClientRenderPrompt:
+    """Tests for AsyncScopeClient.render_prompt method."""
+
+    def test_render_prompt(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test fetching and rendering in one call."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        async def run() -> str:
+            async with AsyncScopeClient(config=config) as client:
+                return await client.render_prompt("prompt-123", {"name": "Alice", "app": "Scope"})
+
+        assert asyncio.run(run()) == "Hello, Alice! Welcome to Scope."
+
+    def test_render_many(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test rendering one prompt for several sets of variables."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        async def run() -> list[str]:
+            async with AsyncScopeClient(config=config) as client:
+                return await client.render_many(
+                    "prompt-123",
+                    [{"name": "Alice", "app": "Scope"}, {"name": "Bob", "app": "Docs"}],
+                )
+
+        assert asyncio.run(run()) == [
+            "Hello, Alice! Welcome to Scope.",
+            "Hello, Bob! Welcome to Docs.",
+        ]
@@ -1,8 +1,15 @@
 """Tests for cache module."""
 
+import json
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
-from scope_client.cache import Cache, CacheEntry
+import pytest
+
+from scope_client.cache import _LOCK_FREE_READS, Cache, CacheEntry, DiskCache
 
 
 class TestCacheEntry:
@@ -10,20 +17,26 @@ class TestCacheEntry:
 
     def test_not_expired(self):
         """Test entry that hasn't expired."""
-        entry = CacheEntry(value="test", expires_at=time.time() + 100)
+        entry = CacheEntry(value="test", expires_at=time.monotonic() + 100)
         assert not entry.is_expired()
 
     def test_expired(self):
         """Test entry that has expired."""
-        entry = CacheEntry(value="test", expires_at=time.time() - 1)
+        entry = CacheEntry(value="test", expires_at=time.monotonic() - 1)
         assert entry.is_expired()
 
     def test_exact_expiration(self):
         """Test entry at exact expiration time."""
-        entry = CacheEntry(value="test", expires_at=time.time())
+        entry = CacheEntry(value="test", expires_at=time.monotonic())
         # At or past expiration time should be expired
         assert entry.is_expired()
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_uses_slots(self):
+        """Test that entries do not carry a per-instance __dict__."""
+        entry = CacheEntry(value="test", expires_at=time.monotonic())
+        assert not hasattr(entry, "__dict__")
+
 
 class TestCache:
     """Tests for Cache class."""
@@ -102,6 +115,75 @@ class TestCache:
         assert result2 == "computed_value"
         assert call_count == 1  # Not called again
 
+    def test_fetch_caches_none(self):
+        """Test a computed None is cached like any other value."""
+        cache = Cache(ttl=60)
+        call_count = 0
+
+        def compute():
+            nonlocal call_count
+            call_count += 1
+
+        assert cache.fetch("key1", compute) is None
+        assert cache.fetch("key1", compute) is None
+        assert call_count == 1
+
+    def test_fetch_concurrent_misses_call_once(self):
+        """Test concurrent fetches of a missing key share one computation."""
+        cache = Cache(ttl=60)
+        release = threading.Event()
+        call_count = 0
+
+        def compute():
+            nonlocal call_count
+            call_count += 1
+            release.wait(timeout=5)
+            return "computed_value"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(cache.fetch, "key1", compute) for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert results == ["computed_value"] * 4
+        assert call_count == 1
+
+    def test_fetch_concurrent_misses_share_error(self):
+        """Test waiters receive the error of the shared computation."""
+        cache = Cache(ttl=60)
+        release = threading.Event()
+
+        def compute():
+            release.wait(timeout=5)
+            raise ValueError("fetch failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(cache.fetch, "key1", compute) for _ in range(2)]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="fetch failed"):
+                    future.result(timeout=5)
+
+        assert cache.fetch("key1", lambda: "recovered") == "recovered"
+
+    def test_fetch_uses_one_stripe_per_key(self):
+        """Test that fetches of a key are always guarded by the same lock."""
+        cache = Cache(ttl=60)
+        assert cache._lock_for("key1") is cache._lock_for("key1")
+        assert len({id(cache._lock_for(f"key{i}")) for i in range(100)}) > 1
+
+    @pytest.mark.skipif(not _LOCK_FREE_READS, reason="lock-free reads need CPython with the GIL")
+    def test_fetch_hit_does_not_wait_for_cache_lock(self):
+        """Test that fetch() hits proceed while another thread holds the cache lock."""
+        cache = Cache(ttl=60)
+        cache.set("key1", "value1")
+
+        with cache._lock, ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(cache.fetch, "key1", lambda: "computed")
+            assert future.result(timeout=5) == "value1"
+
     def test_fetch_with_custom_ttl(self):
         """Test fetch with custom TTL."""
         cache = Cache(ttl=300)
@@ -159,6 +241,12 @@ class TestCache:
         cache = Cache()
         assert cache.has("nonexistent") is False
 
+    def test_has_cached_none(self):
+        """Test has returns True for a cached None value."""
+        cache = Cache(ttl=60)
+        cache.set("key1", None)
+        assert cache.has("key1") is True
+
     def test_has_expired_key(self):
         """Test has returns False for expired key."""
         cache = Cache(ttl=0)
@@ -179,6 +267,128 @@ class TestCache:
         assert "valid2" in keys
         assert "expired" not in keys
 
+    def test_expired_entry_with_etag_is_kept(self):
+        """Test expired entries with validators remain available for revalidation."""
+        cache = Cache(ttl=0)
+        cache.set("key1", "value1", etag='"abc"')
+        time.sleep(0.01)
+
+        assert cache.get("key1") is None
+        assert cache.size == 0
+        entry = cache.get_entry("key1")
+        assert entry is not None
+        assert entry.value == "value1"
+        assert entry.etag == '"abc"'
+
+    def test_expired_entry_without_validators_is_dropped(self):
+        """Test expired entries without validators are removed."""
+        cache = Cache(ttl=0)
+        cache.set("key1", "value1")
+        time.sleep(0.01)
+
+        assert cache.get("key1") is None
+        assert cache.get_entry("key1") is None
+
+    def test_ignores_wall_clock_changes(self):
+        """Test entries expire on the monotonic clock, not the wall clock."""
+        cache = Cache(ttl=60)
+        cache.set("key1", "value1")
+
+        with patch("scope_client.cache.time.time", return_value=time.time() + 3600):
+            assert cache.get("key1") == "value1"
+            assert cache.size == 1
+
+    def test_size_evicts_expired_entries(self):
+        """Test size removes expired entries without validators."""
+        cache = Cache(ttl=0)
+        cache.set("key1", "value1")
+        time.sleep(0.01)
+
+        assert cache.size == 0
+        assert cache.get_entry("key1") is None
+
+    def test_reset_key_outlives_old_expiry(self):
+        """Test replacing an entry discards the expiry of the old one."""
+        cache = Cache(ttl=60)
+        cache.set("key1", "old", ttl=0)
+        cache.set("key1", "new", ttl=60)
+        time.sleep(0.01)
+
+        assert cache.size == 1
+        assert cache.keys() == ["key1"]
+        assert cache.get("key1") == "new"
+
+    def test_refreshed_stale_entry_is_counted(self):
+        """Test a revalidated entry counts again once it is set."""
+        cache = Cache(ttl=60)
+        cache.set("key1", "value1", ttl=0, etag='"abc"')
+        time.sleep(0.01)
+        assert cache.size == 0
+
+        cache.set("key1", "value1", etag='"abc"')
+
+        assert cache.size == 1
+        assert cache.keys() == ["key1"]
+
+    def test_repeated_sets_keep_expiry_heap_small(self):
+        """Test overwriting keys does not grow the expiry bookkeeping without bound."""
+        cache = Cache(ttl=60)
+        for _ in range(1000):
+            cache.set("key1", "value1")
+
+        assert len(cache._expiry) <= 2 * cache.size + 64
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used key is evicted past maxsize."""
+        cache = Cache(ttl=60, maxsize=2)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.get("key1")
+
+        cache.set("key3", "value3")
+
+        assert cache.get("key2") is None
+        assert cache.get("key1") == "value1"
+        assert cache.get("key3") == "value3"
+        assert cache.size == 2
+
+    def test_unbounded_without_maxsize(self):
+        """Test maxsize=None keeps every entry."""
+        cache = Cache(ttl=60, maxsize=None)
+        for index in range(2000):
+            cache.set(f"key{index}", index)
+
+        assert cache.size == 2000
+        assert cache.maxsize is None
+
+    @pytest.mark.skipif(not _LOCK_FREE_READS, reason="lock-free reads need CPython with the GIL")
+    def test_hit_does_not_take_lock(self):
+        """Test reading a fresh entry does not wait for the lock."""
+        cache = Cache(ttl=60)
+        cache.set("key1", "value1")
+
+        with cache._lock, ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(cache.get, "key1").result(timeout=5) == "value1"
+            assert executor.submit(cache.get_entry, "key1").result(timeout=5) is not None
+
+    def test_concurrent_reads_and_evictions(self):
+        """Test lock-free reads stay consistent while other threads evict keys."""
+        cache = Cache(ttl=60, maxsize=8)
+
+        def worker(offset: int) -> None:
+            for index in range(500):
+                key = f"key{(index + offset) % 16}"
+                cache.set(key, index)
+                cache.get(key)
+                cache.get_entry(f"key{index % 16}")
+                cache.keys()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(worker, offset) for offset in range(4)]:
+                future.result(timeout=30)
+
+        assert cache.size <= 8
+
     def test_cache_different_types(self):
         """Test caching different value types."""
         cache = Cache(ttl=60)
@@ -194,3 +404,75 @@ class TestCache:
         assert cache.get("list") == [1, 2, 3]
         assert cache.get("dict") == {"key": "value"}
         # Note: None values are indistinguishable from missing keys with get()
+
+
+class TestDiskCache:
+    """Tests for DiskCache class."""
+
+    @pytest.fixture(autouse=True)
+    def _require_diskcache(self):
+        pytest.importorskip("diskcache")
+
+    def test_set_and_get(self, tmp_path):
+        """Test basic set and get."""
+        cache = DiskCache(str(tmp_path), ttl=60)
+        cache.set("key1", {"content": "Hello"})
+        assert cache.get("key1") == {"content": "Hello"}
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries are visible to another cache on the same directory."""
+        DiskCache(str(tmp_path), ttl=60).set("key1", "value1")
+        assert DiskCache(str(tmp_path), ttl=60).get("key1") == "value1"
+
+    def test_dumps_and_loads(self, tmp_path):
+        """Test values are converted to and from JSON-compatible data."""
+        cache = DiskCache(
+            str(tmp_path),
+            dumps=lambda value: {"items": sorted(value)},
+            loads=lambda data: set(data["items"]),
+        )
+        cache.set("key1", {"b", "a"})
+        assert cache.get("key1") == {"a", "b"}
+
+    def test_reads_with_shared_json_parser(self, tmp_path):
+        """Test stored records are decoded with the parser used for responses."""
+        cache = DiskCache(str(tmp_path))
+        cache.set("key1", {"content": "Hello, {{name}}!"})
+
+        with patch("scope_client.cache.json_loads", wraps=json.loads) as loads:
+            assert cache.get("key1") == {"content": "Hello, {{name}}!"}
+
+        loads.assert_called_once()
+
+    def test_expired_entry_with_etag_is_kept(self, tmp_path):
+        """Test expired entries with validators remain available."""
+        cache = DiskCache(str(tmp_path), ttl=0)
+        cache.set("key1", "value1", etag='"abc"')
+        time.sleep(0.01)
+
+        assert cache.get("key1") is None
+        entry = cache.get_entry("key1")
+        assert entry is not None
+        assert entry.is_expired()
+        assert entry.etag == '"abc"'
+
+    def test_entry_expiry_uses_monotonic_clock(self, tmp_path):
+        """Test stored wall-clock expiry is converted for in-process entries."""
+        DiskCache(str(tmp_path), ttl=60).set("key1", "value1")
+
+        entry = DiskCache(str(tmp_path)).get_entry("key1")
+
+        assert entry is not None
+        assert entry.expires_at == pytest.approx(time.monotonic() + 60, abs=5)
+
+    def test_namespaces_are_isolated(self, tmp_path):
+        """Test clear only removes entries in the cache's namespace."""
+        first = DiskCache(str(tmp_path), namespace="first|")
+        second = DiskCache(str(tmp_path), namespace="second|")
+        first.set("key1", "one")
+        second.set("key1", "two")
+
+        first.clear()
+
+        assert first.get("key1") is None
+        assert second.get("key1") == "two"
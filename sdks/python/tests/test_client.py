@@ -1,7 +1,15 @@
 """Tests for ScopeClient class."""
 
+import json
+import threading
+import time
+import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -12,10 +20,16 @@ from scope_client import (
     configure,
     reset_configuration,
 )
+from scope_client._telemetry import RequestInfo, ResponseInfo, Telemetry
+from scope_client.client import PATH_CACHE_SIZE, _prompt_version_path
+from scope_client.connection import ConditionalResponse, Connection
 from scope_client.errors import (
+    AuthenticationError,
     ConfigurationError,
     MissingVariableError,
     NoProductionVersionError,
+    NotFoundError,
+    ServerError,
 )
 from scope_client.resources import PromptVersion
 
@@ -67,6 +81,12 @@ class TestScopeClientInit:
         client = ScopeClient(config=config)
         assert client._cache is not None
 
+    def test_uses_slots(self, config: Configuration):
+        """Test that clients do not carry a per-instance __dict__."""
+        client = ScopeClient(config=config)
+        assert not hasattr(client, "__dict__")
+        assert weakref.ref(client)() is client
+
     def test_cache_disabled(self, credentials: ApiKeyCredentials):
         """Test cache can be disabled."""
         config = Configuration(
@@ -78,6 +98,48 @@ class TestScopeClientInit:
         client = ScopeClient(config=config)
         assert client._cache is None
 
+    def test_disk_cache_shared_between_clients(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+        tmp_path,
+    ):
+        """Test the disk backend serves versions fetched by another client."""
+        pytest.importorskip("diskcache")
+        httpx_mock.add_response(json=mock_version_response)
+        disk_config = config.merge(cache_backend="disk", cache_dir=str(tmp_path))
+
+        with ScopeClient(config=disk_config) as first:
+            first.get_prompt_version("prompt-123")
+        with ScopeClient(config=disk_config) as second:
+            assert second._cache is None
+            version = second.get_prompt_version("prompt-123")
+
+        assert version.id == mock_version_response["id"]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_hybrid_cache_promotes_disk_entries(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+        tmp_path,
+    ):
+        """Test the hybrid backend keeps disk hits in memory."""
+        pytest.importorskip("diskcache")
+        httpx_mock.add_response(json=mock_version_response)
+        hybrid_config = config.merge(cache_backend="hybrid", cache_dir=str(tmp_path))
+
+        with ScopeClient(config=hybrid_config) as first:
+            first.get_prompt_version("prompt-123")
+        with ScopeClient(config=hybrid_config) as second:
+            version1 = second.get_prompt_version("prompt-123")
+            version2 = second.get_prompt_version("prompt-123")
+
+        assert version1 is version2
+        assert len(httpx_mock.get_requests()) == 1
+
     def test_repr(self, config: Configuration):
         """Test string representation."""
         client = ScopeClient(config=config)
@@ -179,6 +241,101 @@ class TestScopeClientGetPromptVersion:
 
         assert exc_info.value.prompt_id == "prompt-123"
 
+    def test_not_found_is_remembered(self, httpx_mock: HTTPXMock, config: Configuration):
+        """Test a missing prompt is not requested again within negative_cache_ttl."""
+        for label in ("latest", "production"):
+            httpx_mock.add_response(
+                url=f"https://api.test.scope.io/api/v1/prompts/missing/{label}",
+                status_code=404,
+                json={"error": {"message": "Not found"}},
+            )
+
+        client = ScopeClient(config=config)
+        with pytest.raises(NotFoundError):
+            client.get_prompt_version("missing", label="latest")
+        with pytest.raises(NotFoundError):
+            client.get_prompt_version("missing", label="latest")
+        with pytest.raises(NoProductionVersionError):
+            client.get_prompt_version("missing")
+        with pytest.raises(NoProductionVersionError):
+            client.get_prompt_version("missing")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_not_found_raises_new_error_each_time(
+        self, httpx_mock: HTTPXMock, config: Configuration
+    ):
+        """Test remembered misses raise a fresh error with its own traceback."""
+        for label in ("latest", "production"):
+            httpx_mock.add_response(
+                url=f"https://api.test.scope.io/api/v1/prompts/missing/{label}",
+                status_code=404,
+                json={"error": {"message": "Not found"}},
+                headers={"X-Request-ID": "req-404"},
+            )
+
+        client = ScopeClient(config=config)
+        for label, error_class in ((None, NoProductionVersionError), ("latest", NotFoundError)):
+            errors = []
+            for _ in range(5):
+                with pytest.raises(error_class) as exc_info:
+                    client.get_prompt_version("missing", label=label)
+                errors.append(exc_info.value)
+
+            depths = [len(traceback.extract_tb(error.__traceback__)) for error in errors[1:]]
+            assert len(set(depths)) == 1
+            assert len({id(error) for error in errors}) == len(errors)
+            assert str(errors[-1]) == str(errors[1])
+
+    def test_not_found_cache_bypassed(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test cache=False and clear_cache() retry a prompt that was missing."""
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+        httpx_mock.add_response(json=mock_version_response)
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        with pytest.raises(NoProductionVersionError):
+            client.get_prompt_version("prompt-123")
+        assert (
+            client.get_prompt_version("prompt-123", cache=False).id == mock_version_response["id"]
+        )
+
+        client.clear_cache()
+        assert client.get_prompt_version("prompt-123").id == mock_version_response["id"]
+
+    def test_not_found_not_remembered_without_cache(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a miss fetched with cache=False does not fail later cached lookups."""
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        with pytest.raises(NoProductionVersionError):
+            client.get_prompt_version("prompt-123", cache=False)
+
+        assert client.get_prompt_version("prompt-123").id == mock_version_response["id"]
+
+    def test_not_found_cache_disabled(self, httpx_mock: HTTPXMock, config: Configuration):
+        """Test negative_cache_ttl=0 requests the prompt every time."""
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+        httpx_mock.add_response(status_code=404, json={"error": {"message": "Not found"}})
+
+        client = ScopeClient(config=config, negative_cache_ttl=0)
+        for _ in range(2):
+            with pytest.raises(NoProductionVersionError):
+                client.get_prompt_version("prompt-123")
+
+        assert len(httpx_mock.get_requests()) == 2
+
     def test_caches_response(
         self,
         httpx_mock: HTTPXMock,
@@ -211,6 +368,303 @@ class TestScopeClientGetPromptVersion:
 
         assert len(httpx_mock.get_requests()) == 2
 
+    def test_parses_response_bytes_once(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test the response body is parsed once, straight from its bytes."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        with patch("scope_client.connection.json_loads", wraps=json.loads) as loads:
+            client.get_prompt_version("prompt-123")
+
+        loads.assert_called_once()
+        assert isinstance(loads.call_args.args[0], bytes)
+
+    def test_cache_disabled_fetches_directly(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a client without caching skips cache and in-flight bookkeeping."""
+        httpx_mock.add_response(json=mock_version_response)
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config.merge(cache_enabled=False))
+        with patch.object(ScopeClient, "_get_cache_entry") as get_cache_entry:
+            first = client.get_prompt_version("prompt-123")
+            second = client.get_prompt_version("prompt-123")
+
+        get_cache_entry.assert_not_called()
+        assert first is not second
+        assert client._inflight == {}
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_revalidates_expired_entry_with_etag(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test an expired entry is revalidated and reused on 304."""
+        httpx_mock.add_response(json=mock_version_response, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(status_code=304)
+
+        client = ScopeClient(config=config)
+        version1 = client.get_prompt_version("prompt-123", cache_ttl=0)
+        time.sleep(0.01)
+        version2 = client.get_prompt_version("prompt-123")
+        version3 = client.get_prompt_version("prompt-123")
+
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+        assert version1 is version2 is version3
+
+    def test_revalidation_replaces_modified_entry(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a modified resource replaces the expired entry."""
+        last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+        httpx_mock.add_response(
+            json=mock_version_response, headers={"Last-Modified": last_modified}
+        )
+        httpx_mock.add_response(json={**mock_version_response, "id": "version-new"})
+
+        client = ScopeClient(config=config)
+        client.get_prompt_version("prompt-123", cache_ttl=0)
+        time.sleep(0.01)
+        version = client.get_prompt_version("prompt-123")
+
+        assert httpx_mock.get_requests()[1].headers["If-Modified-Since"] == last_modified
+        assert version.id == "version-new"
+
+    def test_cache_key_is_reused(self, config: Configuration):
+        """Test resolving the same prompt twice returns the same key object."""
+        client = ScopeClient(config=config)
+        first_key, endpoint = client._resolve_prompt_version_path("greeting", None, None)
+        second_key, _ = client._resolve_prompt_version_path("greeting", None, None)
+
+        assert first_key == "prompt:greeting:production"
+        assert endpoint == "prompts/greeting/production"
+        assert first_key is second_key
+
+    def test_resolved_path_is_memoized(self, config: Configuration):
+        """Test resolving the same prompt twice skips building the key and endpoint."""
+        client = ScopeClient(config=config)
+        first = client._resolve_prompt_version_path("greeting", "latest", None)
+        second = client._resolve_prompt_version_path("greeting", "latest", None)
+
+        assert first == ("prompt:greeting:latest", "prompts/greeting/latest")
+        assert first is second
+
+    def test_resolved_paths_are_bounded(self, config: Configuration):
+        """Test the path cache evicts old entries instead of growing without limit."""
+        client = ScopeClient(config=config)
+        _prompt_version_path.cache_clear()
+        for index in range(PATH_CACHE_SIZE + 10):
+            client._resolve_prompt_version_path(f"prompt-{index}", None, None)
+
+        assert _prompt_version_path.cache_info().currsize == PATH_CACHE_SIZE
+
+    def test_concurrent_misses_share_request(
+        self,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test that threads missing the same prompt wait for one request."""
+        client = ScopeClient(config=config)
+        release = threading.Event()
+        calls = 0
+
+        def get_conditional(*args: Any, **kwargs: Any) -> ConditionalResponse:
+            nonlocal calls
+            calls += 1
+            release.wait(timeout=5)
+            return ConditionalResponse(data=mock_version_response, not_modified=False)
+
+        connection = client._connection
+        patcher = patch.object(connection, "get_conditional", side_effect=get_conditional)
+        with patcher, ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(client.get_prompt_version, "prompt-123") for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            versions = [future.result(timeout=5) for future in futures]
+
+        assert calls == 1
+        assert all(version is versions[0] for version in versions)
+        assert client._inflight == {}
+
+    def test_miss_after_finished_flight_uses_cache(
+        self,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a caller whose miss races a finishing flight does not fetch again."""
+        client = ScopeClient(config=config)
+        get_cache_entry = ScopeClient._get_cache_entry
+        calls = 0
+
+        def stale_first_lookup(self: ScopeClient, cache_key: str) -> Any:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                # Another caller fetches, caches and removes its flight
+                # after this lookup has missed
+                leader = client.get_prompt_version("prompt-123")
+                assert client._inflight == {}
+                assert leader is not None
+                return None
+            return get_cache_entry(self, cache_key)
+
+        connection = client._connection
+        patcher = patch.object(
+            connection,
+            "get_conditional",
+            return_value=ConditionalResponse(data=mock_version_response, not_modified=False),
+        )
+        lookup = patch.object(
+            ScopeClient, "_get_cache_entry", autospec=True, side_effect=stale_first_lookup
+        )
+        with patcher as get_conditional, lookup:
+            version = client.get_prompt_version("prompt-123")
+
+        get_conditional.assert_called_once()
+        assert version.id == mock_version_response["id"]
+        assert client._inflight == {}
+
+    def test_concurrent_misses_share_error(self, config: Configuration):
+        """Test that threads waiting on a failed request receive its error."""
+        client = ScopeClient(config=config)
+        release = threading.Event()
+
+        def get_conditional(*args: Any, **kwargs: Any) -> ConditionalResponse:
+            release.wait(timeout=5)
+            raise NotFoundError("Not found")
+
+        connection = client._connection
+        patcher = patch.object(connection, "get_conditional", side_effect=get_conditional)
+        with patcher, ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(client.get_prompt_version, "prompt-123", label="latest")
+                for _ in range(2)
+            ]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                with pytest.raises(NotFoundError):
+                    future.result(timeout=5)
+
+        assert client._inflight == {}
+
+
+class TestScopeClientGetPromptVersions:
+    """Tests for ScopeClient.get_prompt_versions method."""
+
+    def test_fetches_each_prompt(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test fetching several prompts returns a version per name."""
+        for name in ("alpha", "beta", "gamma"):
+            httpx_mock.add_response(
+                url=f"https://api.test.scope.io/api/v1/prompts/{name}/production",
+                json={**mock_version_response, "id": f"version-{name}"},
+            )
+
+        client = ScopeClient(config=config)
+        versions = client.get_prompt_versions(["alpha", "beta", "gamma"])
+
+        assert list(versions) == ["alpha", "beta", "gamma"]
+        assert versions["beta"].id == "version-beta"
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_uses_cache_and_deduplicates(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test cached and duplicate names are not fetched again."""
+        httpx_mock.add_response(
+            url="https://api.test.scope.io/api/v1/prompts/alpha/latest",
+            json=mock_version_response,
+        )
+        httpx_mock.add_response(
+            url="https://api.test.scope.io/api/v1/prompts/beta/latest",
+            json=mock_version_response,
+        )
+
+        client = ScopeClient(config=config)
+        client.get_prompt_version("alpha", label="latest")
+        versions = client.get_prompt_versions(["alpha", "beta", "beta"], label="latest")
+
+        assert list(versions) == ["alpha", "beta"]
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_overlapping_batches_share_requests(
+        self,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test concurrent batches with common names fetch each prompt once."""
+        client = ScopeClient(config=config)
+        release = threading.Event()
+        endpoints: list[str] = []
+
+        def get_conditional(endpoint: str, **kwargs: Any) -> ConditionalResponse:
+            endpoints.append(endpoint)
+            release.wait(timeout=5)
+            return ConditionalResponse(data=mock_version_response, not_modified=False)
+
+        connection = client._connection
+        patcher = patch.object(connection, "get_conditional", side_effect=get_conditional)
+        with patcher, ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(client.get_prompt_versions, ["alpha", "beta"])
+            second = executor.submit(client.get_prompt_versions, ["beta", "gamma"])
+            time.sleep(0.05)
+            release.set()
+            first_versions = first.result(timeout=5)
+            second_versions = second.result(timeout=5)
+
+        assert sorted(endpoints) == [
+            "prompts/alpha/production",
+            "prompts/beta/production",
+            "prompts/gamma/production",
+        ]
+        assert first_versions["beta"] is second_versions["beta"]
+
+    def test_propagates_errors(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a failing prompt raises its error."""
+        httpx_mock.add_response(
+            url="https://api.test.scope.io/api/v1/prompts/alpha/production",
+            json=mock_version_response,
+        )
+        httpx_mock.add_response(
+            url="https://api.test.scope.io/api/v1/prompts/missing/production",
+            status_code=404,
+            json={"error": {"message": "Not found"}},
+        )
+
+        client = ScopeClient(config=config)
+        with pytest.raises(NoProductionVersionError):
+            client.get_prompt_versions(["alpha", "missing"])
+
 
 class TestScopeClientRenderPrompt:
     """Tests for ScopeClient.render_prompt method."""
@@ -271,6 +725,40 @@ class TestScopeClientRenderPrompt:
 
         assert rendered == "Hello, Bob! Welcome to Test."
 
+    def test_render_prompt_uses_cached_version(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test repeated renders reuse the cached version."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        first = client.render_prompt("prompt-123", {"name": "Alice", "app": "Scope"})
+        second = client.render_prompt("prompt-123", {"name": "Bob", "app": "Scope"})
+
+        assert first == "Hello, Alice! Welcome to Scope."
+        assert second == "Hello, Bob! Welcome to Scope."
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_render_prompt_bypasses_cache(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test cache=False fetches the version on every render."""
+        httpx_mock.add_response(json=mock_version_response)
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        variables = {"name": "Alice", "app": "Scope"}
+        client.render_prompt("prompt-123", variables)
+        client.render_prompt("prompt-123", variables, cache=False)
+
+        assert len(httpx_mock.get_requests()) == 2
+
     def test_render_prompt_missing_variable(
         self,
         httpx_mock: HTTPXMock,
@@ -285,6 +773,417 @@ class TestScopeClientRenderPrompt:
             client.render_prompt("prompt-123", {"name": "Alice"})
 
 
+class TestScopeClientRenderMany:
+    """Tests for ScopeClient.render_many method."""
+
+    def test_render_many(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test rendering one prompt for several sets of variables with one request."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        rendered = client.render_many(
+            "prompt-123",
+            [{"name": "Alice", "app": "Scope"}, {"name": "Bob", "app": "Docs"}],
+        )
+
+        assert rendered == ["Hello, Alice! Welcome to Scope.", "Hello, Bob! Welcome to Docs."]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_render_many_validates_all_sets(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test an incomplete set of variables raises before anything is rendered."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        with pytest.raises(MissingVariableError):
+            client.render_many(
+                "prompt-123",
+                [{"name": "Alice", "app": "Scope"}, {"name": "Bob"}],
+                label="latest",
+            )
+
+
+class TestScopeClientTelemetry:
+    """Tests for telemetry hooks around client requests."""
+
+    def test_callbacks_receive_events(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test registered callbacks see the request and response."""
+        httpx_mock.add_response(json=mock_version_response)
+        requests: list[RequestInfo] = []
+        responses: list[ResponseInfo] = []
+        Telemetry.on_request(requests.append)
+        Telemetry.on_response(responses.append)
+
+        client = ScopeClient(config=config)
+        client.get_prompt_version("prompt-123")
+
+        assert len(requests) == 1
+        assert requests[0].method == "GET"
+        assert requests[0].url == str(httpx_mock.get_requests()[0].url).split("?")[0]
+        assert responses[0].request_id == requests[0].request_id
+        assert responses[0].status_code == 200
+        assert responses[0].headers["content-type"] == "application/json"
+        assert responses[0].headers["Content-Type"] == "application/json"
+
+    def test_background_telemetry(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test telemetry_background runs callbacks on the telemetry thread."""
+        httpx_mock.add_response(json=mock_version_response)
+        threads: list[str] = []
+        client = ScopeClient(config=config.merge(telemetry_background=True))
+        client.telemetry.on_response(lambda _info: threads.append(threading.current_thread().name))
+        Telemetry.on_request(lambda _info: threads.append(threading.current_thread().name))
+
+        client.get_prompt_version("prompt-123")
+        Telemetry.flush()
+
+        assert threads == ["scope-client-telemetry", "scope-client-telemetry"]
+
+    def test_no_events_built_without_callbacks(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test telemetry is skipped entirely when no callbacks are registered."""
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        request_patch = patch.object(Connection, "_emit_request_telemetry")
+        response_patch = patch.object(Connection, "_emit_response_telemetry")
+        with request_patch as emit_request, response_patch as emit_response:
+            client.get_prompt_version("prompt-123")
+
+        assert not Telemetry.has_callbacks()
+        emit_request.assert_not_called()
+        emit_response.assert_not_called()
+
+    def test_elapsed_time_ignores_wall_clock(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test request durations are not skewed by wall-clock jumps."""
+        httpx_mock.add_response(json=mock_version_response)
+        responses: list[ResponseInfo] = []
+        Telemetry.on_response(responses.append)
+        wall_clock = iter(range(10**6, 0, -3600))
+
+        client = ScopeClient(config=config)
+        with patch("scope_client.connection.time.time", lambda: float(next(wall_clock))):
+            client.get_prompt_version("prompt-123")
+
+        assert 0 <= responses[0].elapsed_ms < 60_000
+
+    def test_response_parsed_once_with_callbacks(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test the client reuses the body parsed for response telemetry."""
+        httpx_mock.add_response(json=mock_version_response)
+        responses: list[ResponseInfo] = []
+        Telemetry.on_response(responses.append)
+
+        client = ScopeClient(config=config)
+        with patch("scope_client.connection.json_loads", wraps=json.loads) as loads:
+            version = client.get_prompt_version("prompt-123")
+
+        loads.assert_called_once()
+        assert responses[0].body == mock_version_response
+        assert version.id == mock_version_response["id"]
+
+    def test_invalid_json_still_raises_with_callbacks(
+        self, httpx_mock: HTTPXMock, config: Configuration
+    ):
+        """Test a body telemetry could not parse is still rejected by the client."""
+        httpx_mock.add_response(text="not json")
+        responses: list[ResponseInfo] = []
+        Telemetry.on_response(responses.append)
+
+        client = ScopeClient(config=config)
+        with pytest.raises(ValueError):
+            client.get_prompt_version("prompt-123")
+
+        assert responses[0].body == "not json"
+
+    def test_request_headers_built_once(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test request events reuse the connection's default headers."""
+        httpx_mock.add_response(json=mock_version_response)
+        httpx_mock.add_response(json=mock_version_response)
+        requests: list[RequestInfo] = []
+        Telemetry.on_request(requests.append)
+
+        client = ScopeClient(config=config)
+        client.get_prompt_version("prompt-123", cache=False)
+        client.get_prompt_version("prompt-123", cache=False)
+
+        assert requests[0].headers is requests[1].headers
+        assert requests[0].headers["Accept"] == "application/json"
+        assert requests[0].headers is not client._connection._default_headers()
+        with pytest.raises(TypeError):
+            requests[0].headers["Accept"] = "text/plain"  # type: ignore[index]
+        assert requests[1].headers["Accept"] == "application/json"
+
+    def test_client_hooks_only_see_own_requests(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test per-client callbacks are not called for other clients."""
+        httpx_mock.add_response(json=mock_version_response)
+        httpx_mock.add_response(json=mock_version_response)
+        first = ScopeClient(config=config)
+        second = ScopeClient(config=config)
+        first_responses: list[ResponseInfo] = []
+        global_responses: list[ResponseInfo] = []
+        first.telemetry.on_response(first_responses.append)
+        Telemetry.on_response(global_responses.append)
+
+        first.get_prompt_version("prompt-123")
+        second.get_prompt_version("prompt-123")
+
+        assert len(first_responses) == 1
+        assert len(global_responses) == 2
+        assert not second.telemetry.has_callbacks()
+
+    def test_telemetry_disabled_skips_callbacks(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test telemetry_enabled=False skips registered callbacks."""
+        httpx_mock.add_response(json=mock_version_response)
+        requests: list[RequestInfo] = []
+        Telemetry.on_request(requests.append)
+
+        client = ScopeClient(config=config, telemetry_enabled=False)
+        client.get_prompt_version("prompt-123")
+
+        assert requests == []
+
+    def test_callback_registered_during_emit_runs_next_time(self):
+        """Test registering a callback while emitting does not affect that emit."""
+        calls: list[str] = []
+
+        def register_more(info: RequestInfo) -> None:
+            calls.append("first")
+            Telemetry.on_request(lambda _info: calls.append("second"))
+
+        Telemetry.on_request(register_more)
+        info = RequestInfo(request_id="req-1", method="GET", url="/prompts", headers={})
+        Telemetry.emit_request(info)
+        assert calls == ["first"]
+
+        Telemetry.emit_request(info)
+        assert calls == ["first", "first", "second"]
+
+
+class TestConnectionMethods:
+    """Tests for the Connection request methods."""
+
+    def test_methods_send_their_arguments(self, httpx_mock: HTTPXMock, config: Configuration):
+        """Test each method sends its HTTP method, query and body."""
+        for _ in range(4):
+            httpx_mock.add_response(json={"ok": True})
+
+        with Connection(config) as connection:
+            assert connection.get("items", params={"page": 2}) == {"ok": True}
+            connection.post("items", data={"name": "a"})
+            connection.put("items/1", data={"name": "b"})
+            connection.delete("items/1")
+
+        get, post, put, delete = httpx_mock.get_requests()
+        assert (get.method, get.url.params["page"], get.content) == ("GET", "2", b"")
+        assert (post.method, json.loads(post.content)) == ("POST", {"name": "a"})
+        assert (put.method, json.loads(put.content)) == ("PUT", {"name": "b"})
+        assert (delete.method, delete.content) == ("DELETE", b"")
+
+
+class TestConnectionBackoff:
+    """Tests for retry backoff delays."""
+
+    def test_backoff_doubles_per_attempt(self, config: Configuration):
+        """Test the delay doubles on each attempt, without jitter at the midpoint."""
+        connection = Connection(config.merge(retry_base_delay=0.5, retry_max_delay=30))
+        with patch("scope_client.connection.random.random", return_value=0.5):
+            delays = [connection._calculate_backoff(attempt) for attempt in (1, 2, 3, 4)]
+
+        assert delays == [0.5, 1.0, 2.0, 4.0]
+
+    def test_backoff_jitter_and_cap(self, config: Configuration):
+        """Test jitter stays within 25% and delays are capped."""
+        connection = Connection(config.merge(retry_base_delay=1, retry_max_delay=5))
+        with patch("scope_client.connection.random.random", return_value=0.0):
+            assert connection._calculate_backoff(2) == 1.5
+        with patch("scope_client.connection.random.random", return_value=1.0):
+            assert connection._calculate_backoff(2) == 2.5
+            assert connection._calculate_backoff(10) == 5.0
+
+
+class TestConnectionRetryAfter:
+    """Tests for the wait before retrying a failed response."""
+
+    @pytest.mark.parametrize(("header", "expected"), [("7", 7.0), ("1.5", 1.5), ("0", 0.0)])
+    def test_uses_numeric_retry_after(self, config: Configuration, header: str, expected: float):
+        """Test numeric Retry-After values are used as seconds."""
+        connection = Connection(config)
+        response = httpx.Response(429, headers={"Retry-After": header})
+
+        assert connection._retry_after(response, 1) == expected
+
+    @pytest.mark.parametrize("header", ["3600", "99999999999999999999", "9" * 400])
+    def test_caps_retry_after_at_max_delay(self, config: Configuration, header: str):
+        """Test large Retry-After values wait at most retry_max_delay."""
+        connection = Connection(config.merge(retry_max_delay=5))
+        response = httpx.Response(429, headers={"Retry-After": header})
+
+        assert connection._retry_after(response, 1) == 5.0
+
+    @pytest.mark.parametrize("header", [None, "", "Wed, 21 Oct 2015 07:28:00 GMT", "1.2.3", "-1"])
+    def test_falls_back_to_backoff(self, config: Configuration, header: Any):
+        """Test missing or non-numeric Retry-After values use the backoff delay."""
+        connection = Connection(config.merge(retry_base_delay=2))
+        headers = {} if header is None else {"Retry-After": header}
+        response = httpx.Response(503, headers=headers)
+
+        with patch("scope_client.connection.random.random", return_value=0.5):
+            assert connection._retry_after(response, 1) == 2.0
+
+
+class TestConnectionRetries:
+    """Tests for retried requests."""
+
+    def test_retry_reuses_request_headers(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_token_manager: MagicMock,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test retried attempts reuse the request ID and token."""
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config.merge(retry_base_delay=0))
+        client.get_prompt_version("prompt-123")
+
+        first, second = httpx_mock.get_requests()
+        assert first.headers["X-Request-ID"] == second.headers["X-Request-ID"]
+        assert second.headers["Authorization"] == "Bearer test_jwt_token_abc123"
+        assert second.headers["Accept"] == "application/json"
+        mock_token_manager.get_access_token.assert_called_once()
+
+    def test_rate_limited_response_is_retried_after_delay(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a 429 response waits for its Retry-After and is retried."""
+        httpx_mock.add_response(
+            status_code=429,
+            headers={"Retry-After": "2"},
+            json={"error": {"message": "Slow down"}},
+        )
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config)
+        with patch("scope_client.connection.time.sleep") as sleep:
+            version = client.get_prompt_version("prompt-123")
+
+        assert version.id == mock_version_response["id"]
+        sleep.assert_called_once_with(2.0)
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_huge_retry_after_waits_max_delay(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a huge Retry-After is capped instead of overflowing time.sleep."""
+        httpx_mock.add_response(status_code=429, headers={"Retry-After": "99999999999999999999"})
+        httpx_mock.add_response(json=mock_version_response)
+
+        client = ScopeClient(config=config.merge(retry_max_delay=5))
+        with patch("scope_client.connection.time.sleep") as sleep:
+            client.get_prompt_version("prompt-123")
+
+        sleep.assert_called_once_with(5.0)
+
+    def test_server_error_raised_after_retries(self, httpx_mock: HTTPXMock, config: Configuration):
+        """Test 5xx responses are retried up to max_retries, then raised."""
+        for _ in range(3):
+            httpx_mock.add_response(status_code=503, json={"error": {"message": "Down"}})
+
+        client = ScopeClient(config=config.merge(max_retries=2))
+        with patch("scope_client.connection.time.sleep") as sleep, pytest.raises(ServerError):
+            client.get_prompt_version("prompt-123")
+
+        assert sleep.call_count == 2
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_rejected_token_is_refreshed_once(
+        self,
+        httpx_mock: HTTPXMock,
+        config: Configuration,
+        mock_token_manager: MagicMock,
+        mock_version_response: dict[str, Any],
+    ):
+        """Test a 401 fetches a new token and repeats the request."""
+        httpx_mock.add_response(status_code=401, json={"error": {"message": "Expired"}})
+        httpx_mock.add_response(json=mock_version_response)
+        mock_token_manager.get_access_token.side_effect = ["old_token", "new_token"]
+
+        client = ScopeClient(config=config.merge(max_retries=0))
+        version = client.get_prompt_version("prompt-123")
+
+        assert version.id == mock_version_response["id"]
+        first, second = httpx_mock.get_requests()
+        assert first.headers["Authorization"] == "Bearer old_token"
+        assert second.headers["Authorization"] == "Bearer new_token"
+        mock_token_manager.invalidate.assert_called_once_with("old_token")
+
+    def test_rejected_token_twice_raises(self, httpx_mock: HTTPXMock, config: Configuration):
+        """Test a second 401 is raised instead of refreshing again."""
+        httpx_mock.add_response(status_code=401, json={"error": {"message": "Denied"}})
+        httpx_mock.add_response(status_code=401, json={"error": {"message": "Denied"}})
+
+        client = ScopeClient(config=config)
+        with pytest.raises(AuthenticationError):
+            client.get_prompt_version("prompt-123")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+
 class TestScopeClientClearCache:
     """Tests for ScopeClient.clear_cache method."""
 
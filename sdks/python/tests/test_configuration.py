@@ -1,11 +1,15 @@
 """Tests for configuration module."""
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from unittest.mock import patch
 
 import pytest
 
-from scope_client import ApiKeyCredentials
-from scope_client.configuration import Configuration, ConfigurationManager
+from scope_client import ApiKeyCredentials, reset_configuration
+from scope_client.configuration import Configuration, ConfigurationManager, _parse_env
 from scope_client.errors import ConfigurationError
 
 
@@ -23,10 +27,12 @@ class TestConfiguration:
         assert config.open_timeout == 10
         assert config.cache_enabled is True
         assert config.cache_ttl == 300
+        assert config.negative_cache_ttl == 30
         assert config.max_retries == 3
         assert config.retry_base_delay == 0.5
         assert config.retry_max_delay == 30.0
         assert config.telemetry_enabled is True
+        assert config.telemetry_background is False
         assert config.environment == "production"
 
     def test_custom_values(self, credentials: ApiKeyCredentials):
@@ -54,6 +60,31 @@ class TestConfiguration:
         config = Configuration()
         assert config.environment == "staging"
 
+    def test_environment_read_once(self):
+        """Test environment variables are read once until the configuration is reset."""
+        os.environ["SCOPE_ENVIRONMENT"] = "staging"
+        assert Configuration().environment == "staging"
+
+        os.environ["SCOPE_ENVIRONMENT"] = "development"
+        assert Configuration().environment == "staging"
+
+        reset_configuration()
+        assert Configuration().environment == "development"
+
+    def test_environment_parsed_once(self):
+        """Test environment values are stripped and converted only on first use."""
+        os.environ["SCOPE_AUTH_API_URL"] = "https://env.auth.io/"
+        os.environ["SCOPE_TOKEN_REFRESH_BUFFER"] = "90"
+
+        with patch("scope_client.configuration._parse_env", wraps=_parse_env) as parse_env:
+            config = Configuration()
+            merged = config.merge(timeout=5)
+            Configuration(environment="staging")
+
+        parse_env.assert_called_once()
+        assert config.auth_api_url == merged.auth_api_url == "https://env.auth.io"
+        assert config.token_refresh_buffer == merged.token_refresh_buffer == 90
+
     def test_explicit_values_override_env(self, credentials: ApiKeyCredentials):
         """Test that explicit values override environment variables."""
         os.environ["SCOPE_API_URL"] = "https://env.api.io"
@@ -66,6 +97,15 @@ class TestConfiguration:
         with pytest.raises(AttributeError):
             config.base_url = "new_url"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_uses_slots(self):
+        """Test that configurations do not carry a per-instance __dict__."""
+        with patch.dict(os.environ, {"SCOPE_ENVIRONMENT": "staging"}):
+            config = Configuration()
+
+        assert not hasattr(config, "__dict__")
+        assert config.environment == "staging"
+
     def test_merge_creates_new_instance(self, credentials: ApiKeyCredentials):
         """Test that merge creates a new configuration."""
         config1 = Configuration(credentials=credentials, timeout=30)
@@ -100,6 +140,18 @@ class TestConfiguration:
         assert "base_url" in data
         assert "cache_enabled" in data
 
+    def test_to_dict_includes_every_field(self):
+        """Test to_dict covers all fields, with credentials last."""
+        config = Configuration(cache_ttl=10)
+        data = config.to_dict()
+
+        assert list(data) == [
+            *(f.name for f in fields(Configuration) if f.init and f.name != "credentials"),
+            "credentials",
+        ]
+        assert data["cache_ttl"] == 10
+        assert data["credentials"] is None
+
     def test_api_url_property(self, credentials: ApiKeyCredentials):
         """Test api_url property."""
         config = Configuration(
@@ -109,6 +161,16 @@ class TestConfiguration:
         )
         assert config.api_url == "https://api.scope.io/api/v2"
 
+    def test_api_url_follows_merge(self):
+        """Test api_url is formatted again for merged configurations."""
+        config = Configuration(base_url="https://api.scope.io")
+        merged = config.merge(api_version="v2")
+
+        assert config.api_url == "https://api.scope.io/api/v1"
+        assert merged.api_url == "https://api.scope.io/api/v2"
+        assert merged == Configuration(base_url="https://api.scope.io", api_version="v2")
+        assert " _api_url=" not in repr(config)
+
     def test_validate_with_credentials(self, credentials: ApiKeyCredentials):
         """Test validation passes with all required fields."""
         config = Configuration(
@@ -147,6 +209,29 @@ class TestConfiguration:
         with pytest.raises(ConfigurationError, match="auth_api_url is required"):
             config.validate()
 
+    def test_validate_invalid_cache_backend(self, credentials: ApiKeyCredentials):
+        """Test validation fails for an unknown cache backend."""
+        config = Configuration(
+            credentials=credentials,
+            base_url="https://api.scope.io",
+            auth_api_url="https://auth.scope.io",
+            cache_backend="redis",
+        )
+        with pytest.raises(ConfigurationError, match="cache_backend must be one of"):
+            config.validate()
+
+    def test_validate_http2_without_h2(self, credentials: ApiKeyCredentials):
+        """Test validation fails when HTTP/2 is requested but h2 is missing."""
+        config = Configuration(
+            credentials=credentials,
+            base_url="https://api.scope.io",
+            auth_api_url="https://auth.scope.io",
+            http2=True,
+        )
+        error = pytest.raises(ConfigurationError, match="http2 requires the h2 package")
+        with patch("importlib.util.find_spec", return_value=None), error:
+            config.validate()
+
 
 class TestConfigurationManager:
     """Tests for ConfigurationManager class."""
@@ -166,6 +251,38 @@ class TestConfigurationManager:
         retrieved = ConfigurationManager.get()
         assert retrieved.credentials.api_key == credentials.api_key
 
+    def test_get_does_not_lock_once_set(self, credentials: ApiKeyCredentials):
+        """Test get returns an existing configuration without taking the lock."""
+        custom_config = Configuration(credentials=credentials)
+        ConfigurationManager.set(custom_config)
+
+        with patch.object(ConfigurationManager, "_lock") as lock:
+            assert ConfigurationManager.get() is custom_config
+
+        lock.__enter__.assert_not_called()
+
+    def test_concurrent_get_creates_one_default(self):
+        """Test threads racing to create the default configuration share one."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            configs = list(executor.map(lambda _: ConfigurationManager.get(), range(32)))
+
+        assert all(config is configs[0] for config in configs)
+
+    def test_get_during_concurrent_set(self, credentials: ApiKeyCredentials):
+        """Test lock-free reads see either the old or the new configuration."""
+        first = Configuration(credentials=credentials)
+        second = first.merge(timeout=60)
+        ConfigurationManager.set(first)
+
+        def swap(i: int) -> Configuration:
+            ConfigurationManager.set(second if i % 2 else first)
+            return ConfigurationManager.get()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            seen = list(executor.map(swap, range(200)))
+
+        assert all(config is first or config is second for config in seen)
+
     def test_reset(self, credentials: ApiKeyCredentials):
         """Test resetting configuration."""
         ConfigurationManager.set(Configuration(credentials=credentials))
@@ -2,10 +2,12 @@
 
 import os
 import warnings
+from unittest.mock import patch
 
 import pytest
 
 from scope_client import ApiKeyCredentials, ClientCredentials, CredentialsProtocol
+from scope_client.credentials import clear_from_env_cache
 from scope_client.errors import ConfigurationError
 
 
@@ -117,6 +119,66 @@ class TestClientCredentials:
         assert credentials.client_id is None
         assert credentials.client_secret is None
 
+    def test_from_env_reuses_instance(self):
+        """Test from_env returns the same instance on later calls."""
+        os.environ["SCOPE_ORG_ID"] = "env-org"
+        os.environ["SCOPE_CLIENT_ID"] = "env-key"
+        os.environ["SCOPE_CLIENT_SECRET"] = "env-secret"
+
+        first = ClientCredentials.from_env()
+        with patch.dict(os.environ, {"SCOPE_ORG_ID": "other-org"}):
+            assert ClientCredentials.from_env() is first
+
+    def test_from_env_reads_environment_once(self):
+        """Test later from_env calls do not read the environment."""
+        os.environ["SCOPE_ORG_ID"] = "env-org"
+        os.environ["SCOPE_CLIENT_ID"] = "env-key"
+        os.environ["SCOPE_CLIENT_SECRET"] = "env-secret"
+        ClientCredentials.from_env()
+
+        with patch("scope_client.credentials.os.environ") as environ:
+            ClientCredentials.from_env()
+
+        assert not environ.mock_calls
+
+    def test_from_env_rereads_incomplete_credentials(self):
+        """Test from_env reads the environment again until all values are set."""
+        first = ClientCredentials.from_env()
+
+        os.environ["SCOPE_ORG_ID"] = "env-org"
+        os.environ["SCOPE_CLIENT_ID"] = "env-key"
+        os.environ["SCOPE_CLIENT_SECRET"] = "env-secret"
+        second = ClientCredentials.from_env()
+
+        assert first.org_id is None
+        assert second.org_id == "env-org"
+        assert ClientCredentials.from_env() is second
+
+    def test_refresh_from_env(self):
+        """Test refresh_from_env picks up changed environment variables."""
+        os.environ["SCOPE_ORG_ID"] = "env-org"
+        os.environ["SCOPE_CLIENT_ID"] = "env-key"
+        os.environ["SCOPE_CLIENT_SECRET"] = "env-secret"
+        first = ClientCredentials.from_env()
+
+        os.environ["SCOPE_ORG_ID"] = "other-org"
+        refreshed = ClientCredentials.refresh_from_env()
+
+        assert first.org_id == "env-org"
+        assert refreshed.org_id == "other-org"
+        assert ClientCredentials.from_env() is refreshed
+
+    def test_clear_from_env_cache(self):
+        """Test clearing the memoized credentials forces a rebuild."""
+        os.environ["SCOPE_ORG_ID"] = "env-org"
+        first = ClientCredentials.from_env()
+
+        clear_from_env_cache()
+
+        second = ClientCredentials.from_env()
+        assert second is not first
+        assert second == first
+
     def test_immutability(self):
         """Test that credentials are immutable."""
         credentials = ClientCredentials(
@@ -127,6 +189,23 @@ class TestClientCredentials:
         with pytest.raises(AttributeError):
             credentials.client_id = "new_key"
 
+    def test_subclass_instances(self):
+        """Test subclasses are built and stay immutable like the base class."""
+
+        class TeamCredentials(ClientCredentials):
+            pass
+
+        credentials = TeamCredentials(org_id="my-org", client_id="key", client_secret="secret")
+
+        assert credentials == ClientCredentials("my-org", "key", "secret")
+        with pytest.raises(AttributeError):
+            credentials.org_id = "other-org"
+
+    def test_uses_slots(self):
+        """Test that credentials do not carry a per-instance __dict__."""
+        credentials = ClientCredentials(org_id="my-org")
+        assert not hasattr(credentials, "__dict__")
+
     def test_repr_redacts_secret(self):
         """Test that repr redacts the client_secret."""
         credentials = ClientCredentials(
@@ -59,6 +59,21 @@ class TestScopeError:
         assert "404" in repr_str
         assert "NOT_FOUND" in repr_str
 
+    def test_str_and_repr_are_reused(self):
+        """Test formatted strings are built once per error."""
+        error = ScopeError("test", http_status=404, request_id="req-123")
+
+        assert str(error) is str(error)
+        assert repr(error) is repr(error)
+        assert str(error) == "test | HTTP Status: 404 | Request ID: req-123"
+
+    def test_subclass_repr_with_cached_base(self):
+        """Test subclasses extend the cached base repr."""
+        error = RateLimitError(retry_after=30)
+
+        assert repr(error) == repr(error)
+        assert repr(error).endswith(", retry_after=30)")
+
 
 class TestConfigurationErrors:
     """Tests for configuration error classes."""
@@ -68,6 +83,12 @@ class TestConfigurationErrors:
         error = ConfigurationError("Invalid config")
         assert isinstance(error, ScopeError)
         assert str(error) == "Invalid config"
+        assert error.args == ("Invalid config",)
+        assert error.message == "Invalid config"
+        assert error.http_status is None
+        assert error.http_body is None
+        assert error.error_code is None
+        assert error.request_id is None
 
     def test_missing_api_key_error(self):
         """Test MissingApiKeyError."""
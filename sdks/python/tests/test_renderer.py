@@ -1,9 +1,22 @@
 """Tests for renderer module."""
 
+import pickle
+from unittest.mock import patch
+
 import pytest
 
 from scope_client.errors import MissingVariableError, ValidationError
-from scope_client.renderer import Renderer, extract_variables, render_template
+from scope_client.renderer import (
+    COMPILE_AFTER_RENDERS,
+    COMPILE_MAX_VARIABLES,
+    RENDERER_CACHE_SIZE,
+    VARIABLE_PATTERN,
+    Renderer,
+    _cached_renderer,
+    extract_variables,
+    get_renderer,
+    render_template,
+)
 
 
 class TestRenderer:
@@ -57,12 +70,24 @@ class TestRenderer:
         variables = renderer.variables
         assert variables.count("name") == 1
 
+    def test_variables_in_template_order(self):
+        """Test variables are listed in order of first appearance."""
+        renderer = Renderer("{{b}} {{a}} {{c}} {{a}} {{b}}")
+        assert renderer.variables == ["b", "a", "c"]
+        assert renderer.variables is not renderer.variables
+
     def test_content_property(self):
         """Test content property."""
         template = "Hello, {{name}}!"
         renderer = Renderer(template)
         assert renderer.content == template
 
+    def test_static_template_returns_content(self):
+        """Test templates without placeholders render to their content."""
+        template = "Hello, World!"
+        renderer = Renderer(template)
+        assert renderer.render() is template
+
     def test_render_with_no_args(self):
         """Test render with no arguments."""
         renderer = Renderer("Hello, World!")
@@ -94,6 +119,190 @@ class TestRenderer:
         assert "name" in exc_info.value.missing_variables
         assert "greeting" not in exc_info.value.missing_variables
 
+    def test_adjacent_variables(self):
+        """Test placeholders with no literal text between them."""
+        renderer = Renderer("{{first}}{{last}}")
+        result = renderer.render(first="Ada", last="Lovelace")
+        assert result == "AdaLovelace"
+
+    def test_value_containing_placeholder_syntax(self):
+        """Test substituted values are not re-scanned for placeholders."""
+        renderer = Renderer("Echo: {{text}}")
+        result = renderer.render(text="{{other}}")
+        assert result == "Echo: {{other}}"
+
+    def test_render_does_not_scan_template(self):
+        """Test rendering and the missing-variable check never rescan the content."""
+        names = [f"v{i}" for i in range(10)]
+        renderer = Renderer(" ".join(f"{{{{{name}}}}}" for name in names))
+        values = {name: name.upper() for name in names}
+
+        with patch("scope_client.renderer.VARIABLE_PATTERN") as pattern:
+            assert renderer.render(**values) == " ".join(values.values())
+            with pytest.raises(MissingVariableError):
+                renderer.render(v0="x")
+
+        assert not pattern.mock_calls
+
+    def test_missing_variable_after_compile(self):
+        """Test missing variables are reported on the segment and compiled paths."""
+        names = [f"v{i}" for i in range(COMPILE_MAX_VARIABLES + 1)]
+        renderer = Renderer(" ".join(f"{{{{{name}}}}}" for name in names))
+        values = {name: name for name in names}
+
+        for _ in range(COMPILE_AFTER_RENDERS + 1):
+            with pytest.raises(MissingVariableError) as exc_info:
+                renderer.render(v0="x")
+            assert exc_info.value.missing_variables == names[1:]
+            renderer.render(**values)
+
+    def test_key_error_from_value_propagates(self):
+        """Test a KeyError raised by a value is not reported as missing."""
+
+        class Broken:
+            def __str__(self) -> str:
+                raise KeyError("inner")
+
+        with pytest.raises(KeyError, match="inner"):
+            Renderer("{{a}} {{b}}").render(a="x", b=Broken())  # type: ignore[arg-type]
+
+    def test_pickle_round_trip(self):
+        """Test renderers with a generated fill function can be pickled."""
+        names = [f"v{i}" for i in range(COMPILE_MAX_VARIABLES + 1)]
+        values = {name: name.upper() for name in names}
+        renderer = Renderer(" ".join(f"{{{{{name}}}}}" for name in names), names)
+        small = Renderer("Hi {{name}}", ["name"])
+        for _ in range(COMPILE_AFTER_RENDERS):
+            renderer.render(**values)
+        assert renderer._fill is not None and small._fill is not None
+
+        copied = pickle.loads(pickle.dumps(renderer))
+        assert copied.render(**values) == renderer.render(**values)
+        with pytest.raises(ValidationError):
+            copied.render(**values, other="x")
+        assert pickle.loads(pickle.dumps(small)).render(name="Bob") == "Hi Bob"
+        assert pickle.loads(pickle.dumps(Renderer("Hi {{name}}"))).render(name="Al") == "Hi Al"
+
+    def test_validation_skipped_without_declared_variables(self):
+        """Test rendering only calls the validator when a check fails."""
+        renderer = Renderer("{{name}}")
+        declared = Renderer("{{name}}", declared_variables=["name"])
+
+        with patch.object(Renderer, "_validate_variables") as validate:
+            assert renderer.render(name="a", extra="b") == "a"
+            assert declared.render(name="a") == "a"
+            assert declared.render_many([{"name": "b"}]) == ["b"]
+
+        validate.assert_not_called()
+
+    def test_template_scanned_once_at_construction(self):
+        """Test the constructor splits the template once and derives the rest from it."""
+        with patch("scope_client.renderer.VARIABLE_PATTERN", wraps=VARIABLE_PATTERN) as pattern:
+            renderer = Renderer("{{a}} and {{b}} and {{a}}", declared_variables=["a", "b", "c"])
+
+        assert [call[0] for call in pattern.mock_calls] == ["split"]
+        assert renderer._required == frozenset({"a", "b"})
+        assert renderer._declared_variables == frozenset({"a", "b", "c"})
+
+    def test_repeated_render_reuses_template(self):
+        """Test rendering the same renderer with different values."""
+        renderer = Renderer("Hello, {{name}}!")
+        assert renderer.render(name="Alice") == "Hello, Alice!"
+        assert renderer.render(name="Bob") == "Hello, Bob!"
+
+    def test_literal_braces_and_quotes(self):
+        """Test literal braces and quotes in the template are preserved."""
+        template = 'Data: {"key": {{value}}} \\n """{x}""" \'{{name}}\''
+        renderer = Renderer(template)
+        result = renderer.render(value="1", name="Alice")
+        assert result == 'Data: {"key": 1} \\n """{x}""" \'Alice\''
+
+    def test_many_variables(self):
+        """Test templates with more variables than the compiled fast path."""
+        template = " ".join(f"{{{{v{i}}}}}" for i in range(10))
+        renderer = Renderer(template)
+        values = {f"v{i}": str(i) for i in range(10)}
+        assert renderer.render(**values) == "0 1 2 3 4 5 6 7 8 9"
+
+    def test_many_variables_compiled_once_hot(self):
+        """Test large templates get a generated renderer after repeated renders."""
+        names = [f"v{i}" for i in range(10)]
+        renderer = Renderer(" ".join(f"{{{{{name}}}}}" for name in names))
+        values = {name: name.upper() for name in names}
+        expected = " ".join(values.values())
+
+        for _ in range(COMPILE_AFTER_RENDERS - 1):
+            assert renderer.render(**values) == expected
+        assert renderer._fill is None
+
+        assert renderer.render(**values) == expected
+        assert renderer._fill is not None
+        assert renderer.render(**values) == expected
+
+    def test_render_many_compiles_large_batches(self):
+        """Test a batch large enough to pay for a generated renderer uses one."""
+        names = [f"v{i}" for i in range(10)]
+        renderer = Renderer(" ".join(f"{{{{{name}}}}}" for name in names))
+        values_list = [{name: str(run) for name in names} for run in range(COMPILE_AFTER_RENDERS)]
+
+        rendered = renderer.render_many(values_list)
+
+        assert renderer._fill is not None
+        assert rendered[-1] == " ".join([str(COMPILE_AFTER_RENDERS - 1)] * 10)
+
+    def test_non_string_values(self):
+        """Test non-string values are converted with str()."""
+        renderer = Renderer("{{count}} items at {{price}}")
+        assert renderer.render(count=3, price=1.5) == "3 items at 1.5"
+
+    def test_numeric_variable_names(self):
+        """Test variables whose names are digits render by name, not position."""
+        names = [str(i) for i in range(10)]
+        renderer = Renderer("{0} " + " ".join(f"{{{{{name}}}}}" for name in names))
+        values = {name: f"<{name}>" for name in names}
+        assert renderer.render(**values) == "{0} " + " ".join(values.values())
+
+    def test_render_many(self):
+        """Test rendering several sets of values."""
+        renderer = Renderer("{{greeting}}, {{name}}!")
+        values_list = [
+            {"greeting": "Hello", "name": "Alice"},
+            {"greeting": "Hi", "name": "Bob"},
+        ]
+        assert renderer.render_many(values_list) == ["Hello, Alice!", "Hi, Bob!"]
+
+    def test_render_many_generic_path(self):
+        """Test render_many for templates rendered without a generated function."""
+        names = [f"v{i}" for i in range(10)]
+        renderer = Renderer(" ".join(f"{{{{{name}}}}}" for name in names))
+        values_list = [{name: f"{name}-{run}" for name in names} for run in range(3)]
+
+        assert renderer.render_many(values_list) == [
+            renderer.render(**values) for values in values_list
+        ]
+
+    def test_render_many_validates_each(self):
+        """Test render_many raises for an incomplete set of values."""
+        renderer = Renderer("{{a}} {{b}}", declared_variables=["a", "b"])
+        with pytest.raises(MissingVariableError):
+            renderer.render_many([{"a": "1", "b": "2"}, {"a": "1"}])
+        with pytest.raises(ValidationError):
+            renderer.render_many([{"a": "1", "b": "2", "c": "3"}])
+
+    def test_render_many_static_and_generators(self):
+        """Test render_many accepts any iterable, including for static templates."""
+        renderer = Renderer("No variables", declared_variables=[])
+        assert renderer.render_many({} for _ in range(2)) == ["No variables", "No variables"]
+        assert Renderer("{{x}}").render_many(iter([{"x": 1}, {"x": 2}])) == ["1", "2"]
+
+    def test_missing_variables_in_template_order(self):
+        """Test missing variables are reported once, in template order."""
+        renderer = Renderer("{{b}} {{a}} {{b}}")
+        with pytest.raises(MissingVariableError) as exc_info:
+            renderer.render()
+
+        assert exc_info.value.missing_variables == ["b", "a"]
+
 
 class TestRendererWithDeclaredVariables:
     """Tests for Renderer with declared variables validation."""
@@ -139,6 +348,13 @@ class TestRendererWithDeclaredVariables:
         with pytest.raises(ValidationError):
             renderer.render(name="World")
 
+    def test_static_template_with_declared_variables(self):
+        """Test static templates still validate provided variables."""
+        renderer = Renderer("Hello!", declared_variables=["name"])
+        assert renderer.render(name="World") == "Hello!"
+        with pytest.raises(ValidationError):
+            renderer.render(other="value")
+
     def test_extra_declared_variables_ok(self):
         """Test that having declared but unused variables is OK."""
         renderer = Renderer(
@@ -171,6 +387,39 @@ class TestRenderTemplate:
         result = render_template("Hello, World!")
         assert result == "Hello, World!"
 
+    def test_reuses_parsed_template(self):
+        """Test repeated calls reuse the parsed template."""
+        with patch("scope_client.renderer.Renderer", wraps=Renderer) as renderer_cls:
+            render_template("Hi, {{who}}! ({{n}})", who="Ann", n="1")
+            result = render_template("Hi, {{who}}! ({{n}})", who="Bob", n="2")
+
+        assert result == "Hi, Bob! (2)"
+        assert renderer_cls.call_count == 1
+
+    def test_declared_variables_are_part_of_cache_key(self):
+        """Test validation uses the declared variables of each call."""
+        render_template("Hi, {{name}}!", declared_variables=["name", "extra"], extra="x", name="A")
+        with pytest.raises(ValidationError):
+            render_template("Hi, {{name}}!", declared_variables=["name"], extra="x", name="A")
+
+
+class TestGetRenderer:
+    """Tests for get_renderer function."""
+
+    def test_cache_is_bounded(self):
+        """Test at most RENDERER_CACHE_SIZE parsed templates are kept."""
+        for i in range(RENDERER_CACHE_SIZE + 10):
+            get_renderer(f"Template {i}: {{{{name}}}}")
+
+        assert _cached_renderer.cache_info().currsize == RENDERER_CACHE_SIZE
+
+    def test_returns_shared_renderer(self):
+        """Test the same template returns the same Renderer."""
+        first = get_renderer("Hi, {{name}}!", ["name"])
+        assert get_renderer("Hi, {{name}}!", ("name",)) is first
+        assert get_renderer("Hi, {{name}}!") is not first
+        assert first.render(name="Ann") == "Hi, Ann!"
+
 
 class TestExtractVariables:
     """Tests for extract_variables function."""
@@ -195,6 +444,10 @@ class TestExtractVariables:
         variables = extract_variables("{{name}} and {{name}}")
         assert variables.count("name") == 1
 
+    def test_variables_in_template_order(self):
+        """Test variables are listed in order of first appearance."""
+        assert extract_variables("{{b}} {{a}} {{b}} {{c}}") == ["b", "a", "c"]
+
     def test_underscore_variables(self):
         """Test variables with underscores."""
         variables = extract_variables("{{user_name}} {{first_name}}")
@@ -0,0 +1,138 @@
+"""Tests for the scope_client package module."""
+
+import subprocess
+import sys
+import types
+from typing import Any
+
+import pytest
+
+import scope_client
+from scope_client.credentials import ApiKeyCredentials
+
+
+class TestLazyExports:
+    """Tests for lazily resolved package exports."""
+
+    def test_import_does_not_load_http_stack(self):
+        """Test importing the package does not import httpx or the client."""
+        code = (
+            "import sys, scope_client; "
+            "assert 'httpx' not in sys.modules; "
+            "assert 'scope_client.client' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_all_exports_resolve(self):
+        """Test every name in __all__ is accessible."""
+        for name in scope_client.__all__:
+            assert getattr(scope_client, name) is not None
+
+    def test_export_is_cached(self):
+        """Test resolved exports are stored on the package."""
+        exported = scope_client.ScopeClient
+        assert vars(scope_client)["ScopeClient"] is exported
+
+    def test_dir_lists_lazy_exports(self):
+        """Test dir() includes exports before they are first accessed."""
+        names = dir(scope_client)
+
+        assert "AsyncScopeClient" in names
+        assert "TelemetryHooks" in names
+        assert "configure" in names
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = scope_client.DoesNotExist
+
+    def test_functions_not_shadowed_by_submodules(self):
+        """Test client() and configuration() survive submodule imports."""
+        import scope_client.async_client  # noqa: F401
+        import scope_client.client  # noqa: F401
+        import scope_client.configuration  # noqa: F401
+
+        assert not isinstance(scope_client.client, types.ModuleType)
+        assert not isinstance(scope_client.configuration, types.ModuleType)
+        assert not isinstance(scope_client.async_client, types.ModuleType)
+        assert callable(scope_client.client)
+        assert callable(scope_client.configuration)
+
+
+def _configure(credentials: ApiKeyCredentials, **options: Any) -> None:
+    """Set a valid global configuration for the test API."""
+    scope_client.configure(
+        credentials=credentials,
+        base_url="https://api.test.scope.io",
+        auth_api_url="https://auth.test.scope.io",
+        **options,
+    )
+
+
+class TestClientFactory:
+    """Tests for the client() factory function."""
+
+    def test_reuses_client_for_global_configuration(self, credentials: ApiKeyCredentials):
+        """Test argument-less calls share one client."""
+        _configure(credentials)
+
+        assert scope_client.client() is scope_client.client()
+
+    def test_new_client_after_reconfigure(self, credentials: ApiKeyCredentials):
+        """Test changing the global configuration replaces the shared client."""
+        _configure(credentials)
+        first = scope_client.client()
+        _configure(credentials, cache_ttl=60)
+
+        second = scope_client.client()
+
+        assert second is not first
+        assert second.config.cache_ttl == 60
+
+    def test_closing_shared_client_keeps_it_open(self, credentials: ApiKeyCredentials):
+        """Test closing the shared client does not affect later callers."""
+        _configure(credentials)
+        shared = scope_client.client()
+        connection = shared._connection.client
+
+        with scope_client.client():
+            pass
+        scope_client.client().close()
+
+        assert scope_client.client() is shared
+        assert shared._connection.client is connection
+        assert not connection.is_closed
+
+    def test_replaced_shared_client_is_closed(self, credentials: ApiKeyCredentials):
+        """Test reconfiguring closes the previous shared client's connections."""
+        _configure(credentials)
+        connection = scope_client.client()._connection.client
+        _configure(credentials, cache_ttl=60)
+
+        scope_client.client()
+
+        assert connection.is_closed
+
+    def test_arguments_create_new_client(self, credentials: ApiKeyCredentials):
+        """Test calls with arguments are not shared."""
+        _configure(credentials)
+
+        assert scope_client.client(cache_enabled=False) is not scope_client.client()
+        assert scope_client.client(credentials=credentials) is not scope_client.client(
+            credentials=credentials
+        )
+
+
+class TestAsyncClientFactory:
+    """Tests for the async_client() factory function."""
+
+    def test_returns_new_async_client(self, credentials: ApiKeyCredentials):
+        """Test each call creates a separate AsyncScopeClient."""
+        _configure(credentials)
+
+        first = scope_client.async_client()
+        second = scope_client.async_client(cache_ttl=60)
+
+        assert isinstance(first, scope_client.AsyncScopeClient)
+        assert first is not second
+        assert second.config.cache_ttl == 60
@@ -0,0 +1,232 @@
+"""Tests for telemetry module."""
+
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scope_client._telemetry import (
+    ErrorInfo,
+    RequestInfo,
+    ResponseInfo,
+    Telemetry,
+    TelemetryHooks,
+    _BackgroundDispatcher,
+    _reset_request_ids,
+    generate_request_id,
+    redact_headers,
+)
+
+
+def _request_info() -> RequestInfo:
+    """Build a sample request event."""
+    return RequestInfo(request_id="req-1", method="GET", url="/prompts", headers={})
+
+
+class TestEventInfo:
+    """Tests for the telemetry event objects."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_events_use_slots(self):
+        """Test that events do not carry a per-instance __dict__."""
+        events = [
+            _request_info(),
+            ResponseInfo(request_id="req-1", status_code=200, headers={}),
+            ErrorInfo(request_id="req-1", error=ValueError("boom")),
+        ]
+        for event in events:
+            assert not hasattr(event, "__dict__")
+
+    def test_events_are_mutable(self):
+        """Test that callbacks can annotate events in place."""
+        info = ResponseInfo(request_id="req-1", status_code=200, headers={})
+        info.elapsed_ms = 12.5
+        assert info.elapsed_ms == 12.5
+
+
+class TestTelemetryRegistration:
+    """Tests for registering global Telemetry callbacks."""
+
+    def test_concurrent_registration_keeps_every_callback(self):
+        """Test callbacks registered from many threads are all kept."""
+        calls: list[int] = []
+
+        def register(index: int) -> None:
+            Telemetry.on_request(lambda _info: calls.append(index))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(register, range(64)))
+
+        Telemetry.emit_request(_request_info())
+
+        assert sorted(calls) == list(range(64))
+
+    def test_emit_uses_snapshot(self):
+        """Test clearing callbacks during an emit does not affect that emit."""
+        calls: list[str] = []
+
+        def clear(_info: RequestInfo) -> None:
+            calls.append("clear")
+            Telemetry.clear_callbacks()
+
+        Telemetry.on_request(clear)
+        Telemetry.on_request(lambda _info: calls.append("after"))
+
+        Telemetry.emit_request(_request_info())
+        Telemetry.emit_request(_request_info())
+
+        assert calls == ["clear", "after"]
+
+
+class TestTelemetryEmit:
+    """Tests for dispatching events to callbacks."""
+
+    def test_single_callback(self):
+        """Test a single registered callback receives the event."""
+        received: list[RequestInfo] = []
+        Telemetry.on_request(received.append)
+        info = _request_info()
+
+        Telemetry.emit_request(info)
+
+        assert received == [info]
+
+    def test_single_failing_callback_is_ignored(self):
+        """Test an error in the only callback does not propagate."""
+        Telemetry.on_request(MagicMock(side_effect=RuntimeError("callback failed")))
+
+        Telemetry.emit_request(_request_info())
+
+
+class TestTelemetryHooks:
+    """Tests for per-client TelemetryHooks."""
+
+    def test_hooks_are_independent(self):
+        """Test callbacks registered on one instance do not leak to others."""
+        received: list[RequestInfo] = []
+        hooks = TelemetryHooks()
+        hooks.on_request(received.append)
+
+        TelemetryHooks().emit_request(_request_info())
+        Telemetry.emit_request(_request_info())
+        hooks.emit_request(_request_info())
+
+        assert len(received) == 1
+
+    def test_clear_callbacks(self):
+        """Test clear_callbacks removes every callback."""
+        hooks = TelemetryHooks()
+        hooks.on_request(MagicMock())
+        hooks.on_response(MagicMock())
+        hooks.on_error(MagicMock())
+        assert hooks.has_callbacks()
+
+        hooks.clear_callbacks()
+
+        assert not hooks.has_callbacks()
+
+
+class TestBackgroundDispatcher:
+    """Tests for emitting telemetry on a background thread."""
+
+    def test_emits_on_background_thread(self):
+        """Test queued events reach every emitter off the caller's thread."""
+        dispatcher = _BackgroundDispatcher()
+        received: list[tuple[str, str]] = []
+
+        def record(info: RequestInfo) -> None:
+            received.append((info.request_id, threading.current_thread().name))
+
+        dispatcher.submit(_request_info(), (record, record))
+        dispatcher.flush()
+
+        assert received == [("req-1", "scope-client-telemetry")] * 2
+
+    def test_callback_errors_do_not_stop_thread(self):
+        """Test the thread keeps emitting after an emitter raises."""
+        dispatcher = _BackgroundDispatcher()
+        received: list[RequestInfo] = []
+
+        dispatcher.submit(_request_info(), (MagicMock(side_effect=RuntimeError("boom")),))
+        dispatcher.submit(_request_info(), (received.append,))
+        dispatcher.flush()
+
+        assert len(received) == 1
+
+    def test_drops_events_when_full(self):
+        """Test events are dropped instead of blocking once the queue is full."""
+        dispatcher = _BackgroundDispatcher(maxsize=1)
+        release = threading.Event()
+
+        for _ in range(3):
+            dispatcher.submit(_request_info(), (lambda _info: release.wait(5),))
+        release.set()
+        dispatcher.flush()
+
+        assert dispatcher.dropped >= 1
+
+
+class TestGenerateRequestId:
+    """Tests for generate_request_id function."""
+
+    def test_ids_are_unique(self):
+        """Test consecutive IDs differ and share the process prefix."""
+        ids = [generate_request_id() for _ in range(100)]
+
+        assert len(set(ids)) == 100
+        assert {request_id.rsplit("-", 1)[0] for request_id in ids} == {ids[0].rsplit("-", 1)[0]}
+
+    def test_ids_do_not_read_os_randomness(self):
+        """Test IDs after the first are built without reading os.urandom."""
+        generate_request_id()
+        with patch("os.urandom", side_effect=AssertionError("urandom read")):
+            ids = [generate_request_id() for _ in range(10)]
+
+        assert len(set(ids)) == 10
+
+    def test_ids_are_unique_across_threads(self):
+        """Test threads drawing IDs concurrently never share one."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda _: generate_request_id(), range(1000)))
+
+        assert len(set(ids)) == 1000
+
+    def test_strict_uuid(self):
+        """Test strict_uuid returns a UUID4 string."""
+        assert uuid.UUID(generate_request_id(strict_uuid=True)).version == 4
+
+    def test_reset_starts_new_sequence(self):
+        """Test a reset (as after fork) changes the prefix."""
+        before = generate_request_id()
+        _reset_request_ids()
+        after = generate_request_id()
+
+        assert after.rsplit("-", 1)[0] != before.rsplit("-", 1)[0]
+        assert after.endswith("-1")
+
+
+class TestRedactHeaders:
+    """Tests for redact_headers function."""
+
+    def test_redacts_sensitive_headers(self):
+        """Test credentials are hidden, keeping the auth scheme."""
+        headers = {
+            "Authorization": "Bearer secret-token",
+            "X-API-Key": "key_abc123",
+            "Accept": "application/json",
+        }
+
+        assert redact_headers(headers) == {
+            "Authorization": "Bearer [REDACTED]",
+            "X-API-Key": "[REDACTED]",
+            "Accept": "application/json",
+        }
+        assert headers["Authorization"] == "Bearer secret-token"
+
+    def test_returns_headers_without_sensitive_values(self):
+        """Test headers with nothing to redact are returned without copying."""
+        headers = {"Accept": "application/json"}
+        assert redact_headers(headers) is headers
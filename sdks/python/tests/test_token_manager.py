@@ -103,6 +103,34 @@ class TestTokenManager:
             mock_fetch.assert_called_once()
             assert token == "new_token"
 
+    def test_invalidate_drops_rejected_token(self, auth_config: Configuration):
+        """Test invalidate forgets the token so the next call fetches a new one."""
+        token_manager = TokenManager(auth_config)
+
+        from scope_client.token_manager import TokenInfo
+
+        token_manager._token_info = TokenInfo(
+            access_token="rejected_token",
+            expires_at=time.time() + 3600,
+        )
+        token_manager.invalidate("rejected_token")
+
+        assert token_manager._needs_refresh() is True
+
+    def test_invalidate_keeps_newer_token(self, auth_config: Configuration):
+        """Test invalidate keeps a token that already replaced the rejected one."""
+        token_manager = TokenManager(auth_config)
+
+        from scope_client.token_manager import TokenInfo
+
+        token_manager._token_info = TokenInfo(
+            access_token="new_token",
+            expires_at=time.time() + 3600,
+        )
+        token_manager.invalidate("rejected_token")
+
+        assert token_manager._needs_refresh() is False
+
     def test_needs_refresh_when_no_token(self, auth_config: Configuration):
         """Test _needs_refresh returns True when no token is cached."""
         token_manager = TokenManager(auth_config)